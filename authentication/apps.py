@@ -7,5 +7,6 @@ class AuthenticationConfig(AppConfig):
 
     def ready(self):
         from authentication import models_circles  # noqa
+        from authentication import models_notifications  # noqa
         from authentication import models_token  # noqa
         from authentication import signals  # noqa
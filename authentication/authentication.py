@@ -0,0 +1,67 @@
+"""Authentication of Users loaded together with their Profile."""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.utils.translation import ugettext_lazy as _
+from rest_framework import exceptions
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+from rest_framework_jwt.settings import api_settings
+
+
+def profile_users():
+    """Users selected with their Profile in one query.
+
+    Permissions read `request.user.profile` on every check, loading it with
+    the User leaves no lazy load for the rest of the request.
+
+    @:return QuerySet
+    """
+    return get_user_model()._default_manager.select_related('profile')
+
+
+class ProfileModelBackend(ModelBackend):
+    """Model backend loading the Profile of Users authenticated."""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user_model = get_user_model()
+        if username is None:
+            username = kwargs.get(user_model.USERNAME_FIELD)
+        try:
+            user = profile_users().get(**{
+                user_model.USERNAME_FIELD: username,
+            })
+        except user_model.DoesNotExist:
+            user_model().set_password(password)
+        else:
+            if (
+                    user.check_password(password) and
+                    self.user_can_authenticate(user)
+            ):
+                return user
+
+    def get_user(self, user_id):
+        try:
+            user = profile_users().get(pk=user_id)
+        except get_user_model().DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+class ProfileJSONWebTokenAuthentication(JSONWebTokenAuthentication):
+    """JWT authentication loading the Profile of the User authenticated."""
+
+    def authenticate_credentials(self, payload):
+        username = api_settings.JWT_PAYLOAD_GET_USERNAME_HANDLER(payload)
+        if not username:
+            raise exceptions.AuthenticationFailed(_('Invalid payload.'))
+        try:
+            user = profile_users().get(**{
+                get_user_model().USERNAME_FIELD: username,
+            })
+        except get_user_model().DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid signature.'))
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(
+                _('User account is disabled.'),
+            )
+        return user
@@ -70,6 +70,17 @@ class InvitationTokenNotExistError(ValidationError):
         logger.error(self)
 
 
+class InvitationBulkSizeError(ValidationError):
+
+    def __init__(self, target, size, size_max):
+        super().__init__({
+            'code': 'invitation_bulk_size_error',
+            'message': f'{target} can invite at most {size_max} profiles at '
+                       f'once, {size} requested.',
+        })
+        logger.error(self)
+
+
 class CircleUniquePerProfileError(ValidationError):
 
     def __init__(self, title):
@@ -0,0 +1,86 @@
+"""Command comparing JWT authentication with and without cached secrets."""
+
+import logging
+from time import perf_counter
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django_common.auth_backends import User
+from rest_framework_jwt import utils as jwt_utils
+from rest_framework_jwt.authentication import JSONWebTokenAuthentication
+
+from authentication.secret_cache import secret_clear
+from authentication.tasks import jwt_decode_handler, jwt_payload_handler
+
+
+logger = logging.getLogger(__name__)
+
+
+class Rollback(Exception):
+    """Discard the seeded user."""
+
+
+class Command(BaseCommand):
+    """Benchmark verifying the JWT of an authenticated request.
+
+    A user is seeded and a JWT issued, the token is then verified and its
+    user loaded as for every authenticated request: first loading and
+    decrypting the secret of the user each time, then with the secret
+    cached by this process. Queries and time per request are reported,
+    everything is rolled back afterwards.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=1000,
+            help='Authenticated requests verified.',
+        )
+
+    def _measure(self, label, decode, token, requests):
+        authentication = JSONWebTokenAuthentication()
+        decode(token)
+        with CaptureQueriesContext(connection) as context:
+            started = perf_counter()
+            for _ in range(requests):
+                authentication.authenticate_credentials(decode(token))
+            elapsed = (perf_counter() - started) * 1000
+        self.stdout.write(
+            f'{label}: {elapsed / requests:.3f}ms, '
+            f'{len(context) / requests:.1f} queries per request',
+        )
+
+    def handle(self, *args, **options):
+        """Seed, measure uncached then cached verification, roll back."""
+        requests = options['requests']
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    'benchmark-jwt',
+                    'benchmark-jwt@example.com',
+                )
+                token = jwt_utils.jwt_encode_handler(
+                    jwt_payload_handler(user),
+                )
+                with override_settings(JWT_SECRET_CACHE_TIMEOUT=0):
+                    self._measure(
+                        'Before: secret loaded and decrypted',
+                        jwt_utils.jwt_decode_handler,
+                        token,
+                        requests,
+                    )
+                secret_clear()
+                self._measure(
+                    'After: secret cached per process',
+                    jwt_decode_handler,
+                    token,
+                    requests,
+                )
+                raise Rollback()
+        except Rollback:
+            secret_clear()
+            logger.info('Seeded benchmark data rolled back.')
@@ -0,0 +1,30 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:31
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+AUTHOR_NAME_FIELDS = ('name_display', 'name_first', 'name_family', )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_auto_20180726_1009'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunSQL(
+            sql='CREATE INDEX authentication_author_name_display_upper '
+                'ON authentication_author (UPPER(name_display::text));',
+            reverse_sql='DROP INDEX authentication_author_name_display_upper;',
+        ),
+    ] + [
+        migrations.RunSQL(
+            sql=f'CREATE INDEX authentication_author_{field}_trgm '
+                f'ON authentication_author USING gin ({field} gin_trgm_ops);',
+            reverse_sql=f'DROP INDEX authentication_author_{field}_trgm;',
+        )
+        for field in AUTHOR_NAME_FIELDS
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_author_name_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='author',
+            index=models.Index(fields=['created_at', 'id'], name='authenticat_created_d01743_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='circle',
+            index=models.Index(fields=['created_at', 'id'], name='authenticat_created_e8f4a2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmethod',
+            index=models.Index(fields=['created_at', 'id'], name='authenticat_created_6ea238_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['created_at', 'id'], name='authenticat_created_c0ee05_idx'),
+        ),
+    ]
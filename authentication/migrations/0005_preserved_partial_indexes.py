@@ -0,0 +1,134 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:25
+
+import bookworm.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0004_created_at_keyset_index'),
+    ]
+
+    operations = [
+        bookworm.operations.AddPartialIndex(
+            model_name='contactmethod',
+            fields=['email'],
+            name='authentication_contactmethod_email_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='contactmethod',
+            fields=['meta_info'],
+            name='authentication_contactmethod_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='profile',
+            fields=['cover_image'],
+            name='authentication_profile_cover_image_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='profile',
+            fields=['name_first'],
+            name='authentication_profile_name_first_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='profile',
+            fields=['name_family'],
+            name='authentication_profile_name_family_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='profile',
+            fields=['name_display'],
+            name='authentication_profile_name_display_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='profile',
+            fields=['meta_info'],
+            name='authentication_profile_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='profile',
+            fields=['auth_token'],
+            name='authentication_profile_auth_token_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='author',
+            fields=['cover_image'],
+            name='authentication_author_cover_image_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='author',
+            fields=['name_first'],
+            name='authentication_author_name_first_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='author',
+            fields=['name_family'],
+            name='authentication_author_name_family_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='author',
+            fields=['name_display'],
+            name='authentication_author_name_display_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='author',
+            fields=['profile'],
+            name='authentication_author_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='author',
+            fields=['meta_info'],
+            name='authentication_author_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='profilesetting',
+            fields=['profile'],
+            name='authentication_profilesetting_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='invitation',
+            fields=['profile'],
+            name='authentication_invitation_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='invitation',
+            fields=['profile_to'],
+            name='authentication_invitation_profile_to_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='invitation',
+            fields=['token'],
+            name='authentication_invitation_token_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='invitation',
+            fields=['meta_info'],
+            name='authentication_invitation_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='circle',
+            fields=['cover_image'],
+            name='authentication_circle_cover_image_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='circle',
+            fields=['title'],
+            name='authentication_circle_title_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='circle',
+            fields=['meta_info'],
+            name='authentication_circle_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='circle',
+            fields=['reading_list'],
+            name='authentication_circle_reading_list_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='circlesetting',
+            fields=['circle'],
+            name='authentication_circlesetting_circle_id_live',
+        ),
+    ]
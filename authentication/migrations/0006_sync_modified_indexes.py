@@ -0,0 +1,21 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0005_preserved_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='author',
+            index=models.Index(fields=['modified_at', 'id'], name='authenticat_modifie_c47bda_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['modified_at', 'id'], name='authenticat_modifie_be110a_idx'),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def circle_memberships_backfill(apps, schema_editor):
+    """Build memberships from the live Invitations of every Circle."""
+    Circle = apps.get_model('authentication', 'Circle')
+    CircleMembership = apps.get_model('authentication', 'CircleMembership')
+    effective = Circle.invites.through.objects.filter(
+        invitation__deleted_at__isnull=True,
+    ).values(
+        'circle_id',
+        'invitation__profile_to_id',
+    ).annotate(
+        status=models.Max('invitation__status'),
+    ).values_list('circle_id', 'invitation__profile_to_id', 'status')
+    CircleMembership.objects.bulk_create(
+        [
+            CircleMembership(
+                circle_id=circle_id,
+                profile_id=profile_id,
+                status=status,
+            )
+            for circle_id, profile_id, status in effective.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0006_sync_modified_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CircleMembership',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('status', models.IntegerField(choices=[(0, 'Banned'), (1, 'Rejected'), (2, 'Withdrawn'), (3, 'Invited'), (4, 'Accepted'), (5, 'Elevated')])),
+                ('circle', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='authentication.Circle', verbose_name='Circle')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='circle_memberships', to='authentication.Profile', verbose_name='Profile invited')),
+            ],
+            options={
+                'verbose_name': 'Circle Membership',
+                'verbose_name_plural': 'Circle Memberships',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='circlemembership',
+            index=models.Index(fields=['profile', 'status', 'circle'], name='authenticat_profile_674322_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='circlemembership',
+            index=models.Index(fields=['status', 'circle'], name='authenticat_status_1043ad_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='circlemembership',
+            unique_together={('circle', 'profile')},
+        ),
+        migrations.RunPython(
+            circle_memberships_backfill,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.0.2 on 2026-10-18 21:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0008_notifications'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.IntegerField(blank=True, choices=[(0, 'Pending'), (1, 'Sent'), (2, 'Failed'), (3, 'Sending')], default=0),
+        ),
+    ]
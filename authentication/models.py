@@ -1,11 +1,17 @@
 """Profile models."""
 
+from collections import OrderedDict
+from threading import Lock
+
 from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db import models
+from django.db.models.functions import Greatest
 from django.utils.translation import ugettext_lazy as _
 from django_common.auth_backends import User
 
 from model_utils import Choices
+from model_utils.managers import QueryManager
 from hashid_field import HashidAutoField
 
 from authentication.models_token import Token
@@ -78,6 +84,9 @@ class ContactMethod(PreserveModelMixin):
     class Meta:
         verbose_name = 'Contact Method'
         verbose_name_plural = 'Contact Methods'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     def __str__(self):
         """Valid email output of profile."""
@@ -212,12 +221,100 @@ class Profile(Imagable, PersonMixin, PreserveModelMixin):
     class Meta:
         verbose_name = 'Profile'
         verbose_name_plural = 'Profiles'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['modified_at', 'id']),
+        ]
 
     def __str__(self):
         """Valid email output of profile."""
         return f'Profile({self.id} - {self.display_name} "{self.email}")'
 
 
+class AuthorManager(QueryManager):
+    """Manager for Authors resolving names to existing Authors.
+
+    Resolved names are remembered in process, least recently used names are
+    forgotten beyond `settings.AUTHOR_RESOLVE_CACHE_SIZE`.
+    """
+
+    SIMILARITY_FIELDS = ('name_display', 'name_first', 'name_family', )
+
+    _resolved = OrderedDict()
+    _resolved_lock = Lock()
+
+    def _resolve_remember(self, key, author_id):
+        with self._resolved_lock:
+            self._resolved[key] = author_id
+            self._resolved.move_to_end(key)
+            while len(self._resolved) > settings.AUTHOR_RESOLVE_CACHE_SIZE:
+                self._resolved.popitem(last=False)
+
+    def _resolve_recall(self, key):
+        with self._resolved_lock:
+            author_id = self._resolved.get(key)
+            if author_id is not None:
+                self._resolved.move_to_end(key)
+        return author_id
+
+    def resolve_forget(self, author_id):
+        """Forget names resolved to an Author.
+
+        @:param author_id: Author primary key.
+        """
+        with self._resolved_lock:
+            for key, resolved_id in list(self._resolved.items()):
+                if resolved_id == author_id:
+                    del self._resolved[key]
+
+    def resolve_similar(self, name):
+        """Most similar Author by trigram similarity of their names.
+
+        The trigram operator is filtered on first to use the GIN indexes,
+        matches are then ranked against `settings.AUTHOR_RESOLVE_SIMILARITY`.
+
+        @:param name: str name of the Author.
+
+        @:return Author or None
+        """
+        similar = models.Q()
+        for field in self.SIMILARITY_FIELDS:
+            similar |= models.Q(**{f'{field}__trigram_similar': name})
+        return self.filter(similar).annotate(
+            similarity=Greatest(*[
+                TrigramSimilarity(field, name)
+                for field in self.SIMILARITY_FIELDS
+            ]),
+        ).filter(
+            similarity__gte=settings.AUTHOR_RESOLVE_SIMILARITY,
+        ).order_by('-similarity', 'pk').first()
+
+    def resolve(self, name, create=False):
+        """Resolve a name to an existing Author, by exact or fuzzy match.
+
+        @:param name: str name of the Author.
+        @:param create: bool create an Author when no match is found.
+
+        @:return Author or None
+        """
+        name = ' '.join((name or '').split())
+        if not name:
+            return None
+        key = name.lower()
+        author_id = self._resolve_recall(key)
+        author = self.filter(pk=author_id).first() if author_id else None
+        if not author:
+            author = (
+                self.filter(name_display__iexact=name).first() or
+                self.resolve_similar(name)
+            )
+        if not author and create:
+            author = self.create(name_display=name)
+        if author:
+            self._resolve_remember(key, author.pk)
+        return author
+
+
 class Author(Emotable, Imagable, PersonMixin, PreserveModelMixin):
     """Author model."""
 
@@ -247,9 +344,15 @@ class Author(Emotable, Imagable, PersonMixin, PreserveModelMixin):
         null=True,
     )
 
+    objects = AuthorManager(deleted_at__isnull=True)
+
     class Meta:
         verbose_name = 'Author'
         verbose_name_plural = 'Authors'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['modified_at', 'id']),
+        ]
 
     def __str__(self):
         """Valid email output of profile."""
@@ -3,14 +3,19 @@
 from datetime import timedelta
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Max
 from django.utils.translation import ugettext_lazy as _
 from django.utils import timezone
 
 from model_utils import Choices
 from hashid_field import HashidAutoField
 
-from bookworm.mixins import (ProfileReferredMixin, PreserveModelMixin)
+from bookworm.mixins import (
+    ModifiedModelMixin,
+    ProfileReferredMixin,
+    PreserveModelMixin,
+)
 from books.models import ReadingList
 from file_store.models import Imagable
 from meta_info.models import MetaInfo, MetaInfoMixin
@@ -135,6 +140,16 @@ class Invitable(models.Model):
         """
         return self.invites.filter(profile_to__id=profile_to.id).first()
 
+    def invite_status(self, profile):
+        """Status of the Invitation of a Profile to this object.
+
+        @param profile: Profile invited.
+
+        @return int or None when not invited.
+        """
+        invite = self.has_invited(profile)
+        return invite.status if invite else None
+
     def _invite_validate_status_change(
             self,
             status_to,
@@ -223,6 +238,69 @@ class Invitable(models.Model):
         self.invites.add(invite)
         return invite
 
+    def invite_bulk(self, profile, profiles_to):
+        """Invite many Profiles to this object in a few set based queries.
+
+        The inviting Profile is validated once: owners, admins and Profiles
+        with an elevated Invitation may invite. Profiles already invited are
+        skipped, Tokens and Invitations of the others are inserted in bulk.
+
+        @param profile: Profile inviting profiles_to.
+        @param profiles_to: list of Profiles being invited to this object.
+
+        @return tuple of list of Invitations created and list of Profiles
+            already invited.
+
+        @raises InvitationValidationError
+        """
+        status = self.invite_status(profile)
+        if not (
+                (hasattr(self, 'profile') and self.profile == profile) or
+                profile.type >= Profile.TYPES.admin or
+                (status or 0) >= Invitation.STATUSES.elevated
+        ):
+            raise InvitationValidationError(
+                self,
+                Invitation.STATUSES.invited,
+                profile,
+            )
+        invited_ids = {
+            int(profile_id)
+            for profile_id in self.invites.filter(
+                profile_to__in=profiles_to,
+            ).values_list('profile_to_id', flat=True)
+        }
+        inviting = [
+            profile_to for profile_to in profiles_to
+            if int(profile_to.pk) not in invited_ids
+        ]
+        skipped = [
+            profile_to for profile_to in profiles_to
+            if int(profile_to.pk) in invited_ids
+        ]
+        if not inviting:
+            return [], skipped
+        with transaction.atomic():
+            tokens = Token.objects.create_tokens(
+                [f'{self.id}#{profile_to.email}' for profile_to in inviting],
+                expiry=timezone.now() + timedelta(
+                    days=settings.INVITE_TIMEOUT,
+                ),
+            )
+            invitations = Invitation.objects.bulk_create([
+                Invitation(
+                    profile=profile,
+                    profile_to=profile_to,
+                    status=Invitation.STATUSES.invited,
+                    token=token,
+                )
+                for profile_to, token in zip(inviting, tokens)
+            ])
+            for invitation in invitations:
+                invitation.id = Invitation._meta.pk.to_python(invitation.id)
+            self.invites.add(*invitations)
+        return invitations, skipped
+
     def invite_change(self, profile, profile_to, status):
         """Change an Invitation between two profiles.
 
@@ -333,11 +411,113 @@ class Circle(
     class Meta:
         verbose_name = 'Circle'
         verbose_name_plural = 'Circles'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     def __str__(self):
         """String representation of this model."""
         return f'Circle({self.PREFIX}{self.id}-{self.title})'
 
+    def invite_status(self, profile):
+        """Status of the membership of a Profile in this Circle.
+
+        @param profile: Profile invited.
+
+        @return int or None when not invited.
+        """
+        return CircleMembership.objects.filter(
+            circle_id=self.pk,
+            profile_id=profile.pk,
+        ).values_list('status', flat=True).first()
+
+
+class CircleMembershipManager(models.Manager):
+    """Manager for CircleMemberships."""
+
+    def circle_ids(self, statuses, profile=None):
+        """Circles with memberships of statuses.
+
+        @:param statuses: list of int Invitation statuses.
+        @:param profile: Profile member, or None for memberships of anyone.
+
+        @:return QuerySet of Circle ids.
+        """
+        memberships = self.filter(status__in=statuses)
+        if profile is not None:
+            memberships = memberships.filter(profile_id=profile.pk)
+        return memberships.values('circle_id')
+
+    def sync(self, circle_id):
+        """Rebuild the memberships of a Circle from its live Invitations.
+
+        The Circle is locked while rebuilding so concurrent changes of its
+        Invitations are applied one after another.
+
+        @:param circle_id: Hashid or int id of the Circle.
+        """
+        circle_id = Circle._meta.pk.to_python(circle_id)
+        with transaction.atomic():
+            circle = Circle.all_objects.select_for_update().filter(
+                pk=circle_id,
+            ).first()
+            if circle is None:
+                return
+            statuses = circle.invites.values('profile_to_id').annotate(
+                effective=Max('status'),
+            ).values_list('profile_to_id', 'effective')
+            self.filter(circle_id=circle.pk).delete()
+            self.bulk_create([
+                CircleMembership(
+                    circle_id=circle.pk,
+                    profile_id=profile_id,
+                    status=status,
+                )
+                for profile_id, status in statuses
+            ])
+
+
+class CircleMembership(ModifiedModelMixin):
+    """Effective Invitation status of each Profile invited to a Circle.
+
+    Denormalized from the Invitations of a Circle, rebuilt when they
+    change, so membership checks and listings are a single indexed lookup.
+    """
+
+    circle = models.ForeignKey(
+        Circle,
+        related_name='memberships',
+        verbose_name=_('Circle'),
+        on_delete=models.CASCADE,
+    )
+    profile = models.ForeignKey(
+        Profile,
+        related_name='circle_memberships',
+        verbose_name=_('Profile invited'),
+        on_delete=models.CASCADE,
+    )
+    status = models.IntegerField(
+        choices=Invitation.STATUSES,
+    )
+
+    objects = CircleMembershipManager()
+
+    class Meta:
+        verbose_name = 'Circle Membership'
+        verbose_name_plural = 'Circle Memberships'
+        unique_together = ('circle', 'profile', )
+        indexes = [
+            models.Index(fields=['profile', 'status', 'circle']),
+            models.Index(fields=['status', 'circle']),
+        ]
+
+    def __str__(self):
+        """String representation of this model."""
+        return (
+            f'CircleMembership({Circle.PREFIX}{self.circle_id}: '
+            f'{self.profile_id}, {self.status})'
+        )
+
 
 class CircleSetting(PreserveModelMixin, MetaInfoMixin):
     """Circle Settings model."""
@@ -0,0 +1,99 @@
+"""Notification models."""
+
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from model_utils import Choices
+
+from bookworm.mixins import ModifiedModelMixin
+from authentication.models import Profile
+
+
+class NotificationManager(models.Manager):
+    """Manager of the Notification outbox."""
+
+    def pending(self):
+        """Notifications waiting to be sent, oldest first.
+
+        @:return QuerySet
+        """
+        return self.filter(
+            status=Notification.STATUSES.pending,
+        ).order_by('id')
+
+    def enqueue(self, action, profiles_messages):
+        """Write Notifications of an action to the outbox in one insert.
+
+        Written within the transaction of the action, Notifications are sent
+        by a worker once it commits and never for an action rolled back.
+
+        @:param action: str representation of the action.
+        @:param profiles_messages: list of tuple of Profile and str message.
+
+        @:return list of Notification
+        """
+        return self.bulk_create([
+            Notification(profile=profile, action=action, message=message)
+            for profile, message in profiles_messages
+        ])
+
+
+class Notification(ModifiedModelMixin):
+    """Message of an action to deliver to a Profile.
+
+    Notifications are drained in batches by `notifications_send`, messages
+    of each recipient are grouped into one message per contact channel.
+    Claimed by a worker a Notification is `sending` until its result is
+    recorded.
+    """
+
+    STATUSES = Choices(
+        (0, 'pending', _('Pending')),
+        (1, 'sent', _('Sent')),
+        (2, 'failed', _('Failed')),
+        (3, 'sending', _('Sending')),
+    )
+
+    profile = models.ForeignKey(
+        Profile,
+        related_name='notifications',
+        verbose_name=_('Profile notified'),
+        on_delete=models.CASCADE,
+    )
+    action = models.CharField(
+        max_length=50,
+    )
+    message = models.TextField()
+    status = models.IntegerField(
+        choices=STATUSES,
+        default=STATUSES.pending,
+        blank=True,
+    )
+    attempts = models.IntegerField(
+        default=0,
+        blank=True,
+    )
+    error = models.TextField(
+        blank=True,
+        default='',
+    )
+    sent_at = models.DateTimeField(
+        blank=True,
+        null=True,
+    )
+
+    objects = NotificationManager()
+
+    class Meta:
+        verbose_name = 'Notification'
+        verbose_name_plural = 'Notifications'
+        indexes = [
+            models.Index(fields=['status', 'id']),
+        ]
+
+    def __str__(self):
+        """String representation of this model."""
+        return (
+            f'Notification({self.id}: {self.profile_id}, {self.action}, '
+            f'{self.status})'
+        )
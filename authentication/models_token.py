@@ -106,6 +106,38 @@ class TokenManager(models.Manager):
             single_use=single_use,
         )
 
+    def create_tokens(self, token_keys, expiry=None, single_use=True):
+        """Create a token for each of many keys in one insert.
+
+        Values are derived from each key as by `create_token`, unvalidated
+        tokens of the same keys are retired in one update.
+
+        @:param token_keys: list of str keys to identify the Tokens by.
+        @:param expiry: datetime the tokens will expire.
+        @:param single_use: bool determines a one off use.
+
+        @:return list of Token in the order of their keys.
+        """
+        expiry_expected = expiry or timezone.now() + timedelta(days=1)
+        self.filter(
+            key__in=token_keys,
+            validated=False,
+        ).update(deleted_at=timezone.now())
+        tokens = self.bulk_create([
+            Token(
+                key=token_key,
+                value=self.get_cipher().encrypt(
+                    self.generate_sha256(token_key),
+                ),
+                expiry=expiry_expected,
+                single_use=single_use,
+            )
+            for token_key in token_keys
+        ])
+        for token in tokens:
+            token.id = Token._meta.pk.to_python(token.id)
+        return tokens
+
     def validation(self, token_key, token_value):
         """Validate a key value pair.
 
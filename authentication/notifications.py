@@ -0,0 +1,244 @@
+"""Delivery of the Notification outbox by email and SMS."""
+
+import logging
+from collections import OrderedDict, defaultdict
+from datetime import timedelta
+
+import requests
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from authentication.models import ContactMethod, Profile
+from authentication.models_notifications import Notification
+from bookworm.claim import queryset_claim
+
+
+logger = logging.getLogger(__name__)
+
+
+def notification_contacts(profile_ids):
+    """Email addresses and mobile numbers of each Profile.
+
+    Contact methods of every Profile are loaded in one query, Profiles
+    without an email contact method are emailed at their own address.
+
+    @:param profile_ids: list of str Profile ids.
+
+    @:return dict of str Profile id to dict of str channel to list of str.
+    """
+    contacts = defaultdict(lambda: defaultdict(list))
+    contact_methods = Profile.contacts.through.objects.filter(
+        profile_id__in=profile_ids,
+        contactmethod__type__in=[
+            ContactMethod.TYPES.email,
+            ContactMethod.TYPES.mobile,
+        ],
+        contactmethod__deleted_at__isnull=True,
+    ).values_list(
+        'profile_id',
+        'contactmethod__type',
+        'contactmethod__detail',
+        'contactmethod__email',
+    )
+    for profile_id, type, detail, email in contact_methods:
+        if type == ContactMethod.TYPES.email:
+            contacts[str(profile_id)]['email'].append(email or detail)
+        else:
+            contacts[str(profile_id)]['sms'].append(detail)
+    profile_emails = Profile.objects.filter(
+        pk__in=profile_ids,
+    ).values_list('id', 'email')
+    for profile_id, email in profile_emails:
+        if email and not contacts[str(profile_id)]['email']:
+            contacts[str(profile_id)]['email'].append(email)
+    return contacts
+
+
+def notification_send_email(connection, address, messages):
+    """Email the messages of a recipient as one message.
+
+    @:param connection: email backend opened once per batch.
+    @:param address: str email address.
+    @:param messages: list of str.
+
+    @:raises OSError when the message is refused.
+    """
+    EmailMessage(
+        subject=settings.NOTIFICATION_EMAIL_SUBJECT,
+        body='\n\n'.join(messages),
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[address],
+        connection=connection,
+    ).send()
+
+
+def notification_send_sms(session, number, messages):
+    """Text the messages of a recipient as one message.
+
+    @:param session: requests.Session reused for the batch.
+    @:param number: str mobile number.
+    @:param messages: list of str.
+
+    @:raises OSError when the SMS service is unreachable or refuses.
+    @:raises ValueError when the SMS service response is not understood.
+    """
+    response = session.post(
+        settings.SMS_URL,
+        data={
+            'phone': number,
+            'message': '\n'.join(messages),
+            'key': settings.SMS_TOKEN,
+        },
+        timeout=settings.NOTIFICATION_SMS_TIMEOUT,
+    )
+    response.raise_for_status()
+    sent = response.json()
+    if not sent.get('success'):
+        raise requests.RequestException(sent.get('error') or sent)
+
+
+def notifications_claim(batch_size):
+    """Claim a batch of Notifications due to be sent.
+
+    Pending Notifications, those failing before once
+    `settings.NOTIFICATION_RETRY_SECONDS` passed, and Notifications of a worker
+    lost mid batch once `settings.NOTIFICATION_CLAIM_SECONDS` passed are marked
+    `sending` with their attempt counted. Rows are claimed by one UPDATE,
+    workers claiming concurrently leave out the rows of each other.
+
+    @:param batch_size: int maximum Notifications claimed.
+
+    @:return list of Notification
+    """
+    now = timezone.now()
+    retry_at = now - timedelta(seconds=settings.NOTIFICATION_RETRY_SECONDS)
+    lost_at = now - timedelta(seconds=settings.NOTIFICATION_CLAIM_SECONDS)
+    claimed = queryset_claim(
+        Notification.objects.filter(
+            Q(status=Notification.STATUSES.pending, attempts=0) |
+            Q(
+                status=Notification.STATUSES.pending,
+                modified_at__lte=retry_at,
+            ) |
+            Q(
+                status=Notification.STATUSES.sending,
+                modified_at__lte=lost_at,
+            ),
+        ).order_by('id'),
+        batch_size,
+        status=Notification.STATUSES.sending,
+        attempts=F('attempts') + 1,
+        modified_at=now,
+    )
+    if not claimed:
+        return []
+    return list(Notification.objects.filter(pk__in=claimed).order_by('id'))
+
+
+def notifications_mark(notifications, error=''):
+    """Record the result of sending claimed Notifications in one UPDATE.
+
+    Notifications failing are retried after
+    `settings.NOTIFICATION_RETRY_SECONDS`, up to
+    `settings.NOTIFICATION_MAX_ATTEMPTS` attempts.
+
+    @:param notifications: list of Notification.
+    @:param error: str reason sending failed, empty when sent.
+    """
+    now = timezone.now()
+    queryset = Notification.objects.filter(
+        pk__in=[notification.pk for notification in notifications],
+        status=Notification.STATUSES.sending,
+    )
+    if not error:
+        queryset.update(
+            status=Notification.STATUSES.sent,
+            error='',
+            sent_at=now,
+            modified_at=now,
+        )
+        return
+    queryset.update(
+        status=Case(
+            When(
+                attempts__gte=settings.NOTIFICATION_MAX_ATTEMPTS,
+                then=Value(Notification.STATUSES.failed),
+            ),
+            default=Value(Notification.STATUSES.pending),
+            output_field=IntegerField(),
+        ),
+        error=error,
+        modified_at=now,
+    )
+
+
+def notifications_send(batch_size=None):
+    """Send a batch of pending Notifications.
+
+    The batch is claimed by one UPDATE and sent outside of any transaction,
+    the result of each recipient is recorded as soon as it is known. A worker
+    lost mid batch leaves only the Notifications it had not recorded to be
+    claimed again. Messages of each recipient are sent as one email and one
+    SMS per contact method, over one email connection and one HTTP session
+    for the whole batch. A recipient is notified once any of its contact
+    methods accepts the message.
+
+    @:param batch_size: int maximum Notifications sent, defaults to
+        `settings.NOTIFICATION_BATCH_SIZE`.
+
+    @:return int Notifications drained, sent or not.
+    """
+    batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+    notifications = notifications_claim(batch_size)
+    if not notifications:
+        return 0
+    recipients = OrderedDict()
+    for notification in notifications:
+        recipients.setdefault(
+            str(notification.profile_id),
+            [],
+        ).append(notification)
+    contacts = notification_contacts(list(recipients))
+    connection = get_connection()
+    session = requests.Session()
+    senders = {
+        'email': lambda address, messages: notification_send_email(
+            connection, address, messages),
+        'sms': lambda number, messages: notification_send_sms(
+            session, number, messages),
+    }
+    try:
+        connection.open()
+    except OSError as e:
+        logger.error(f'Notification email connection failed: {e}')
+    try:
+        for profile_id, recipient_notifications in recipients.items():
+            messages = [
+                notification.message
+                for notification in recipient_notifications
+            ]
+            sent = False
+            errors = []
+            for channel, addresses in contacts[profile_id].items():
+                for address in addresses:
+                    try:
+                        senders[channel](address, messages)
+                        sent = True
+                    except (OSError, ValueError) as e:
+                        errors.append(f'{channel} {address}: {e}')
+            if not sent:
+                errors = errors or ['No contact method.']
+                logger.error(
+                    f'Notifications of Profile({profile_id}) failed: '
+                    f'{errors}'
+                )
+            notifications_mark(
+                recipient_notifications,
+                '' if sent else '\n'.join(errors),
+            )
+    finally:
+        connection.close()
+        session.close()
+    return len(notifications)
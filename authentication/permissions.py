@@ -1,6 +1,7 @@
 """Policies for models and serializers."""
 
 import logging
+from functools import wraps
 
 from rest_framework import permissions
 
@@ -10,6 +11,43 @@ from authentication.models import Profile
 logger = logging.getLogger(__name__)
 
 
+def permission_cache(request):
+    """Object permissions evaluated for a request.
+
+    Stored on the HttpRequest, shared by every DRF Request wrapping it.
+
+    @:param request: Request or HttpRequest object.
+
+    @:return dict
+    """
+    request = getattr(request, '_request', request)
+    if not hasattr(request, 'permission_cache'):
+        request.permission_cache = {}
+    return request.permission_cache
+
+
+def object_permission_cached(has_object_permission):
+    """Evaluate an object permission once per request, action and object.
+
+    Checks repeated for an object, ie. by each `get_object` of a request,
+    return the first result without querying again.
+    """
+    @wraps(has_object_permission)
+    def cached(self, request, view, obj):
+        key = (
+            self.__class__,
+            request.method,
+            getattr(view, 'action', None),
+            obj._meta.label_lower,
+            obj.pk,
+        )
+        cache = permission_cache(request)
+        if key not in cache:
+            cache[key] = has_object_permission(self, request, view, obj)
+        return cache[key]
+    return cached
+
+
 class AuthenticatedOrAdminPermission(permissions.IsAuthenticated):
 
     def has_permission(self, request, view):
@@ -35,6 +73,7 @@ class AuthenticatedAndReadOnlyPermission(permissions.IsAuthenticated):
                 return True
         return request.method in permissions.SAFE_METHODS and authenticated
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Permissions to manage access to an invited to Circle model."""
         authenticated = super().has_object_permission(request, view, obj)
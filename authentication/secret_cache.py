@@ -0,0 +1,112 @@
+"""Per process cache of decrypted authentication token secrets."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+_secrets = OrderedDict()
+_lock = threading.Lock()
+
+
+def secret_version_key(profile_id):
+    """Cache key of the version of the secrets of a Profile.
+
+    @:param profile_id: str Profile id.
+
+    @:return str
+    """
+    return f'authentication:secret:{profile_id}'
+
+
+def secret_version(profile_id):
+    """Current version of the secrets of a Profile.
+
+    Versions are kept in `settings.JWT_SECRET_CACHE`, shared by workers when
+    that cache is. A version missing, never bumped or evicted, starts from
+    the current time so secrets cached under an evicted version are loaded
+    again.
+
+    @:param profile_id: str Profile id.
+
+    @:return int
+    """
+    cache = caches[settings.JWT_SECRET_CACHE]
+    key = secret_version_key(profile_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _secret_version_bump(profile_id):
+    cache = caches[settings.JWT_SECRET_CACHE]
+    key = secret_version_key(profile_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def secret_cached(profile_id, token_id, load):
+    """Secret of the authentication token of a Profile.
+
+    Secrets are kept by this process for `settings.JWT_SECRET_CACHE_TIMEOUT`
+    seconds while the version of the secrets of their Profile is unchanged,
+    the least recently used are dropped past `settings.JWT_SECRET_CACHE_SIZE`.
+    A rotated token has a new id, secrets of the previous token are never
+    matched once its Profile is loaded.
+
+    @:param profile_id: str Profile id.
+    @:param token_id: str Token id.
+    @:param load: callable returning the secret when not cached, with the
+        identity of the User it authenticates.
+
+    @:return secret loaded, with the identity loaded along.
+    """
+    timeout = settings.JWT_SECRET_CACHE_TIMEOUT
+    if timeout <= 0:
+        return load()
+    key = (str(profile_id), str(token_id))
+    version = secret_version(key[0])
+    now = time.monotonic()
+    with _lock:
+        cached = _secrets.get(key)
+        if cached and cached[1] == version and cached[2] > now:
+            _secrets.move_to_end(key)
+            return cached[0]
+    secret = load()
+    with _lock:
+        _secrets[key] = (secret, version, now + timeout)
+        _secrets.move_to_end(key)
+        while len(_secrets) > settings.JWT_SECRET_CACHE_SIZE:
+            _secrets.popitem(last=False)
+    return secret
+
+
+def secret_invalidate(profile_id):
+    """Drop every secret cached for a Profile, by every process.
+
+    The version of the secrets of the Profile is bumped now and once
+    committed, discarding secrets loaded by concurrent requests reading
+    before the rotation was committed.
+
+    @:param profile_id: str Profile id.
+    """
+    profile_id = str(profile_id)
+    with _lock:
+        for key in [key for key in _secrets if key[0] == profile_id]:
+            del _secrets[key]
+    _secret_version_bump(profile_id)
+    transaction.on_commit(lambda: _secret_version_bump(profile_id))
+
+
+def secret_clear():
+    """Drop every secret cached by this process."""
+    with _lock:
+        _secrets.clear()
@@ -4,6 +4,7 @@ import logging
 
 from django.conf import settings
 from django.db.models.signals import (
+    m2m_changed,
     pre_save,
     post_save,
     post_delete,
@@ -11,6 +12,7 @@ from django.db.models.signals import (
 from django.dispatch import receiver
 from django_common.auth_backends import User
 
+from bookworm.cache import cache_version_changed
 from meta_info.models import Tag
 from authentication.models import (
     Profile,
@@ -19,6 +21,7 @@ from authentication.models import (
 )
 from authentication.models_circles import (
     Circle,
+    CircleMembership,
     Invitation,
 )
 from meta_info.models import MetaInfo
@@ -52,6 +55,15 @@ def post_save_author_create(sender, instance, created, **kwargs):
     instance.meta_info.tags.set(list(instance.meta_info.tags.all()) + [tag])
 
 
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def post_change_author_resolved(sender, instance, *args, **kwargs):
+    """Forget names resolved to a changed Author."""
+    if kwargs.get('created'):
+        return
+    Author.objects.resolve_forget(instance.pk)
+
+
 @receiver(pre_save, sender=Author)
 def pre_save_emotable_aggregate(sender, instance, *args, **kwargs):
     """Pre save objects for emotable aggregation."""
@@ -152,3 +164,44 @@ def create_auth_token(sender, instance=None, created=False, **kwargs):
     """Generate authentication API token for a created user instance."""
     if created:
         Token.objects.create(user=instance)
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_save, sender=ContactMethod)
+@receiver(post_delete, sender=Author)
+@receiver(post_delete, sender=ContactMethod)
+def post_change_cache_version(sender, instance, *args, **kwargs):
+    """Invalidate cached representations of a changed model."""
+    cache_version_changed(sender)
+
+
+@receiver(m2m_changed, sender=Author.contacts.through)
+def m2m_changed_author_cache_version(sender, instance, action, *args,
+                                     **kwargs):
+    """Invalidate cached representations of Authors with changed contacts."""
+    if action.startswith('post_'):
+        cache_version_changed(Author)
+
+
+@receiver(post_save, sender=Invitation)
+@receiver(post_delete, sender=Invitation)
+def post_change_invitation_memberships(sender, instance, *args, **kwargs):
+    """Rebuild memberships of the Circles an Invitation belongs to."""
+    circle_ids = Circle.invites.through.objects.filter(
+        invitation_id=instance.pk,
+    ).values_list('circle_id', flat=True)
+    for circle_id in list(circle_ids):
+        CircleMembership.objects.sync(circle_id)
+
+
+@receiver(m2m_changed, sender=Circle.invites.through)
+def m2m_changed_circle_memberships(sender, instance, action, reverse,
+                                   pk_set=None, *args, **kwargs):
+    """Rebuild memberships of Circles with Invitations added or removed."""
+    if action not in ('post_add', 'post_remove', 'post_clear', ):
+        return
+    if not reverse:
+        CircleMembership.objects.sync(instance.pk)
+        return
+    for circle_id in pk_set or ():
+        CircleMembership.objects.sync(circle_id)
@@ -1,20 +1,73 @@
 """Tasks required from authentication service."""
 
+import jwt
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils.translation import ugettext_lazy as _
+from rest_framework_jwt import utils as jwt_utils
+from rest_framework_jwt.settings import api_settings
+
+from authentication.models import Profile
+from authentication.models_notifications import Notification
 from authentication.models_token import Token
+from authentication.notifications import notifications_send
+from authentication.secret_cache import secret_cached, secret_invalidate
 from authentication.serializers import ProfileSerializer
 
 
+INVITABLE_ACTION_MESSAGES = {
+    'invite': _('{profile} invited you to {invitable}.'),
+    'invite_change': _('{profile} changed your invitation to {invitable}.'),
+    'invite_validate': _('{profile} accepted your invitation to {invitable}.'),
+    'invite_token_renew': _(
+        '{profile} renewed your invitation to {invitable}.'
+    ),
+}
+
+
 def task_send_message_invitable_action(
         action_performed,
         object_actioned,
-        invite_validated,
+        invitations,
 ):
-    """Task expected from Invitable actions to process messages required.
+    """Write messages of an Invitable action to the Notification outbox.
+
+    Messages are inserted within the transaction of the action in a single
+    query, sending is queued once it commits: a request delivers nothing
+    itself however many Profiles are notified.
 
     @:param action_performed: str representation of action.
     @:param object_actioned: object invitable action taken upon.
+    @:param invitations: list of Invitation objects actioned.
+
+    @:return list of Notification
     """
-    pass
+    message = INVITABLE_ACTION_MESSAGES[action_performed]
+    invitable = getattr(object_actioned, 'title', None) or object_actioned
+    profiles_messages = []
+    for invitation in invitations:
+        recipient, actor = invitation.profile_to, invitation.profile
+        if action_performed == 'invite_validate':
+            recipient, actor = actor, recipient
+        profiles_messages.append((recipient, str(message).format(
+            profile=actor.display_name or actor.email,
+            invitable=invitable,
+        )))
+    notifications = Notification.objects.enqueue(
+        action_performed,
+        profiles_messages,
+    )
+    if notifications:
+        transaction.on_commit(notifications_send_task.delay)
+    return notifications
+
+
+@shared_task
+def notifications_send_task():
+    """Drain the Notification outbox in batches until it is empty."""
+    while notifications_send() == settings.NOTIFICATION_BATCH_SIZE:
+        pass
 
 
 def task_reset_user_secret_key(user):
@@ -26,6 +79,7 @@ def task_reset_user_secret_key(user):
     """
     user.profile.auth_token = Token.objects.create_random()
     user.profile.save()
+    secret_invalidate(user.profile.pk)
     return Token.objects.get_value(user.profile.auth_token)
 
 
@@ -36,9 +90,106 @@ def task_get_user_secret_key(user):
 
     @:returns str
     """
-    if not user.profile.auth_token:
+    profile = user.profile
+    if not profile.auth_token_id:
         return task_reset_user_secret_key(user)
-    return Token.objects.get_value(user.profile.auth_token)
+    secret_key, _user_id, _username = secret_cached(
+        profile.pk,
+        profile.auth_token_id,
+        lambda: (
+            Token.objects.get_value(profile.auth_token),
+            user.pk,
+            user.username,
+        ),
+    )
+    return secret_key
+
+
+def profile_token_identity(profile_id, token_id):
+    """Secret of a Token while it authenticates a Profile, with its User.
+
+    @:param profile_id: str Profile id.
+    @:param token_id: str Token id.
+
+    @:returns tuple of str secret, User id and username.
+
+    @:raises jwt.InvalidTokenError when the Token was rotated.
+    """
+    try:
+        profile = Profile.objects.select_related(
+            'auth_token',
+            'user',
+        ).filter(
+            pk=profile_id,
+            auth_token=token_id,
+        ).first()
+    except (TypeError, ValueError):
+        profile = None
+    if profile is None:
+        raise jwt.InvalidTokenError('Authentication token rotated.')
+    return (
+        Token.objects.get_value(profile.auth_token),
+        profile.user.pk,
+        profile.user.username,
+    )
+
+
+def jwt_payload_handler(user):
+    """JWT payload identifying the Profile and Token it is signed by.
+
+    @:param user: User object.
+
+    @:returns dict
+    """
+    profile = user.profile
+    if not profile.auth_token_id:
+        task_reset_user_secret_key(user)
+    payload = jwt_utils.jwt_payload_handler(user)
+    payload['profile_id'] = str(profile.pk)
+    payload['token_id'] = str(profile.auth_token_id)
+    return payload
+
+
+def jwt_decode_handler(token):
+    """Verify a JWT with the cached secret of the Token it is signed by.
+
+    Payloads identifying their Profile and Token are verified without
+    loading the User, and once cached without decrypting the secret. The
+    User identified must own the Profile the secret is chosen by. Payloads
+    issued before are verified by `rest_framework_jwt`.
+
+    @:param token: str JWT.
+
+    @:returns dict payload.
+
+    @:raises jwt.InvalidTokenError
+    """
+    unverified_payload = jwt.decode(token, None, False)
+    profile_id = unverified_payload.get('profile_id')
+    token_id = unverified_payload.get('token_id')
+    if not profile_id or not token_id:
+        return jwt_utils.jwt_decode_handler(token)
+    secret_key, user_id, username = secret_cached(
+        profile_id,
+        token_id,
+        lambda: profile_token_identity(profile_id, token_id),
+    )
+    payload = jwt.decode(
+        token,
+        api_settings.JWT_PUBLIC_KEY or str(secret_key),
+        api_settings.JWT_VERIFY,
+        options={'verify_exp': api_settings.JWT_VERIFY_EXPIRATION},
+        leeway=api_settings.JWT_LEEWAY,
+        audience=api_settings.JWT_AUDIENCE,
+        issuer=api_settings.JWT_ISSUER,
+        algorithms=[api_settings.JWT_ALGORITHM],
+    )
+    if (
+        str(payload.get('user_id')) != str(user_id) or
+        payload.get('username') != username
+    ):
+        raise jwt.InvalidTokenError('Authentication token of another User.')
+    return payload
 
 
 def jwt_response_payload_handler(token, user=None, request=None):
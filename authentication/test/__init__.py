@@ -15,7 +15,12 @@ from django_common.auth_backends import User
 from factory.fuzzy import FuzzyChoice
 from faker.utils.text import slugify
 
-from authentication.models import Profile, PersonMixin, ContactMethod
+from authentication.models import (
+    Profile,
+    PersonMixin,
+    ContactMethod,
+    Author,
+)
 from meta_info.models import MetaInfo, HashedTag, Tag
 
 
@@ -171,3 +176,25 @@ class UserFactory(DjangoModelFactory):
 
     class Meta:
         model = User
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class AuthorFactory(DjangoModelFactory):
+    """Factory for authors."""
+
+    name_first = factory.Faker('first_name')
+    name_family = factory.Faker('last_name')
+    name_display = factory.Faker('name')
+    emote_aggregate = [0, 0, 0, 0, 0, 0, 0]
+
+    @factory.post_generation
+    def contacts(self, create, extracted, **kwargs):
+        """Create ContactMethods when they are requested."""
+        if not create:
+            return
+        if extracted:
+            for contact in extracted:
+                self.contacts.add(contact)
+
+    class Meta:
+        model = Author
@@ -2,7 +2,8 @@
 
 from faker import Faker
 
-from authentication.test import UserFactory
+from authentication.models import Author
+from authentication.test import AuthorFactory, UserFactory
 
 fake = Faker()
 
@@ -25,3 +26,33 @@ def test_create_author(client_admin):
 def test_create_author_unauthorised(client_profile):
     """Fail attempting to create an Author not an admin."""
     pass
+
+
+def test_author_resolve_exact():
+    """Names resolve to Authors ignoring case and spacing."""
+    author = AuthorFactory(name_display='Ursula K. Le Guin')
+    assert Author.objects.resolve(' ursula k.  le guin') == author
+
+
+def test_author_resolve_similar():
+    """Near miss spellings resolve to the most similar Author."""
+    author = AuthorFactory(name_display='J. R. R. Tolkien')
+    AuthorFactory(name_display='Terry Pratchett')
+    assert Author.objects.resolve('J. R. R. Tolkein') == author
+    assert Author.objects.resolve('Agatha Christie') is None
+
+
+def test_author_resolve_create():
+    """Unmatched names create a single Author when requested."""
+    author = Author.objects.resolve('Octavia E. Butler', create=True)
+    assert author.name_display == 'Octavia E. Butler'
+    assert Author.objects.resolve('octavia e. butler', create=True) == author
+    assert Author.objects.filter(name_display='Octavia E. Butler').count() == 1
+
+
+def test_author_resolve_forgets_deleted():
+    """Deleted Authors are no longer resolved from the recent names."""
+    author = AuthorFactory(name_display='Italo Calvino')
+    assert Author.objects.resolve('Italo Calvino') == author
+    author.delete()
+    assert Author.objects.resolve('Italo Calvino') is None
@@ -0,0 +1,46 @@
+"""Circle membership End to End tests."""
+
+from authentication.models_circles import (
+    Circle,
+    CircleMembership,
+    Invitation,
+)
+from authentication.test import UserFactory
+
+
+def membership_status(circle, profile):
+    return CircleMembership.objects.filter(
+        circle=circle,
+        profile=profile,
+    ).values_list('status', flat=True).first()
+
+
+def test_circle_owner_membership(profile):
+    """Creating a Circle makes its creator an elevated member."""
+    circle = Circle.objects.create_circle(profile, title='Readers')
+    assert membership_status(circle, profile) == Invitation.STATUSES.elevated
+    assert circle.invite_status(profile) == Invitation.STATUSES.elevated
+
+
+def test_circle_membership_follows_invitation(profile):
+    """Memberships follow the status of Invitations saved and deleted."""
+    circle = Circle.objects.create_circle(profile, title='Readers')
+    invited = UserFactory().profile
+    invite = circle.invite(profile, invited)
+    assert membership_status(circle, invited) == Invitation.STATUSES.invited
+    invite.status = Invitation.STATUSES.accepted
+    invite.save()
+    assert membership_status(circle, invited) == Invitation.STATUSES.accepted
+    invite.delete()
+    assert membership_status(circle, invited) is None
+
+
+def test_circle_list_distinct(client_profile, profile):
+    """Circles are listed once however many members they have."""
+    circle = Circle.objects.create_circle(profile, title='Readers')
+    invite = circle.invite(profile, UserFactory().profile)
+    invite.status = Invitation.STATUSES.accepted
+    invite.save()
+    response = client_profile.get('/authentication/circle/')
+    assert response.status_code == 200
+    assert len(response.data['results']) == 1
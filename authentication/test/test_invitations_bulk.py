@@ -0,0 +1,82 @@
+"""Bulk Invitation End to End tests."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authentication.models_circles import (
+    Circle,
+    CircleMembership,
+    Invitation,
+)
+from authentication.test import UserFactory
+
+
+def invite_bulk_url(circle):
+    return f'/authentication/circle/{circle.pk}/invite_bulk/'
+
+
+def test_invite_bulk(client_profile, profile):
+    """Profiles are invited at once, duplicates and missing reported."""
+    circle = Circle.objects.create_circle(profile, title='Book club')
+    invited = UserFactory().profile
+    circle.invite_bulk(profile, [invited])
+    profiles_to = [UserFactory().profile for _ in range(3)]
+    response = client_profile.post(
+        invite_bulk_url(circle),
+        {
+            'profiles_to': [str(profile_to.pk) for profile_to in profiles_to]
+            + [str(invited.pk), 'unknown'],
+        },
+        format='json',
+    )
+    assert response.status_code == 200
+    assert sorted(response.data['invited']) == sorted(
+        str(profile_to.pk) for profile_to in profiles_to
+    )
+    assert response.data['duplicates'] == [str(invited.pk)]
+    assert response.data['missing'] == ['unknown']
+    assert CircleMembership.objects.filter(
+        circle=circle,
+        status=Invitation.STATUSES.invited,
+    ).count() == 4
+    assert all(
+        invite.token_id for invite in circle.invites.all()
+    )
+
+
+def test_invite_bulk_queries(profile):
+    """Inviting more Profiles takes no more queries."""
+    circle = Circle.objects.create_circle(profile, title='Book club')
+    few = [UserFactory().profile for _ in range(2)]
+    many = [UserFactory().profile for _ in range(20)]
+    with CaptureQueriesContext(connection) as context_few:
+        circle.invite_bulk(profile, few)
+    with CaptureQueriesContext(connection) as context_many:
+        circle.invite_bulk(profile, many)
+    assert len(context_many) == len(context_few)
+
+
+def test_invite_bulk_size(client_profile, profile, settings):
+    """Requests over the bulk size are rejected."""
+    settings.INVITE_BULK_MAX_SIZE = 1
+    circle = Circle.objects.create_circle(profile, title='Book club')
+    response = client_profile.post(
+        invite_bulk_url(circle),
+        {'profiles_to': [str(UserFactory().profile.pk) for _ in range(2)]},
+        format='json',
+    )
+    assert response.status_code == 400
+
+
+def test_invite_bulk_not_member(client_profile):
+    """Profiles not elevated in a Circle cannot invite to it."""
+    circle = Circle.objects.create_circle(
+        UserFactory().profile,
+        title='Book club',
+    )
+    response = client_profile.post(
+        invite_bulk_url(circle),
+        {'profiles_to': [str(UserFactory().profile.pk)]},
+        format='json',
+    )
+    assert response.status_code in (403, 404)
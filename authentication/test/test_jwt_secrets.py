@@ -0,0 +1,114 @@
+"""JWT secret caching tests."""
+
+import jwt
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_jwt import utils as jwt_utils
+
+from authentication import secret_cache
+from authentication.secret_cache import (
+    secret_cached,
+    secret_clear,
+    secret_invalidate,
+)
+from authentication.tasks import (
+    jwt_decode_handler,
+    jwt_payload_handler,
+    task_get_user_secret_key,
+    task_reset_user_secret_key,
+)
+from authentication.test import UserFactory
+
+
+@pytest.fixture(autouse=True)
+def secrets_cleared():
+    secret_clear()
+    yield
+    secret_clear()
+
+
+def test_secret_cached_until_invalidated():
+    """Secrets are loaded once per Profile and Token until invalidated."""
+    loaded = []
+
+    def load():
+        loaded.append(1)
+        return 'secret'
+
+    assert secret_cached('profile', 'token', load) == 'secret'
+    assert secret_cached('profile', 'token', load) == 'secret'
+    assert len(loaded) == 1
+    secret_cached('profile', 'rotated', load)
+    assert len(loaded) == 2
+    secret_invalidate('profile')
+    secret_cached('profile', 'token', load)
+    assert len(loaded) == 3
+
+
+def test_secret_cache_disabled(settings):
+    """Secrets are loaded every time without a timeout."""
+    settings.JWT_SECRET_CACHE_TIMEOUT = 0
+    loaded = []
+    for _ in range(2):
+        secret_cached('profile', 'token', lambda: loaded.append(1))
+    assert len(loaded) == 2
+
+
+def test_jwt_decode_cached(profile):
+    """Verifying a JWT again needs no queries."""
+    payload = jwt_payload_handler(profile.user)
+    token = jwt_utils.jwt_encode_handler(payload)
+    assert jwt_decode_handler(token)['profile_id'] == str(profile.pk)
+    with CaptureQueriesContext(connection) as context:
+        assert jwt_decode_handler(token)['user_id'] == profile.user.pk
+    assert len(context) == 0
+
+
+def test_jwt_decode_rotated(profile):
+    """JWTs signed by a rotated token are rejected."""
+    token = jwt_utils.jwt_encode_handler(jwt_payload_handler(profile.user))
+    jwt_decode_handler(token)
+    task_reset_user_secret_key(profile.user)
+    with pytest.raises(jwt.InvalidTokenError):
+        jwt_decode_handler(token)
+
+
+def test_jwt_decode_rotated_other_process(profile):
+    """JWTs are rejected by processes having cached the secret rotated."""
+    token = jwt_utils.jwt_encode_handler(jwt_payload_handler(profile.user))
+    jwt_decode_handler(token)
+    cached = dict(secret_cache._secrets)
+    task_reset_user_secret_key(profile.user)
+    # Secrets cached by another process are not dropped by the rotation.
+    secret_cache._secrets.update(cached)
+    with pytest.raises(jwt.InvalidTokenError):
+        jwt_decode_handler(token)
+
+
+def test_jwt_decode_legacy_payload(profile):
+    """JWTs issued without Profile and Token ids are still verified."""
+    token = jwt_utils.jwt_encode_handler(
+        jwt_utils.jwt_payload_handler(profile.user),
+    )
+    assert jwt_decode_handler(token)['user_id'] == profile.user.pk
+
+
+def test_jwt_decode_other_user(profile):
+    """JWTs identifying a User other than the Profile owner are rejected."""
+    other = UserFactory()
+    payload = jwt_payload_handler(profile.user)
+    jwt_decode_handler(jwt_utils.jwt_encode_handler(payload))
+    forged = dict(
+        payload,
+        user_id=other.pk,
+        username=other.username,
+    )
+    token = jwt.encode(
+        forged,
+        task_get_user_secret_key(profile.user),
+        'HS512',
+    ).decode('utf-8')
+    with pytest.raises(jwt.InvalidTokenError):
+        jwt_decode_handler(token)
@@ -0,0 +1,217 @@
+"""Notification outbox tests against local SMTP and SMS servers."""
+
+import asyncore
+import json
+import smtpd
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs
+
+import pytest
+from django.core import mail
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authentication.models import ContactMethod
+from authentication.models_circles import Circle
+from authentication.models_notifications import Notification
+from authentication.notifications import (
+    notifications_claim,
+    notifications_send,
+)
+from authentication.tasks import task_send_message_invitable_action
+from authentication.test import ContactMethodFactory, UserFactory
+
+
+class CollectingSMTPServer(smtpd.SMTPServer):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.received = []
+
+    def process_message(self, peer, mailfrom, rcpttos, data, **kwargs):
+        self.received.append((rcpttos, data))
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class SMSHandler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        data = parse_qs(self.rfile.read(length).decode())
+        self.server.received.append(data)
+        content = json.dumps({
+            'success': data['phone'][0] != 'refused',
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def smtp_server(settings):
+    """Local SMTP server collecting the messages received."""
+    server = CollectingSMTPServer(('127.0.0.1', 0), None, decode_data=True)
+    thread = threading.Thread(
+        target=asyncore.loop,
+        kwargs={'timeout': 0.05},
+        daemon=True,
+    )
+    thread.start()
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    settings.EMAIL_HOST, settings.EMAIL_PORT = server.socket.getsockname()
+    yield server
+    server.close()
+    thread.join(timeout=1)
+
+
+@pytest.fixture
+def sms_server(settings):
+    """Local SMS service collecting the messages posted."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SMSHandler)
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    settings.SMS_URL = f'http://{host}:{port}/text'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def profile_with_mobile(number):
+    profile = UserFactory().profile
+    profile.contacts.add(ContactMethodFactory(
+        type=ContactMethod.TYPES.mobile,
+        detail=number,
+    ))
+    return profile
+
+
+def test_invite_bulk_outbox(client_profile, profile):
+    """Inviting writes Notifications for the invited, sending nothing."""
+    circle = Circle.objects.create_circle(profile, title='Book club')
+    profiles_to = [UserFactory().profile for _ in range(3)]
+    response = client_profile.post(
+        f'/authentication/circle/{circle.pk}/invite_bulk/',
+        {'profiles_to': [str(profile_to.pk) for profile_to in profiles_to]},
+        format='json',
+    )
+    assert response.status_code == 200
+    notifications = Notification.objects.pending()
+    assert sorted(str(n.profile_id) for n in notifications) == sorted(
+        str(profile_to.pk) for profile_to in profiles_to
+    )
+    assert all('Book club' in n.message for n in notifications)
+    assert not mail.outbox
+
+
+def test_outbox_queries(profile):
+    """Notifying more Profiles takes no more queries."""
+    circle = Circle.objects.create_circle(profile, title='Book club')
+    few, _ = circle.invite_bulk(
+        profile,
+        [UserFactory().profile for _ in range(2)],
+    )
+    many, _ = circle.invite_bulk(
+        profile,
+        [UserFactory().profile for _ in range(20)],
+    )
+    with CaptureQueriesContext(connection) as context_few:
+        task_send_message_invitable_action('invite', circle, few)
+    with CaptureQueriesContext(connection) as context_many:
+        task_send_message_invitable_action('invite', circle, many)
+    assert len(context_many) == len(context_few)
+
+
+def test_send_grouped(profile, smtp_server, sms_server):
+    """Messages of each recipient are sent once per channel."""
+    recipient = profile_with_mobile('+447700900000')
+    other = UserFactory().profile
+    Notification.objects.enqueue('invite', [
+        (recipient, 'First message.'),
+        (recipient, 'Second message.'),
+        (other, 'Other message.'),
+    ])
+    assert notifications_send() == 3
+    assert sorted(rcpttos[0] for rcpttos, _ in smtp_server.received) == (
+        sorted([recipient.email, other.email])
+    )
+    recipient_email = [
+        data for rcpttos, data in smtp_server.received
+        if rcpttos == [recipient.email]
+    ][0]
+    assert 'First message.' in recipient_email
+    assert 'Second message.' in recipient_email
+    assert len(sms_server.received) == 1
+    assert sms_server.received[0]['phone'] == ['+447700900000']
+    assert sms_server.received[0]['message'] == [
+        'First message.\nSecond message.',
+    ]
+    assert not Notification.objects.pending().exists()
+    assert Notification.objects.filter(
+        status=Notification.STATUSES.sent,
+        sent_at__isnull=False,
+    ).count() == 3
+
+
+def test_send_retried(settings, sms_server):
+    """Notifications no channel accepts are retried, then failed."""
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+    settings.EMAIL_HOST, settings.EMAIL_PORT = '127.0.0.1', 1
+    settings.NOTIFICATION_RETRY_SECONDS = 0
+    settings.NOTIFICATION_MAX_ATTEMPTS = 2
+    recipient = profile_with_mobile('refused')
+    Notification.objects.enqueue('invite', [(recipient, 'Refused.')])
+    assert notifications_send() == 1
+    notification = Notification.objects.get()
+    assert notification.status == Notification.STATUSES.pending
+    assert notification.attempts == 1
+    assert 'sms refused' in notification.error
+    assert notifications_send() == 1
+    notification.refresh_from_db()
+    assert notification.status == Notification.STATUSES.failed
+    assert notification.attempts == 2
+    assert notifications_send() == 0
+
+
+def test_send_claimed(settings, profile, smtp_server):
+    """Notifications in flight are claimed again only of a lost worker."""
+    Notification.objects.enqueue('invite', [(profile, 'Claimed.')])
+    Notification.objects.update(
+        status=Notification.STATUSES.sending,
+        attempts=1,
+    )
+    assert notifications_send() == 0
+    settings.NOTIFICATION_CLAIM_SECONDS = 0
+    assert notifications_send() == 1
+    notification = Notification.objects.get()
+    assert notification.status == Notification.STATUSES.sent
+    assert notification.attempts == 2
+
+
+def test_claim_once(profile):
+    """Notifications are claimed by one batch only, oldest first."""
+    Notification.objects.enqueue('invite', [
+        (profile, 'First.'),
+        (profile, 'Second.'),
+    ])
+    first = notifications_claim(1)
+    second = notifications_claim(2)
+    assert [notification.message for notification in first] == ['First.']
+    assert [notification.message for notification in second] == ['Second.']
+    assert notifications_claim(2) == []
+    assert all(
+        notification.status == Notification.STATUSES.sending
+        and notification.attempts == 1
+        for notification in first + second
+    )
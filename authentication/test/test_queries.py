@@ -0,0 +1,48 @@
+"""Query count regression tests for authentication endpoints."""
+
+from authentication.models_circles import Circle
+from authentication.test import (
+    AuthorFactory,
+    ContactMethodFactory,
+    UserFactory,
+)
+
+
+def test_author_list_queries(list_queries):
+    """Listing Authors does not query per Author for contacts."""
+    AuthorFactory(contacts=[ContactMethodFactory()])
+    expected = list_queries('/authentication/author/')
+    for index in range(4):
+        AuthorFactory(contacts=[ContactMethodFactory()])
+    assert list_queries('/authentication/author/') == expected
+
+
+def test_profile_list_queries(list_queries):
+    """Listing Profiles does not query per Profile for pen names."""
+    AuthorFactory(profile=UserFactory().profile)
+    expected = list_queries('/authentication/profile/')
+    for index in range(4):
+        AuthorFactory(profile=UserFactory().profile)
+    assert list_queries('/authentication/profile/') == expected
+
+
+def test_contact_list_queries(list_queries, profile):
+    """Listing ContactMethods does not query per ContactMethod."""
+    profile.contacts.add(ContactMethodFactory())
+    expected = list_queries('/authentication/contact/')
+    profile.contacts.add(*ContactMethodFactory.create_batch(4))
+    assert list_queries('/authentication/contact/') == expected
+
+
+def test_circle_list_queries(list_queries, profile):
+    """Listing Circles does not query per Circle for contacts or invites."""
+    def circle_create(index):
+        circle = Circle.objects.create_circle(profile, title=f'Circle {index}')
+        circle.contacts.add(ContactMethodFactory())
+        circle.invite(profile, UserFactory().profile)
+
+    circle_create(0)
+    expected = list_queries('/authentication/circle/')
+    for index in range(1, 5):
+        circle_create(index)
+    assert list_queries('/authentication/circle/') == expected
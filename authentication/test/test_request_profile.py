@@ -0,0 +1,58 @@
+"""Request scoped Profile loading and permission caching tests."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import permissions
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_jwt import utils as jwt_utils
+
+from authentication.authentication import (
+    ProfileJSONWebTokenAuthentication,
+    ProfileModelBackend,
+)
+from authentication.permissions import object_permission_cached
+from authentication.tasks import jwt_payload_handler
+
+
+class CountingPermission(permissions.BasePermission):
+
+    def __init__(self):
+        self.evaluated = 0
+
+    @object_permission_cached
+    def has_object_permission(self, request, view, obj):
+        self.evaluated += 1
+        return obj.id == request.user.profile.id
+
+
+def test_jwt_user_loaded_with_profile(profile):
+    """Authenticating a JWT loads the Profile in the same query."""
+    token = jwt_utils.jwt_encode_handler(jwt_payload_handler(profile.user))
+    payload = jwt_utils.jwt_decode_handler(token)
+    authentication = ProfileJSONWebTokenAuthentication()
+    with CaptureQueriesContext(connection) as context:
+        user = authentication.authenticate_credentials(payload)
+        assert user.profile.type == profile.type
+    assert len(context) == 1
+
+
+def test_session_user_loaded_with_profile(profile):
+    """Users of a session are loaded with their Profile."""
+    user = ProfileModelBackend().get_user(profile.user.pk)
+    with CaptureQueriesContext(connection) as context:
+        assert user.profile.id == profile.id
+    assert len(context) == 0
+
+
+def test_object_permission_cached(profile):
+    """Object permissions are evaluated once per request and object."""
+    request = Request(APIRequestFactory().get('/'))
+    request.user = profile.user
+    permission = CountingPermission()
+    for _ in range(3):
+        assert permission.has_object_permission(request, None, profile)
+    assert permission.evaluated == 1
+    other = Request(request._request)
+    assert permission.has_object_permission(other, None, profile)
+    assert permission.evaluated == 1
@@ -5,7 +5,9 @@ from rest_framework import (mixins, viewsets, filters, permissions)
 from authentication.exceptions import CircleUniquePerProfileError
 from authentication.permissions import (
     AuthenticatedOrAdminPermission,
-    NoCreatePermission)
+    NoCreatePermission,
+    object_permission_cached,
+)
 from authentication.models import (
     ContactMethod,
     Profile,
@@ -22,9 +24,15 @@ from authentication.serializers import (
 )
 from authentication.models_circles import (
     Circle,
+    CircleMembership,
     Invitation,
 )
 from authentication.views_invitable import InvitableViewSetMixin
+from bookworm.views import (
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
+    ResponseCacheViewSetMixin,
+)
 from file_store.views import ImagableViewSet
 
 
@@ -49,6 +57,7 @@ class ProfilePermission(permissions.IsAuthenticated):
             return True
         return authenticated
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Users may only see and manage their own Profile.
 
@@ -61,7 +70,12 @@ class ProfilePermission(permissions.IsAuthenticated):
         return authenticated and obj.id == request.user.profile.id
 
 
-class ProfileViewSet(ImagableViewSet, viewsets.ModelViewSet):
+class ProfileViewSet(
+    ImagableViewSet,
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Profile.objects.all()
     serializer_class = ProfileSerializer
     permission_classes = (ProfilePermission, )
@@ -121,6 +135,7 @@ class AuthorPermission(permissions.IsAuthenticated):
             return True
         return authenticated
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Authentication required to update an author.
 
@@ -131,13 +146,19 @@ class AuthorPermission(permissions.IsAuthenticated):
         if authenticated:
             if request.user.profile.type >= Profile.TYPES.admin:
                 return True
-        return authenticated and obj.profile.id == request.user.profile.id
+        return authenticated and obj.profile_id == request.user.profile.id
 
 
-class AuthorViewSet(ImagableViewSet, viewsets.ModelViewSet):
+class AuthorViewSet(
+    ImagableViewSet,
+    ResponseCacheViewSetMixin,
+    EagerLoadingViewSetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Author.objects.all()
     serializer_class = AuthorSerializer
     permission_classes = (AuthorPermission, )
+    cache_dependencies = ('authentication.ContactMethod', )
     filter_backends = (filters.SearchFilter, )
     search_fields = (
         'name_first',
@@ -150,6 +171,7 @@ class AuthorViewSet(ImagableViewSet, viewsets.ModelViewSet):
 
 class ContactMethodPermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """ContactMethod object permissions.
 
@@ -163,7 +185,11 @@ class ContactMethodPermission(permissions.IsAuthenticated):
         return authenticated and obj.profile.contacts.filter(id__in=[obj.id])
 
 
-class ContactMethodViewSet(viewsets.ModelViewSet):
+class ContactMethodViewSet(
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = ContactMethod.objects.all()
     serializer_class = ContactMethodSerializer
     permission_classes = (
@@ -192,6 +218,7 @@ class ContactMethodViewSet(viewsets.ModelViewSet):
 
 class CirclePermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Permissions to manage access to a Circle model.
 
@@ -201,13 +228,10 @@ class CirclePermission(permissions.IsAuthenticated):
         Admins can do everything.
         """
         is_admin = request.user.profile.type >= Profile.TYPES.admin
-        accepted_invite = obj.invites.filter(
-            profile_to__id=request.user.profile.id,
-            status__gt=Invitation.STATUSES.invited,
-        ).first()
-        if not accepted_invite:
+        status = obj.invite_status(request.user.profile)
+        if status is None or status <= Invitation.STATUSES.invited:
             return view.action in ['create']
-        invite_elevated = accepted_invite.status == Invitation.STATUSES.elevated
+        invite_elevated = status == Invitation.STATUSES.elevated
         if (
                 not invite_elevated and not is_admin
                 and view.action in ['update', 'partial_update', 'destroy']
@@ -219,6 +243,8 @@ class CirclePermission(permissions.IsAuthenticated):
 class CircleViewSet(
     InvitableViewSetMixin,
     ImagableViewSet,
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
     viewsets.ModelViewSet,
 ):
     queryset = Circle.objects.all()
@@ -254,13 +280,14 @@ class CircleViewSet(
                 visible_circles = [Invitation.STATUSES.invited, ]
             if self.request.query_params.get('rejected_only'):
                 visible_circles = [Invitation.STATUSES.rejected, ]
-        queryset = super().get_queryset().filter(
-            invites__status__in=visible_circles,
-        )
-        if self.request.user.profile.type > Profile.TYPES.elevated:
-            return queryset
-        return queryset.filter(
-            invites__profile_to__id=self.request.user.profile.id,
+        profile = self.request.user.profile
+        if profile.type > Profile.TYPES.elevated:
+            profile = None
+        return super().get_queryset().filter(
+            pk__in=CircleMembership.objects.circle_ids(
+                visible_circles,
+                profile=profile,
+            ),
         )
 
     def create(self, request, *args, **kwargs):
@@ -1,13 +1,19 @@
 """Invitation mixin views."""
 
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import ugettext_lazy as _
 from rest_framework import (status, permissions)
 from rest_framework.decorators import (detail_route, permission_classes)
 from rest_framework.response import Response
 
 from authentication.models import Profile
+from authentication.permissions import object_permission_cached
 from authentication.models_circles import Invitation
 from authentication.exceptions import (
     DuplicateInvitationValidationError,
+    InvitationBulkSizeError,
     InvitationValidationError,
     InvitationMissingError,
     InvitationTokenNotExistError,
@@ -18,6 +24,7 @@ from authentication.tasks import task_send_message_invitable_action
 
 class InvitableInvitePermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Invite a Profile into this objects Profile list.
 
@@ -29,14 +36,13 @@ class InvitableInvitePermission(permissions.IsAuthenticated):
             return False
         if request.user.profile.type >= Profile.TYPES.admin:
             return True
-        invite = obj.invites.filter(
-            profile_to=request.user.profile,
-        ).first()
-        return invite and invite.status >= Invitation.STATUS.elevated
+        status = obj.invite_status(request.user.profile)
+        return status is not None and status >= Invitation.STATUSES.elevated
 
 
 class InvitableInviteValidatePermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """A Profile can only validate their own token."""
         authenticated = super().has_object_permission(request, view, obj)
@@ -44,14 +50,13 @@ class InvitableInviteValidatePermission(permissions.IsAuthenticated):
             return False
         if request.user.profile.type >= Profile.TYPES.admin:
             return True
-        invite = obj.invites.filter(
-            profile_to=request.user.profile,
-        )
-        return invite and invite.status == Invitation.STATUS.invited
+        status = obj.invite_status(request.user.profile)
+        return status == Invitation.STATUSES.invited
 
 
 class InvitableInviteRenewTokenPermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Invitations made can renew a token by the initiator.
 
@@ -64,16 +69,14 @@ class InvitableInviteRenewTokenPermission(permissions.IsAuthenticated):
             return False
         if request.user.profile.type >= Profile.TYPES.admin:
             return True
-        invite = obj.invites.filter(
-            profile_to=request.user.profile,
-        ).first()
-        if not invite or invite.status < Invitation.STATUS.elevated:
+        status = obj.invite_status(request.user.profile)
+        if status is None or status < Invitation.STATUSES.elevated:
             return False
         invite = obj.invites.filter(
             profile=request.user.profile,
             profile_to=request.data.get('profile_to'),
         ).first()
-        return invite and invite.status == Invitation.STATUS.invited
+        return invite and invite.status == Invitation.STATUSES.invited
 
 
 class InvitableViewSetMixin:
@@ -89,18 +92,22 @@ class InvitableViewSetMixin:
             {
                 'status': 'error',
                 'ok': '💩',
-                'error': error.get('detail'),
+                'error': (
+                    error.get('detail') if isinstance(error, dict)
+                    else error.detail
+                ),
             },
             status=error_status or status.HTTP_400_BAD_REQUEST,
         )
 
     @detail_route(methods=['post'])
     @permission_classes((InvitableInvitePermission, ))
+    @transaction.atomic
     def invite(self, request, pk, **kwargs):
         """Invite a profile to another object."""
         inviting_to = self.get_object()
         try:
-            inviting_to.invite(
+            invite = inviting_to.invite(
                 Profile.objects.filter(user=request.user).first(),
                 Profile.objects.filter(
                     id=request.data.get('profile_to'),
@@ -111,7 +118,7 @@ class InvitableViewSetMixin:
             InvitationValidationError,
         ) as e:
             return self._invitation_error_handle(e)
-        task_send_message_invitable_action.delay('invite', inviting_to)
+        task_send_message_invitable_action('invite', inviting_to, [invite])
         return Response(
             {
                 'status': 'invited',
@@ -121,6 +128,65 @@ class InvitableViewSetMixin:
 
     @detail_route(methods=['post'])
     @permission_classes((InvitableInvitePermission, ))
+    @transaction.atomic
+    def invite_bulk(self, request, pk, **kwargs):
+        """Invite many profiles to another object at once.
+
+        `profiles_to`: list of Profile ids, profiles already invited or not
+        found are reported without failing the others.
+        """
+        inviting_to = self.get_object()
+        requested = list(dict.fromkeys(
+            str(profile_id)
+            for profile_id in request.data.get('profiles_to') or []
+        ))
+        if len(requested) > settings.INVITE_BULK_MAX_SIZE:
+            return self._invitation_error_handle(InvitationBulkSizeError(
+                inviting_to,
+                len(requested),
+                settings.INVITE_BULK_MAX_SIZE,
+            ))
+        profile_ids = []
+        for profile_id in requested:
+            try:
+                hashid = Profile._meta.pk.to_python(profile_id)
+            except ValidationError:
+                continue
+            if str(hashid) == profile_id:
+                profile_ids.append(hashid)
+        profiles_to = list(Profile.objects.filter(id__in=profile_ids))
+        try:
+            invitations, skipped = inviting_to.invite_bulk(
+                request.user.profile,
+                profiles_to,
+            )
+        except InvitationValidationError as e:
+            return self._invitation_error_handle(e)
+        task_send_message_invitable_action(
+            'invite',
+            inviting_to,
+            invitations,
+        )
+        found = {str(profile_to.pk) for profile_to in profiles_to}
+        return Response(
+            {
+                'status': 'invited',
+                'ok': '🖖',
+                'invited': [
+                    str(invitation.profile_to_id)
+                    for invitation in invitations
+                ],
+                'duplicates': [str(profile_to.pk) for profile_to in skipped],
+                'missing': [
+                    profile_id for profile_id in requested
+                    if profile_id not in found
+                ],
+            }
+        )
+
+    @detail_route(methods=['post'])
+    @permission_classes((InvitableInvitePermission, ))
+    @transaction.atomic
     def invite_change(self, request, pk, **kwargs):
         """Change an invitation for a profile to a different type."""
         changing_for = self.get_object()
@@ -137,8 +203,8 @@ class InvitableViewSetMixin:
             InvitationMissingError,
         ) as e:
             return self._invitation_error_handle(e)
-        task_send_message_invitable_action.delay(
-            'invite_change', changing_for, invite)
+        task_send_message_invitable_action(
+            'invite_change', changing_for, [invite])
         return Response(
             {
                 'status': 'changed',
@@ -148,13 +214,19 @@ class InvitableViewSetMixin:
 
     @detail_route(methods=['post'])
     @permission_classes((InvitableInviteValidatePermission, ))
+    @transaction.atomic
     def invite_validate(self, request, pk, **kwargs):
         """Validate a token of an Invitation and accept Invitation."""
         changing_for = self.get_object()
         invite = changing_for.invites.filter(
             profile_to=request.data.get('profile_to'),
             status=Invitation.STATUSES.invited,
-        )
+        ).first()
+        if not invite:
+            return self._invitation_error_handle(
+                {'detail': _('Not Found'), },
+                error_status=status.HTTP_404_NOT_FOUND,
+            )
         try:
             invite.token_verify(request.data.get('token'))
         except InvitationTokenNotExistError as error:
@@ -164,8 +236,8 @@ class InvitableViewSetMixin:
             return self._invitation_error_handle(error)
         invite.status = Invitation.STATUSES.accepted
         invite.save()
-        task_send_message_invitable_action.delay(
-            'invite_validate', changing_for, invite)
+        task_send_message_invitable_action(
+            'invite_validate', changing_for, [invite])
         return Response(
             {
                 'status': 'validated',
@@ -175,6 +247,7 @@ class InvitableViewSetMixin:
 
     @detail_route(methods=['post'])
     @permission_classes((InvitableInviteRenewTokenPermission, ))
+    @transaction.atomic
     def invite_token_renew(self, request, pk, **kwargs):
         """Renew an invitations' token for acceptance.
 
@@ -185,7 +258,7 @@ class InvitableViewSetMixin:
             profile_to__id=request.data.get('profile_to'),
             profile__id=request.user.profile.id,
             status=Invitation.STATUSES.invited,
-        )
+        ).first()
         if not invite:
             return self._invitation_error_handle(
                 {'detail': _('Not Found'), },
@@ -195,8 +268,8 @@ class InvitableViewSetMixin:
             invite.token_recreate()
         except InvitationAlreadyVerifiedError as e:
             return self._invitation_error_handle(e)
-        task_send_message_invitable_action.delay(
-            'invite_token_renew', changing_for)
+        task_send_message_invitable_action(
+            'invite_token_renew', changing_for, [invite])
         return Response(
             {
                 'status': 'renewed',
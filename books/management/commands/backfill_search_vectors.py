@@ -0,0 +1,38 @@
+"""Command to store full text search vectors of searchable models."""
+
+import logging
+
+from django.core.management import BaseCommand
+
+from bookworm.mixins_searchable import SearchableModelMixin
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Backfill search vectors of all searchable models in batches."""
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Objects updated per transaction.',
+        )
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='Only store vectors of objects without one.',
+        )
+
+    def handle(self, *args, **options):
+        """Store search vectors model by model."""
+        for model in SearchableModelMixin.searchable_models():
+            updated = model.search_vector_backfill(
+                batch_size=options['batch_size'],
+                missing_only=options['missing_only'],
+            )
+            logger.info(f'{model._meta.label}: {updated} vectors stored.')
@@ -0,0 +1,33 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:21
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True, verbose_name='Search vector'),
+        ),
+        migrations.AddField(
+            model_name='bookchapter',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True, verbose_name='Search vector'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='books_book_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='books_chapter_search_gin'),
+        ),
+    ]
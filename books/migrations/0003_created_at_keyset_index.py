@@ -0,0 +1,45 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0002_book_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['created_at', 'id'], name='books_book_created_f13e98_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookchapter',
+            index=models.Index(fields=['created_at', 'id'], name='books_bookc_created_1894b8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookprogress',
+            index=models.Index(fields=['created_at', 'id'], name='books_bookp_created_2454a9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookreview',
+            index=models.Index(fields=['created_at', 'id'], name='books_bookr_created_48ff67_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='confirmreadanswer',
+            index=models.Index(fields=['created_at', 'id'], name='books_confi_created_505a7f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='confirmreadquestion',
+            index=models.Index(fields=['created_at', 'id'], name='books_confi_created_45b365_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='read',
+            index=models.Index(fields=['created_at', 'id'], name='books_read_created_11ffab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readinglist',
+            index=models.Index(fields=['created_at', 'id'], name='books_readi_created_e36389_idx'),
+        ),
+    ]
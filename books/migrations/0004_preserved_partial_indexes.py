@@ -0,0 +1,169 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:25
+
+import bookworm.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0003_created_at_keyset_index'),
+    ]
+
+    operations = [
+        bookworm.operations.AddPartialIndex(
+            model_name='book',
+            fields=['profile'],
+            name='books_book_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='book',
+            fields=['cover_image'],
+            name='books_book_cover_image_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='book',
+            fields=['title'],
+            name='books_book_title_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='book',
+            fields=['author'],
+            name='books_book_author_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='book',
+            fields=['meta_info'],
+            name='books_book_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookprogress',
+            fields=['profile'],
+            name='books_bookprogress_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookprogress',
+            fields=['document'],
+            name='books_bookprogress_document_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookprogress',
+            fields=['book'],
+            name='books_bookprogress_book_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookchapter',
+            fields=['title'],
+            name='books_bookchapter_title_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookchapter',
+            fields=['progress'],
+            name='books_bookchapter_progress_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookchapter',
+            fields=['book'],
+            name='books_bookchapter_book_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookchapter',
+            fields=['meta_info'],
+            name='books_bookchapter_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='readinglist',
+            fields=['profile'],
+            name='books_readinglist_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='readinglist',
+            fields=['cover_image'],
+            name='books_readinglist_cover_image_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='readinglist',
+            fields=['title'],
+            name='books_readinglist_title_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='readinglist',
+            fields=['meta_info'],
+            name='books_readinglist_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookreview',
+            fields=['profile'],
+            name='books_bookreview_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookreview',
+            fields=['book'],
+            name='books_bookreview_book_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookreview',
+            fields=['progress'],
+            name='books_bookreview_progress_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='bookreview',
+            fields=['post'],
+            name='books_bookreview_post_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='confirmreadquestion',
+            fields=['profile'],
+            name='books_confirmreadquestion_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='confirmreadquestion',
+            fields=['book'],
+            name='books_confirmreadquestion_book_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='confirmreadquestion',
+            fields=['chapter'],
+            name='books_confirmreadquestion_chapter_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='confirmreadquestion',
+            fields=['multi_choice_answer'],
+            name='books_confirmreadquestion_multi_choice_answer_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='confirmreadanswer',
+            fields=['profile'],
+            name='books_confirmreadanswer_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='confirmreadanswer',
+            fields=['question'],
+            name='books_confirmreadanswer_question_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='confirmreadanswer',
+            fields=['accepted_by'],
+            name='books_confirmreadanswer_accepted_by_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='read',
+            fields=['profile'],
+            name='books_read_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='read',
+            fields=['book'],
+            name='books_read_book_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='read',
+            fields=['answer'],
+            name='books_read_answer_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='read',
+            fields=['post'],
+            name='books_read_post_id_live',
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0004_preserved_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['modified_at', 'id'], name='books_book_modifie_210f29_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookprogress',
+            index=models.Index(fields=['modified_at', 'id'], name='books_bookp_modifie_1e8ea7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bookreview',
+            index=models.Index(fields=['modified_at', 'id'], name='books_bookr_modifie_8a6358_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='readinglist',
+            index=models.Index(fields=['modified_at', 'id'], name='books_readi_modifie_5c987b_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 2.0.2 on 2026-10-18 21:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0005_sync_modified_indexes'),
+    ]
+
+    # The through table of `ReadingList.books` is kept, books already listed
+    # are dated from this migration and ordered by id.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='ReadingListBook',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('book', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='books.Book', verbose_name='Book')),
+                        ('reading_list', models.ForeignKey(db_column='readinglist_id', on_delete=django.db.models.deletion.CASCADE, related_name='reading_list_books', to='books.ReadingList', verbose_name='Reading list')),
+                    ],
+                    options={
+                        'verbose_name': 'Reading List Book',
+                        'verbose_name_plural': 'Reading List Books',
+                        'db_table': 'books_readinglist_books',
+                    },
+                ),
+                migrations.AlterUniqueTogether(
+                    name='readinglistbook',
+                    unique_together={('reading_list', 'book')},
+                ),
+                migrations.AlterField(
+                    model_name='readinglist',
+                    name='books',
+                    field=models.ManyToManyField(related_name='reading_lists', through='books.ReadingListBook', to='books.Book', verbose_name='Books'),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='readinglistbook',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='readinglistbook',
+            index=models.Index(fields=['reading_list', 'created_at', 'id'], name='books_readi_reading_f67662_idx'),
+        ),
+    ]
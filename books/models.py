@@ -1,7 +1,11 @@
 """Books models."""
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
 from model_utils import Choices
@@ -9,9 +13,11 @@ from hashid_field import HashidAutoField
 
 from authentication.models import Author
 from bookworm.mixins import (
+    CreatedModelMixin,
     ProfileReferredMixin,
     PreserveModelMixin,
 )
+from bookworm.mixins_searchable import SearchableModelMixin
 from meta_info.models import MetaInfo
 from meta_info.models_localisation import Localisable
 from posts.models import Emotable, Post
@@ -85,11 +91,18 @@ class Book(
         Imagable,
         Documentable,
         PublicationMixin,
+        SearchableModelMixin,
         PreserveModelMixin,
         ProfileReferredMixin,
 ):
     """Books model."""
 
+    SEARCH_VECTOR_FIELDS = (
+        ('title', 'A'),
+        ('author.name_display', 'B'),
+        ('description', 'C'),
+    )
+
     id = HashidAutoField(
         primary_key=True,
         salt=settings.SALT_BOOKS_BOOK,
@@ -114,6 +127,11 @@ class Book(
     class Meta:
         verbose_name = 'Book'
         verbose_name_plural = 'Books'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['modified_at', 'id']),
+            GinIndex(fields=['search_vector'], name='books_book_search_gin'),
+        ]
 
     def __str__(self):
         """Title and author of book."""
@@ -152,15 +170,24 @@ class BookProgress(
     class Meta:
         verbose_name = 'Progress'
         verbose_name_plural = 'Progresses'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['modified_at', 'id']),
+        ]
 
     def __str__(self):
         """Title and percent of book progress."""
         return f'BookProgress({self.id}: {self.percent}% - {self.book.title})'
 
 
-class BookChapter(Localisable, PreserveModelMixin):
+class BookChapter(Localisable, SearchableModelMixin, PreserveModelMixin):
     """Book chapter model."""
 
+    SEARCH_VECTOR_FIELDS = (
+        ('title', 'A'),
+        ('book.title', 'B'),
+    )
+
     id = HashidAutoField(
         primary_key=True,
         salt=settings.SALT_BOOKS_BOOKCHAPTER,
@@ -194,6 +221,13 @@ class BookChapter(Localisable, PreserveModelMixin):
     class Meta:
         verbose_name = 'Book Chapter'
         verbose_name_plural = 'Book Chapters'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            GinIndex(
+                fields=['search_vector'],
+                name='books_chapter_search_gin',
+            ),
+        ]
 
     def __str__(self):
         return f'BookChapter({self.id}: {self.title} - {self.book.title})'
@@ -222,6 +256,7 @@ class ReadingList(
     )
     books = models.ManyToManyField(
         Book,
+        through='ReadingListBook',
         related_name='reading_lists',
         verbose_name=_('Books'),
     )
@@ -238,26 +273,147 @@ class ReadingList(
         verbose_name = 'Reading List'
         verbose_name_plural = 'Reading Lists'
         unique_together = ('title', 'profile', )
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['modified_at', 'id']),
+        ]
 
     @property
     def count_books(self):
-        """Number of books in this ReadingList."""
-        return self.books.count()
+        """Number of books in this ReadingList.
+
+        Annotated as `books_count` by `ReadingListBook.objects.count_books`
+        when listed, counted otherwise.
+        """
+        if getattr(self, 'books_count', None) is None:
+            self.books_count = ReadingListBook.objects.listed().filter(
+                reading_list=self,
+            ).count()
+        return self.books_count
 
     def add_book(self, book):
         """Add a book to the ReadingList object."""
         book = book if type(book) is Book else Book.objects.get(id=book)
-        self.books.add(book)
+        ReadingListBook.objects.get_or_create(reading_list=self, book=book)
+        self._books_changed()
 
     def remove_book(self, book):
         """Remove a book from the ReadingList object."""
         book = book if type(book) is Book else Book.objects.get(id=book)
-        self.books.remove(book)
+        ReadingListBook.objects.filter(reading_list=self, book=book).delete()
+        self._books_changed()
+
+    def _books_changed(self):
+        """Discard books counted or prefetched and mark this modified.
+
+        Books are related through ReadingListBook, the ReadingList itself
+        is updated so validators and sync watermarks see the change.
+        """
+        self.books_count = None
+        self.__dict__.pop('books_preview', None)
+        self.modified_at = now()
+        ReadingList.all_objects.filter(pk=self.pk).update(
+            modified_at=self.modified_at,
+        )
+
+    def books_page(self, after=None):
+        """Books of this ReadingList in the order they were added.
+
+        @param after: ReadingListBook the previous page ended with.
+
+        @return QuerySet of ReadingListBook
+        """
+        entries = ReadingListBook.objects.listed().filter(reading_list=self)
+        if after is not None:
+            entries = entries.filter(
+                Q(created_at__gt=after.created_at) |
+                Q(created_at=after.created_at, id__gt=after.id),
+            )
+        return entries.order_by('created_at', 'id')
+
+    def __str__(self):
+        count = self.count_books
+        plural = 's' if count != 1 else ''
+        return f'ReadingList({self.id}: {self.title} - {count} book{plural})'
+
+
+class ReadingListBookManager(models.Manager):
+    """Manage the books of reading lists in the order they were added."""
+
+    def listed(self):
+        """Entries of books not deleted.
+
+        @return QuerySet
+        """
+        return self.filter(book__deleted_at__isnull=True)
+
+    def count_books(self):
+        """Number of books of each ReadingList, to annotate them with.
+
+        @return Subquery expression counting per outer ReadingList.
+        """
+        return Coalesce(
+            Subquery(
+                self.listed().filter(
+                    reading_list=OuterRef('pk'),
+                ).order_by().values('reading_list').annotate(
+                    count=Count('id'),
+                ).values('count'),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+    def first_pages(self, size):
+        """Entries of the first books added to each ReadingList.
+
+        Limited per ReadingList by a subquery of the index on
+        `(reading_list, created_at, id)`, so prefetching the first page of
+        many reading lists never loads whole lists.
+
+        @param size: int books per ReadingList.
+
+        @return QuerySet
+        """
+        return self.listed().filter(
+            id__in=Subquery(
+                self.listed().filter(
+                    reading_list=OuterRef('reading_list'),
+                ).order_by('created_at', 'id').values('id')[:size],
+            ),
+        ).order_by('created_at', 'id')
+
+
+class ReadingListBook(CreatedModelMixin):
+    """Book of a ReadingList, ordered by when it was added."""
+
+    reading_list = models.ForeignKey(
+        ReadingList,
+        related_name='reading_list_books',
+        verbose_name=_('Reading list'),
+        on_delete=models.CASCADE,
+        db_column='readinglist_id',
+    )
+    book = models.ForeignKey(
+        Book,
+        related_name='+',
+        verbose_name=_('Book'),
+        on_delete=models.CASCADE,
+    )
+
+    objects = ReadingListBookManager()
+
+    class Meta:
+        verbose_name = 'Reading List Book'
+        verbose_name_plural = 'Reading List Books'
+        db_table = 'books_readinglist_books'
+        unique_together = ('reading_list', 'book', )
+        indexes = [
+            models.Index(fields=['reading_list', 'created_at', 'id']),
+        ]
 
     def __str__(self):
-        plural = 's' if self.count_books != 1 else ''
-        book_num = f'{self.count_books} book{plural}'
-        return f'ReadingList({self.id}: {self.title} - {book_num})'
+        return f'ReadingListBook({self.reading_list_id}: {self.book_id})'
 
 
 class BookReview(
@@ -323,6 +479,14 @@ class BookReview(
     class Meta:
         verbose_name = 'Book Review'
         verbose_name_plural = 'Book Reviews'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['modified_at', 'id']),
+        ]
+
+    def emote_cache_objects(self):
+        """Books represent the aggregates of their reviews."""
+        return super().emote_cache_objects() + [(Book, self.book_id)]
 
     def __str__(self):
         book_detail = f'{self.book.title} by {self.profile.display_name}'
@@ -74,6 +74,9 @@ class ConfirmReadQuestion(
     class Meta:
         verbose_name = 'Confirm Read Question'
         verbose_name_plural = 'Confirm Read Questions'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     def __str__(self):
         """Display only as URI valid slug."""
@@ -133,11 +136,14 @@ class ConfirmReadAnswer(
         verbose_name = 'Confirm Read Answer'
         verbose_name_plural = 'Confirm Read Answers'
         unique_together = ('profile', 'copy', )
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     @property
     def correct(self):
         """Answer is correct."""
-        return bool(self.accepted_by)
+        return self.accepted_by_id is not None
 
     def __str__(self):
         """Display only as URI valid slug."""
@@ -192,6 +198,9 @@ class Read(Emotable, PreserveModelMixin, ProfileReferredMixin):
     class Meta:
         verbose_name = 'Read'
         verbose_name_plural = 'Read'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     @property
     def answered_correctly(self):
@@ -5,6 +5,7 @@ import logging
 from rest_framework import permissions
 
 from authentication.models import Profile
+from authentication.permissions import object_permission_cached
 
 logger = logging.getLogger(__name__)
 
@@ -49,23 +50,25 @@ class AnyReadOrElevatedPermission(permissions.AllowAny):
 
 class AnyReadOwnerCreateEditPermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Profiles owning this object may only edit or delete."""
         if request.method in permissions.SAFE_METHODS:
             return True
         authenticated = super().has_object_permission(request, view, obj)
-        return authenticated and obj.profile.id == request.user.profile.id
+        return authenticated and obj.profile_id == request.user.profile.id
 
 
 class OwnerAndAdminPermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Owner and admin have access."""
         authenticated = super().has_permission(request, view)
         return (
             authenticated and
             (
-                obj.profile.id == request.user.profile.id or
+                obj.profile_id == request.user.profile.id or
                 request.user.profile.type >= Profile.TYPES.admin
             )
         )
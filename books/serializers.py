@@ -1,6 +1,7 @@
 """Books app serializers."""
 
 from rest_framework import serializers
+from django.conf import settings
 from django.db import transaction
 
 from authentication.serializers import AuthorSerializer, SmallAuthorSerializer
@@ -40,6 +41,10 @@ class BookReviewShortSerializer(
         read_only=True,
         view_name='bookreview-detail',
     )
+    copy = serializers.CharField(
+        source='post.copy',
+        read_only=True,
+    )
 
     class Meta:
         model = BookReview
@@ -283,7 +288,29 @@ class BookChapterSerializer(
         exclude = []
 
 
+class ReadingListBooksSerializeMixin:
+    """First page of books of a ReadingList.
+
+    Books are represented from the `books_preview` entries prefetched by
+    `ReadingListViewSet`, or queried when not prefetched. The rest are paged
+    from the `books` route of the ReadingList.
+    """
+
+    def get_books(self, obj):
+        entries = getattr(obj, 'books_preview', None)
+        if entries is None:
+            entries = obj.books_page().select_related('book')[
+                :settings.READING_LIST_BOOKS_PREVIEW
+            ]
+        return SmallBookSerializer(
+            [entry.book for entry in entries],
+            many=True,
+            context=self.context,
+        ).data
+
+
 class ReadingListSerializer(
+        ReadingListBooksSerializeMixin,
         EmotableAggregateSerializerMixin,
         ProfileSerializeMixin,
         MetaInfoAvailabledSerializerMixin,
@@ -296,10 +323,11 @@ class ReadingListSerializer(
         read_only=True,
         view_name='readinglist-detail',
     )
-    books = SmallBookSerializer(
-        many=True,
+    books_count = serializers.IntegerField(
+        source='count_books',
         read_only=True,
     )
+    books = serializers.SerializerMethodField()
 
     class Meta:
         model = ReadingList
@@ -309,6 +337,7 @@ class ReadingListSerializer(
             'created_at',
             'modified_at',
             'deleted_at',
+            'books_count',
             'books',
             'emote_aggregate',
             'meta_info',
@@ -320,7 +349,10 @@ class ReadingListSerializer(
         exclude = []
 
 
-class SmallReadingListSerializer(serializers.HyperlinkedModelSerializer):
+class SmallReadingListSerializer(
+        ReadingListBooksSerializeMixin,
+        serializers.HyperlinkedModelSerializer,
+):
     """Small ReadingList serializer."""
 
     id = serializers.HyperlinkedRelatedField(
@@ -328,15 +360,17 @@ class SmallReadingListSerializer(serializers.HyperlinkedModelSerializer):
         read_only=True,
         view_name='readinglist-detail',
     )
-    books = SmallBookSerializer(
-        many=True,
+    books_count = serializers.IntegerField(
+        source='count_books',
         read_only=True,
     )
+    books = serializers.SerializerMethodField()
 
     class Meta:
         model = ReadingList
         read_only_fields = (
             'id',
+            'books_count',
             'books',
             'title',
         )
@@ -344,6 +378,19 @@ class SmallReadingListSerializer(serializers.HyperlinkedModelSerializer):
         exclude = []
 
 
+class ReadingListBooksQuerySerializer(serializers.Serializer):
+    """Parameters of a page of the books of a ReadingList."""
+
+    after = serializers.CharField(
+        required=False,
+    )
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.READING_LIST_BOOKS_PAGE_SIZE,
+        required=False,
+    )
+
+
 class BookReviewSerializer(
     EmotableAggregateSerializerMixin,
     ProfileSerializeMixin,
@@ -1,13 +1,21 @@
 """Tag signals."""
 import json
 
-from django.db.models.signals import pre_save
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
 from django.dispatch import receiver
 
+from authentication.models import Author
+from bookworm.cache import cache_version_changed
 from meta_info.models import MetaInfo
 from books.models import (
     Book,
     BookChapter,
+    BookProgress,
     ReadingList,
     BookReview,
 )
@@ -68,3 +76,52 @@ def pre_save_read_comments(sender, instance, *args, **kwargs):
     instance.post = Post.objects.create(
         copy=f'{Read.PREFIX}{instance.book.title}',
     )
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_save, sender=BookChapter)
+def post_save_search_vector(sender, instance, *args, **kwargs):
+    """Store the search vector of a saved instance."""
+    instance.search_vector_update()
+
+
+@receiver(post_save, sender=Book)
+def post_save_book_chapters_search_vector(sender, instance, *args, **kwargs):
+    """Chapter search vectors include the title of their Book."""
+    if kwargs.get('created'):
+        return
+    BookChapter.search_vector_update_related(
+        BookChapter.all_objects.filter(book=instance),
+        book=instance,
+    )
+
+
+@receiver(post_save, sender=Author)
+def post_save_author_books_search_vector(sender, instance, *args, **kwargs):
+    """Book search vectors include the name of their Author."""
+    Book.search_vector_update_related(
+        Book.all_objects.filter(author=instance),
+        author=instance,
+    )
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_save, sender=BookChapter)
+@receiver(post_save, sender=BookProgress)
+@receiver(post_save, sender=BookReview)
+@receiver(post_delete, sender=Book)
+@receiver(post_delete, sender=BookChapter)
+@receiver(post_delete, sender=BookProgress)
+@receiver(post_delete, sender=BookReview)
+def post_change_cache_version(sender, instance, *args, **kwargs):
+    """Invalidate cached representations of a changed model."""
+    cache_version_changed(sender)
+
+
+@receiver(m2m_changed)
+def m2m_changed_cache_version(sender, instance, action, *args, **kwargs):
+    """Invalidate cached representations of Books and Chapters related."""
+    if not action.startswith('post_'):
+        return
+    if isinstance(instance, (Book, BookChapter, BookReview, )):
+        cache_version_changed(instance.__class__)
@@ -1 +1,153 @@
 """Books test factories."""
+
+import factory
+from factory.django import DjangoModelFactory
+from factory.fuzzy import FuzzyFloat
+
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    post_delete,
+)
+
+from authentication.test import UserFactory, AuthorFactory
+from books.models import (
+    Book,
+    BookProgress,
+    BookChapter,
+    BookReview,
+    ReadingList,
+)
+from books.models_read import (
+    ConfirmReadQuestion,
+    ConfirmReadAnswer,
+    Read,
+)
+from posts.test import PostFactory
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class BookFactory(DjangoModelFactory):
+    """Factory for books."""
+
+    title = factory.Faker('sentence')
+    description = factory.Faker('paragraph')
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+    author = factory.SubFactory(AuthorFactory)
+    emote_aggregate = [0, 0, 0, 0, 0, 0, 0]
+
+    @factory.post_generation
+    def images(self, create, extracted, **kwargs):
+        """By default there are no Images supplied."""
+        if not create:
+            return
+        if extracted:
+            for image in extracted:
+                self.images.add(image)
+
+    class Meta:
+        model = Book
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class BookProgressFactory(DjangoModelFactory):
+    """Factory for book progress."""
+
+    percent = FuzzyFloat(0, 100)
+    start = 0
+    book = factory.SubFactory(BookFactory)
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+
+    class Meta:
+        model = BookProgress
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class BookChapterFactory(DjangoModelFactory):
+    """Factory for book chapters."""
+
+    title = factory.Faker('sentence')
+    book = factory.SubFactory(BookFactory)
+    progress = factory.SubFactory(
+        BookProgressFactory,
+        book=factory.SelfAttribute('..book'),
+    )
+
+    class Meta:
+        model = BookChapter
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class BookReviewFactory(DjangoModelFactory):
+    """Factory for book reviews."""
+
+    book = factory.SubFactory(BookFactory)
+    post = factory.SubFactory(PostFactory)
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+    emote_aggregate = [0, 0, 0, 0, 0, 0, 0]
+
+    class Meta:
+        model = BookReview
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class ReadingListFactory(DjangoModelFactory):
+    """Factory for reading lists."""
+
+    title = factory.Faker('sentence')
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+    emote_aggregate = [0, 0, 0, 0, 0, 0, 0]
+
+    @factory.post_generation
+    def books(self, create, extracted, **kwargs):
+        """By default there are no Books supplied."""
+        if not create:
+            return
+        if extracted:
+            for book in extracted:
+                self.add_book(book)
+
+    class Meta:
+        model = ReadingList
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class ConfirmReadQuestionFactory(DjangoModelFactory):
+    """Factory for read questions."""
+
+    copy = factory.Faker('sentence')
+    book = factory.SubFactory(BookFactory)
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+    emote_aggregate = [0, 0, 0, 0, 0, 0, 0]
+
+    class Meta:
+        model = ConfirmReadQuestion
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class ConfirmReadAnswerFactory(DjangoModelFactory):
+    """Factory for read answers."""
+
+    copy = factory.Faker('sentence')
+    question = factory.SubFactory(ConfirmReadQuestionFactory)
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+
+    class Meta:
+        model = ConfirmReadAnswer
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class ReadFactory(DjangoModelFactory):
+    """Factory for reads."""
+
+    book = factory.SubFactory(BookFactory)
+    answer = factory.SubFactory(
+        ConfirmReadAnswerFactory,
+        question__book=factory.SelfAttribute('...book'),
+    )
+    post = factory.SubFactory(PostFactory)
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+    emote_aggregate = [0, 0, 0, 0, 0, 0, 0]
+
+    class Meta:
+        model = Read
@@ -0,0 +1,60 @@
+"""Conditional GET tests of preserved resources."""
+
+from django.utils.http import http_date
+
+from books.test import ReadingListFactory
+
+
+def test_reading_list_detail_not_modified(client_profile):
+    """Requests matching the ETag are answered with 304."""
+    reading_list = ReadingListFactory()
+    url = f'/books/reading_list/{reading_list.pk}/'
+    response = client_profile.get(url)
+    assert response.status_code == 200
+    assert response['ETag'].startswith('W/')
+    assert response['Last-Modified']
+    not_modified = client_profile.get(
+        url,
+        HTTP_IF_NONE_MATCH=response['ETag'],
+    )
+    assert not_modified.status_code == 304
+
+
+def test_reading_list_detail_modified(client_profile):
+    """Saving an object changes its ETag."""
+    reading_list = ReadingListFactory(title='Before')
+    url = f'/books/reading_list/{reading_list.pk}/'
+    etag = client_profile.get(url)['ETag']
+    reading_list.title = 'After'
+    reading_list.save()
+    response = client_profile.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data['title'] == 'After'
+
+
+def test_reading_list_detail_if_modified_since(client_profile):
+    """Objects not modified since the date given are answered with 304."""
+    reading_list = ReadingListFactory()
+    url = f'/books/reading_list/{reading_list.pk}/'
+    since = http_date(reading_list.modified_at.timestamp() + 1)
+    response = client_profile.get(url, HTTP_IF_MODIFIED_SINCE=since)
+    assert response.status_code == 304
+
+
+def test_reading_list_list_soft_delete(client_profile):
+    """Soft deleting an object changes the ETag of the list."""
+    reading_lists = ReadingListFactory.create_batch(2)
+    response = client_profile.get('/books/reading_list/')
+    etag = response['ETag']
+    not_modified = client_profile.get(
+        '/books/reading_list/',
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert not_modified.status_code == 304
+    reading_lists[0].delete()
+    response = client_profile.get(
+        '/books/reading_list/',
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert response.status_code == 200
+    assert response['ETag'] != etag
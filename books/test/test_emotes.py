@@ -1,30 +1,89 @@
 """Emoting End to End tests."""
 
+import pytest
+
 from faker import Faker
 
+from authentication.test import UserFactory
+from books.models import Book
+from books.test import BookFactory
+from posts.exceptions import (
+    DuplicateEmoteValidationError,
+    UnemoteValidationError,
+)
+from posts.models import Emote
+
 fake = Faker()
 
 
-def test_book_emoted():
+def test_book_emoted(profile):
     """Create an Emote object for a Book."""
-    pass
+    book = BookFactory()
+    emote = book.emoted(Emote.EMOTES.heart, profile)
+    assert book.has_emoted(profile) == emote
 
 
-def test_book_emoted_already_emoted():
+def test_book_emoted_already_emoted(profile):
     """Emote on a Book the Profile has already emoted on fails response."""
-    pass
+    book = BookFactory()
+    book.emoted(Emote.EMOTES.heart, profile)
+    with pytest.raises(DuplicateEmoteValidationError):
+        book.emoted(Emote.EMOTES.heart, profile)
 
 
-def test_book_emoted_aggregation():
+def test_book_emoted_aggregation(profile):
     """Create an Emote object for a Book ensure aggregation correct."""
-    pass
+    book = BookFactory()
+    book.emoted(Emote.EMOTES.heart, profile)
+    book.emoted(Emote.EMOTES.heart, UserFactory().profile)
+    book.emoted(str(Emote.EMOTES.joy), profile)
+    expected = book.emote_aggregate
+    book.refresh_from_db()
+    assert book.emote_aggregate == expected
+    assert book.emote_aggregate[Emote.EMOTES.heart] == 1
+    assert book.emote_aggregate[Emote.EMOTES.joy] == 1
 
 
-def test_book_un_emote():
+def test_book_un_emote(profile):
     """Remove an Emote from a Book."""
-    pass
+    book = BookFactory()
+    book.emoted(Emote.EMOTES.heart, profile)
+    book.un_emote(profile)
+    book.refresh_from_db()
+    assert not book.has_emoted(profile)
+    assert book.emote_aggregate[Emote.EMOTES.heart] == 0
 
 
-def test_book_un_emote_not_emoted():
+def test_book_un_emote_not_emoted(profile):
     """Un-emote from a Book not emoted on fails."""
-    pass
+    book = BookFactory()
+    with pytest.raises(UnemoteValidationError):
+        book.un_emote(profile)
+
+
+def test_book_emote_aggregate_reconcile(profile):
+    """Drifted aggregates are repaired from stored Emote objects."""
+    book = BookFactory()
+    book.emoted(Emote.EMOTES.annoy, profile)
+    Book.objects.filter(pk=book.pk).update(emote_aggregate=[9] * 7)
+    modified_at = Book.objects.get(pk=book.pk).modified_at
+    assert Book.emote_aggregate_reconcile() == 1
+    book.refresh_from_db()
+    expected = [0] * len(Emote.EMOTES)
+    expected[Emote.EMOTES.annoy] = 1
+    assert book.emote_aggregate == expected
+    assert book.modified_at > modified_at
+
+
+def test_book_emote_aggregate_reconcile_batches(profile):
+    """Aggregates are repaired across batches, deleted Emotes uncounted."""
+    books = BookFactory.create_batch(3)
+    for book in books:
+        book.emoted(Emote.EMOTES.heart, profile)
+    books[1].un_emote(profile)
+    Book.objects.update(emote_aggregate=[0] * len(Emote.EMOTES))
+    assert Book.emote_aggregate_reconcile(batch_size=1) == 2
+    assert Book.emote_aggregate_reconcile(batch_size=1) == 0
+    aggregates = dict(Book.objects.values_list('pk', 'emote_aggregate'))
+    assert aggregates[books[0].pk][Emote.EMOTES.heart] == 1
+    assert aggregates[books[1].pk] == [0] * len(Emote.EMOTES)
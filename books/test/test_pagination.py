@@ -0,0 +1,82 @@
+"""Keyset pagination End to End tests."""
+
+import json
+from base64 import b64encode
+
+import pytest
+from django.test import override_settings
+from django.utils.timezone import now
+
+from books.models import Book
+from books.test import BookFactory
+
+
+def _walk(client, url, link='next'):
+    """Follow pagination links collecting the ids of every page."""
+    pages = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append([item['id'] for item in response.data['results']])
+        url = response.data[link]
+    return pages
+
+
+def test_book_list_pages(client_profile):
+    """Pages follow newest first without repeating or skipping Books."""
+    books = BookFactory.create_batch(5)
+    Book.objects.filter(pk__in=[book.pk for book in books[1:4]]).update(
+        created_at=now(),
+    )
+    pages = _walk(client_profile, '/books/book/?page_size=2')
+    assert [len(page) for page in pages] == [2, 2, 1]
+    ids = [book_id for page in pages for book_id in page]
+    assert len(set(ids)) == 5
+    assert all(any(str(book.id) in i for i in ids) for book in books)
+
+
+def test_book_list_previous_pages(client_profile):
+    """Previous links return the pages already seen."""
+    BookFactory.create_batch(5)
+    forward = []
+    url = '/books/book/?page_size=2'
+    while url:
+        response = client_profile.get(url)
+        forward.append([item['id'] for item in response.data['results']])
+        previous, url = response.data['previous'], response.data['next']
+    backward = _walk(client_profile, previous, link='previous')
+    assert backward == forward[-2::-1]
+
+
+@override_settings(PAGINATION_MAX_PAGE_SIZE=3)
+def test_book_list_page_size_capped(client_profile):
+    """Requested page sizes are capped to the server maximum."""
+    BookFactory.create_batch(5)
+    response = client_profile.get('/books/book/?page_size=100')
+    assert len(response.data['results']) == 3
+    assert response.data['next']
+    assert response.data['previous'] is None
+
+
+def test_book_list_invalid_cursor(client_profile):
+    """Invalid cursors are not found."""
+    response = client_profile.get('/books/book/?cursor=invalid')
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize('position', [
+    [{'dt': 'yesterday'}, 1],
+    [{'dt': 1}, 1],
+    [1, 1],
+    [{'dt': '2018-01-01T00:00:00+00:00'}, '1'],
+    [{'dt': '2018-01-01T00:00:00+00:00'}, None],
+    [{'dt': '2018-01-01T00:00:00+00:00'}],
+])
+def test_book_list_invalid_position(client_profile, position):
+    """Cursors with positions not comparable to the ordering are not found."""
+    cursor = b64encode(json.dumps({'p': position, 'r': 0}).encode())
+    response = client_profile.get(
+        '/books/book/',
+        {'cursor': cursor.decode('ascii')},
+    )
+    assert response.status_code == 404
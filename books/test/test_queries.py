@@ -0,0 +1,90 @@
+"""Query count regression tests for books endpoints."""
+
+from books.test import (
+    BookFactory,
+    BookProgressFactory,
+    BookChapterFactory,
+    BookReviewFactory,
+    ConfirmReadAnswerFactory,
+    ConfirmReadQuestionFactory,
+    ReadFactory,
+    ReadingListFactory,
+)
+from authentication.test import UserFactory
+from file_store.test import ImageFactory
+
+
+def test_book_list_queries(list_queries):
+    """Listing Books does not query per Book."""
+    book = BookFactory(images=[ImageFactory()])
+    BookReviewFactory(book=book)
+    expected = list_queries('/books/book/')
+    for book in BookFactory.create_batch(4, images=[ImageFactory()]):
+        BookReviewFactory(book=book)
+    assert list_queries('/books/book/') == expected
+
+
+def test_book_list_excludes_deleted_reviews(client_profile):
+    """Prefetched BookReviews exclude soft deleted objects."""
+    book = BookFactory()
+    BookReviewFactory(book=book).delete()
+    response = client_profile.get(f'/books/book/{book.id}/')
+    assert response.json()['reviews'] == []
+
+
+def test_book_progress_list_queries(list_queries):
+    """Listing BookProgress does not query per BookProgress."""
+    BookProgressFactory()
+    expected = list_queries('/books/progress/')
+    BookProgressFactory.create_batch(4)
+    assert list_queries('/books/progress/') == expected
+
+
+def test_book_review_list_queries(list_queries):
+    """Listing BookReviews does not query per BookReview."""
+    BookReviewFactory()
+    expected = list_queries('/books/review/')
+    BookReviewFactory.create_batch(4)
+    assert list_queries('/books/review/') == expected
+
+
+def test_book_chapter_list_queries(list_queries):
+    """Listing BookChapters does not query per BookChapter."""
+    BookChapterFactory()
+    expected = list_queries('/books/chapter/')
+    BookChapterFactory.create_batch(4)
+    assert list_queries('/books/chapter/') == expected
+
+
+def test_reading_list_list_queries(list_queries):
+    """Listing ReadingLists does not query per ReadingList or Book."""
+    ReadingListFactory(books=BookFactory.create_batch(2))
+    expected = list_queries('/books/reading_list/')
+    for index in range(4):
+        ReadingListFactory(books=BookFactory.create_batch(2))
+    assert list_queries('/books/reading_list/') == expected
+
+
+def test_read_question_list_queries(list_queries):
+    """Listing ConfirmReadQuestions does not query per question."""
+    ConfirmReadQuestionFactory()
+    expected = list_queries('/books/read_question/')
+    ConfirmReadQuestionFactory.create_batch(4)
+    assert list_queries('/books/read_question/') == expected
+
+
+def test_read_answer_list_queries(list_queries):
+    """Listing accepted ConfirmReadAnswers does not query per answer."""
+    ConfirmReadAnswerFactory(accepted_by=UserFactory().profile)
+    expected = list_queries('/books/read_answer/')
+    for index in range(4):
+        ConfirmReadAnswerFactory(accepted_by=UserFactory().profile)
+    assert list_queries('/books/read_answer/') == expected
+
+
+def test_read_list_queries(list_queries):
+    """Listing Reads does not query per Read for answers or posts."""
+    ReadFactory()
+    expected = list_queries('/books/read/')
+    ReadFactory.create_batch(4)
+    assert list_queries('/books/read/') == expected
@@ -0,0 +1,102 @@
+"""ReadingList books counted, previewed and paged in the order added."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from books.models import ReadingList
+from books.test import BookFactory, ReadingListFactory
+
+
+def books_url(reading_list, **params):
+    query = '&'.join(f'{key}={value}' for key, value in params.items())
+    return f'/books/reading_list/{reading_list.pk}/books/?{query}'
+
+
+def book_titles(data):
+    return [book['title'] for book in data]
+
+
+def test_reading_list_preview(client_profile, settings):
+    """Representations embed the count and first books added only."""
+    settings.READING_LIST_BOOKS_PREVIEW = 2
+    books = BookFactory.create_batch(3)
+    reading_list = ReadingListFactory(books=books)
+    ReadingListFactory(books=BookFactory.create_batch(3))
+    response = client_profile.get(f'/books/reading_list/{reading_list.pk}/')
+    assert response.status_code == 200
+    assert response.data['books_count'] == 3
+    assert book_titles(response.data['books']) == [
+        book.title for book in books[:2]
+    ]
+    response = client_profile.get('/books/reading_list/')
+    assert [
+        (item['books_count'], len(item['books']))
+        for item in response.data['results']
+    ] == [(3, 2), (3, 2)]
+
+
+def test_reading_list_deleted_books():
+    """Soft deleted books are neither counted nor previewed."""
+    books = BookFactory.create_batch(2)
+    reading_list = ReadingListFactory(books=books)
+    books[0].delete()
+    reading_list = ReadingList.objects.get(pk=reading_list.pk)
+    assert reading_list.count_books == 1
+    assert [entry.book for entry in reading_list.books_page()] == books[1:]
+
+
+def test_reading_list_str_counts_once():
+    """Representing a ReadingList as str counts its books once."""
+    reading_list = ReadingListFactory(books=BookFactory.create_batch(2))
+    reading_list = ReadingList.objects.get(pk=reading_list.pk)
+    with CaptureQueriesContext(connection) as context:
+        assert str(reading_list).endswith('- 2 books)')
+    assert len(context) == 1
+
+
+def test_reading_list_books_pages(client_profile):
+    """Books are paged after the last book of the previous page."""
+    books = BookFactory.create_batch(3)
+    reading_list = ReadingListFactory(books=books)
+    response = client_profile.get(books_url(reading_list, limit=2))
+    assert response.status_code == 200
+    assert book_titles(response.data['results']) == [
+        book.title for book in books[:2]
+    ]
+    assert response.data['next'] == str(books[1].pk)
+    response = client_profile.get(
+        books_url(reading_list, limit=2, after=response.data['next']),
+    )
+    assert book_titles(response.data['results']) == [books[2].title]
+    assert response.data['next'] is None
+    other = BookFactory()
+    response = client_profile.get(books_url(reading_list, after=other.pk))
+    assert response.status_code == 400
+
+
+def test_reading_list_books_queries(list_queries):
+    """Paging books does not query per Book."""
+    reading_list = ReadingListFactory(books=BookFactory.create_batch(2))
+    expected = list_queries(books_url(reading_list))
+    for book in BookFactory.create_batch(4):
+        reading_list.add_book(book)
+    assert list_queries(books_url(reading_list)) == expected
+
+
+def test_reading_list_add_book_changed(client_profile, profile):
+    """Adding a book represents it and marks the ReadingList modified."""
+    reading_list = ReadingListFactory(
+        profile=profile,
+        books=BookFactory.create_batch(1),
+    )
+    modified_at = ReadingList.objects.get(pk=reading_list.pk).modified_at
+    book = BookFactory()
+    response = client_profile.post(
+        f'/books/reading_list/{reading_list.pk}/add_book/',
+        {'book': str(book.pk)},
+    )
+    assert response.status_code == 200
+    assert response.data['reading_list']['books_count'] == 2
+    assert book.title in book_titles(response.data['reading_list']['books'])
+    reading_list = ReadingList.objects.get(pk=reading_list.pk)
+    assert reading_list.modified_at > modified_at
@@ -0,0 +1,135 @@
+"""Response caching tests of catalogue endpoints."""
+
+import pytest
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authentication.test import AuthorFactory
+from books.test import BookFactory, BookReviewFactory
+from file_store.test import ImageFactory
+from posts.models import Emote
+
+
+@pytest.fixture
+def response_cache(settings):
+    settings.RESPONSE_CACHE_ENABLED = True
+
+
+def test_book_list_cached(client_profile, response_cache):
+    """Repeated list requests are answered from the cache."""
+    BookFactory()
+    response = client_profile.get('/books/book/')
+    assert response.status_code == 200
+    assert response['ETag'].startswith('W/')
+    with CaptureQueriesContext(connection) as context:
+        cached = client_profile.get('/books/book/')
+    assert len(context) == 0
+    assert cached.data == response.data
+
+
+def test_book_detail_not_modified(client_profile, response_cache):
+    """Requests matching the ETag are answered with 304."""
+    book = BookFactory()
+    url = f'/books/book/{book.pk}/'
+    response = client_profile.get(url)
+    assert response['Last-Modified']
+    not_modified = client_profile.get(
+        url,
+        HTTP_IF_NONE_MATCH=response['ETag'],
+    )
+    assert not_modified.status_code == 304
+
+
+def test_book_cache_invalidated_by_save(client_profile, response_cache):
+    """Saving a Book invalidates cached representations."""
+    book = BookFactory(title='Before')
+    url = f'/books/book/{book.pk}/'
+    etag = client_profile.get(url)['ETag']
+    book.title = 'After'
+    book.save()
+    response = client_profile.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data['title'] == 'After'
+
+
+def test_book_cache_invalidated_by_author(client_profile, response_cache):
+    """Saving an Author invalidates Books representing the Author."""
+    book = BookFactory()
+    url = f'/books/book/{book.pk}/'
+    client_profile.get(url)
+    book.author.name_display = 'Renamed'
+    book.author.save()
+    response = client_profile.get(url)
+    assert response.data['author']['name_display'] == 'Renamed'
+
+
+def test_book_cache_invalidated_by_emote(
+        client_profile,
+        profile,
+        response_cache,
+):
+    """Emotes invalidate the aggregates of cached Books."""
+    book = BookFactory()
+    url = f'/books/book/{book.pk}/'
+    client_profile.get(url)
+    book.emoted(Emote.EMOTES.heart, profile)
+    response = client_profile.get(url)
+    assert response.data['emote_aggregate'][Emote.EMOTES.heart] == 1
+
+
+def test_book_cache_emote_per_object(client_profile, profile,
+                                     response_cache):
+    """Emotes rebuild the entries representing the object emoted only."""
+    book, other = BookFactory(), BookFactory()
+    other_url = f'/books/book/{other.pk}/'
+    client_profile.get(other_url)
+    with CaptureQueriesContext(connection) as context:
+        client_profile.get(other_url)
+    cached_queries = len(context)
+    listed = client_profile.get('/books/book/')
+    book.emoted(Emote.EMOTES.heart, profile)
+    with CaptureQueriesContext(connection) as context:
+        client_profile.get(other_url)
+    assert len(context) == cached_queries
+    response = client_profile.get('/books/book/')
+    assert response['ETag'] != listed['ETag']
+    assert {
+        item['title']: item['emote_aggregate'][Emote.EMOTES.heart]
+        for item in response.data['results']
+    } == {book.title: 1, other.title: 0}
+
+
+def test_book_cache_invalidated_by_review(client_profile, profile,
+                                          response_cache):
+    """Review copy and emotes are refreshed in cached Books."""
+    review = BookReviewFactory()
+    url = f'/books/book/{review.book.pk}/'
+    client_profile.get(url)
+    review.post.copy = 'Revised'
+    review.post.save()
+    review.emoted(Emote.EMOTES.heart, profile)
+    response = client_profile.get(url)
+    assert response.data['reviews'][0]['copy'] == 'Revised'
+    assert response.data['reviews'][0]['emote_aggregate'][
+        Emote.EMOTES.heart
+    ] == 1
+
+
+def test_book_cache_invalidated_by_image(client_profile, response_cache):
+    """Soft deleted Images leave cached Books."""
+    image = ImageFactory()
+    book = BookFactory(images=[image])
+    url = f'/books/book/{book.pk}/'
+    assert len(client_profile.get(url).data['images']) == 1
+    image.delete()
+    assert client_profile.get(url).data['images'] == []
+
+
+def test_author_cache_object_permission(client_profile, client_admin,
+                                        response_cache):
+    """Cached Authors are only answered once object permissions pass."""
+    author = AuthorFactory()
+    url = f'/authentication/author/{author.pk}/'
+    assert client_admin.get(url).status_code == 200
+    assert client_profile.get(url).status_code == 403
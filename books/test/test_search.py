@@ -0,0 +1,101 @@
+"""Full text search End to End tests."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authentication.test import AuthorFactory
+from books.models import Book, BookChapter
+from books.test import BookChapterFactory, BookFactory
+
+
+def _search(client, url, term):
+    response = client.get(url, {'search': term})
+    assert response.status_code == 200
+    return [item['id'] for item in response.data['results']]
+
+
+def test_book_search_ranked(client_profile):
+    """Title matches rank above description matches."""
+    described = BookFactory(
+        title='Ordinary',
+        description='A lighthouse keeper and the sea.',
+    )
+    titled = BookFactory(title='The Lighthouse', description='Waves.')
+    BookFactory(title='Unrelated', description='Nothing here.')
+    Book.search_vector_backfill()
+    results = _search(client_profile, '/books/book/', 'lighthouse')
+    assert len(results) == 2
+    assert str(titled.id) in results[0]
+    assert str(described.id) in results[1]
+
+
+def test_book_search_prefix(client_profile):
+    """Partial terms match as prefixes, every term must match."""
+    book = BookFactory(title='Lighthouse Keeper')
+    BookFactory(title='Lighthouse Painter')
+    Book.search_vector_backfill()
+    results = _search(client_profile, '/books/book/', 'light keep')
+    assert len(results) == 1
+    assert str(book.id) in results[0]
+
+
+def test_book_search_operators_ignored(client_profile):
+    """Search input is not interpreted as tsquery syntax."""
+    BookFactory(title='Lighthouse')
+    Book.search_vector_backfill()
+    results = _search(client_profile, '/books/book/', "light:* | !')(")
+    assert len(results) == 1
+
+
+def test_book_search_author_renamed(client_profile):
+    """Renaming an Author updates the search vectors of their Books."""
+    author = AuthorFactory(name_display='Mary Shelley')
+    book = BookFactory(author=author)
+    Book.search_vector_backfill()
+    assert _search(client_profile, '/books/book/', 'shelley')
+    author.name_display = 'Virginia Woolf'
+    author.save()
+    assert not _search(client_profile, '/books/book/', 'shelley')
+    results = _search(client_profile, '/books/book/', 'woolf')
+    assert str(book.id) in results[0]
+
+
+def test_book_search_backfill_missing_only():
+    """Backfilling missing vectors skips stored vectors."""
+    BookFactory.create_batch(3)
+    assert Book.search_vector_backfill(batch_size=2) == 3
+    BookFactory()
+    assert Book.search_vector_backfill(missing_only=True) == 1
+
+
+def test_book_chapter_search(client_profile):
+    """Chapters are searched by their title and Book title."""
+    chapter = BookChapterFactory(
+        title='Arrival',
+        book=BookFactory(title='Lighthouse'),
+    )
+    BookChapterFactory(title='Departure')
+    BookChapter.search_vector_backfill()
+    assert str(chapter.id) in _search(
+        client_profile,
+        '/books/chapter/',
+        'lighthouse',
+    )[0]
+
+
+def test_book_chapter_search_book_renamed(client_profile):
+    """Renaming a Book updates the vectors of its Chapters at once."""
+    book = BookFactory(title='Lighthouse')
+    chapter = BookChapterFactory(title='Arrival', book=book)
+    BookChapter.search_vector_backfill()
+    book.title = 'Harbour'
+    with CaptureQueriesContext(connection) as context:
+        book.save()
+    BookChapterFactory.create_batch(3, book=book)
+    book.title = 'Waves'
+    with CaptureQueriesContext(connection) as batch_context:
+        book.save()
+    assert len(batch_context) == len(context)
+    assert not _search(client_profile, '/books/chapter/', 'lighthouse')
+    results = _search(client_profile, '/books/chapter/', 'waves arrival')
+    assert str(chapter.id) in results[0]
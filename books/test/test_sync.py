@@ -0,0 +1,91 @@
+"""Delta sync End to End tests."""
+
+import pytest
+
+from books.test import BookFactory, ReadingListFactory
+
+
+@pytest.fixture
+def sync_settled(settings):
+    settings.SYNC_SETTLE_SECONDS = 0
+
+
+def sync_ids(results):
+    return [result['id'].rstrip('/').rsplit('/', 1)[-1] for result in results]
+
+
+def sync(client, **params):
+    response = client.get('/sync/', params)
+    assert response.status_code == 200
+    return response.data
+
+
+def test_sync_initial(client_profile, sync_settled):
+    """Syncing without a watermark returns every object."""
+    book = BookFactory()
+    reading_list = ReadingListFactory()
+    data = sync(client_profile)
+    assert data['complete']
+    assert data['watermark']
+    books = data['changes']['books.Book']['results']
+    assert str(book.pk) in sync_ids(books)
+    reading_lists = data['changes']['books.ReadingList']['results']
+    assert str(reading_list.pk) in sync_ids(reading_lists)
+
+
+def test_sync_modified_since(client_profile, sync_settled):
+    """Only objects modified since the watermark are returned."""
+    book, unchanged = BookFactory.create_batch(2)
+    watermark = sync(client_profile, models='books.Book')['watermark']
+    assert not sync(
+        client_profile,
+        models='books.Book',
+        watermark=watermark,
+    )['changes']['books.Book']['results']
+    book.title = 'Modified'
+    book.save()
+    changes = sync(
+        client_profile,
+        models='books.Book',
+        watermark=watermark,
+    )['changes']['books.Book']
+    assert sync_ids(changes['results']) == [str(book.pk)]
+    assert changes['results'][0]['title'] == 'Modified'
+
+
+def test_sync_soft_deleted(client_profile, sync_settled):
+    """Objects soft deleted since the watermark are listed as deleted."""
+    book = BookFactory()
+    watermark = sync(client_profile, models='books.Book')['watermark']
+    book.delete()
+    changes = sync(
+        client_profile,
+        models='books.Book',
+        watermark=watermark,
+    )['changes']['books.Book']
+    assert changes['results'] == []
+    assert sync_ids(changes['deleted']) == [str(book.pk)]
+
+
+def test_sync_pages(client_profile, sync_settled, settings):
+    """Changes are returned in bounded pages until complete."""
+    settings.SYNC_PAGE_SIZE = 2
+    BookFactory.create_batch(3)
+    first = sync(client_profile, models='books.Book')
+    assert not first['complete']
+    assert len(first['changes']['books.Book']['results']) == 2
+    second = sync(
+        client_profile,
+        models='books.Book',
+        watermark=first['watermark'],
+    )
+    assert second['complete']
+    assert len(second['changes']['books.Book']['results']) == 1
+
+
+def test_sync_invalid(client_profile):
+    """Invalid watermarks and unknown models are rejected."""
+    response = client_profile.get('/sync/', {'watermark': 'nope'})
+    assert response.status_code == 400
+    response = client_profile.get('/sync/', {'models': 'books.Nope'})
+    assert response.status_code == 400
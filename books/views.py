@@ -2,16 +2,28 @@
 
 import logging
 
-from rest_framework import (status, viewsets, filters, permissions, decorators)
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
+from rest_framework import (
+    status,
+    viewsets,
+    filters,
+    permissions,
+    decorators,
+    serializers,
+)
 from rest_framework.response import Response
 
 from authentication.models import Profile, Author
+from authentication.permissions import object_permission_cached
 from books.models import (
     Book,
     BookProgress,
     BookReview,
     BookChapter,
     ReadingList,
+    ReadingListBook,
 )
 from books.models_read import (
     ConfirmReadQuestion,
@@ -31,6 +43,7 @@ from books.serializers import (
     BookReviewSerializer,
     BookChapterSerializer,
     ReadingListSerializer,
+    ReadingListBooksQuerySerializer,
     ConfirmReadQuestionSerializer,
     ConfirmReadAnswerSerializer,
     ReadSerializer,
@@ -41,6 +54,13 @@ from books.exceptions import (
     CannotAcceptOwnAnswerValidation,
     BookDoesNotExistException,
 )
+from bookworm.mixins_searchable import SearchVectorFilter
+from bookworm.views import (
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
+    ResponseCacheViewSetMixin,
+    serializer_eager_lookups,
+)
 from posts.views import EmotableViewSet
 from file_store.views import ImagableViewSet
 from meta_info.views import LocalisableViewSetMixin
@@ -52,34 +72,38 @@ class BookViewSet(
         EmotableViewSet,
         ImagableViewSet,
         LocalisableViewSetMixin,
+        ResponseCacheViewSetMixin,
+        EagerLoadingViewSetMixin,
         viewsets.ModelViewSet,
 ):
     queryset = Book.objects.all()
     serializer_class = BookSerializer
-    filter_backends = (filters.SearchFilter,)
-    search_fields = (
-        'title',
-        'description',
-        'author__name_display',
-    )
+    filter_backends = (SearchVectorFilter,)
     permission_classes = (AnyReadOrElevatedPermission, )
+    cache_dependencies = (
+        'authentication.Author',
+        'authentication.ContactMethod',
+        'books.BookReview',
+        'posts.Post',
+        'file_store.Image',
+        'file_store.Document',
+        'meta_info.MetaInfo',
+        'meta_info.Tag',
+    )
 
     def perform_create(self, serializer):
         new_author_name = self.request.data.get('author') or None
         book = serializer.save()
         if new_author_name:
-            new_author = Author.objects.filter(
-                name_display__iexact=new_author_name,
-            ).first()
-            if not new_author:
-                new_author = Author.objects.create(
-                    name_display=new_author_name,
-                )
-            book.author = new_author
+            book.author = Author.objects.resolve(new_author_name, create=True)
             book.save()
 
 
-class BookProgressViewSet(viewsets.ModelViewSet):
+class BookProgressViewSet(
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
+        viewsets.ModelViewSet,
+):
     queryset = BookProgress.objects.all()
     serializer_class = BookProgressSerializer
     permission_classes = (AnyReadOwnerCreateEditPermission, )
@@ -88,6 +112,8 @@ class BookProgressViewSet(viewsets.ModelViewSet):
 class BookReviewViewSet(
         EmotableViewSet,
         LocalisableViewSetMixin,
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
         viewsets.ModelViewSet,
 ):
     queryset = BookReview.objects.all()
@@ -95,23 +121,32 @@ class BookReviewViewSet(
     filter_backends = (filters.SearchFilter,)
     search_fields = ('copy', 'book__title', )
     permission_classes = (AnyReadOwnerCreateEditPermission, )
+    eager_select_related = ('post', )
 
 
 class BookChapterViewSet(
         LocalisableViewSetMixin,
+        ResponseCacheViewSetMixin,
+        EagerLoadingViewSetMixin,
         viewsets.ModelViewSet,
 ):
     queryset = BookChapter.objects.all()
     serializer_class = BookChapterSerializer
-    filter_backends = (filters.SearchFilter,)
-    search_fields = ('title', 'book__title', )
+    filter_backends = (SearchVectorFilter,)
     permission_classes = (AnyReadOrElevatedPermission, )
+    cache_dependencies = (
+        'books.BookProgress',
+        'meta_info.MetaInfo',
+        'meta_info.Tag',
+    )
 
 
 class ReadingListViewSet(
     EmotableViewSet,
     ImagableViewSet,
     LocalisableViewSetMixin,
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
     viewsets.ModelViewSet,
 ):
     queryset = ReadingList.objects.all()
@@ -120,6 +155,44 @@ class ReadingListViewSet(
     search_fields = ('title', 'books__title', )
     permission_classes = (AnyReadOwnerCreateEditPermission, )
 
+    def books_queryset(self, entries):
+        """Entries of ReadingList books joined with their represented Book.
+
+        @param entries: QuerySet of ReadingListBook.
+
+        @return QuerySet
+        """
+        select_related, prefetch_related = serializer_eager_lookups(
+            SmallBookSerializer(),
+            Book,
+            prefix='book__',
+        )
+        return entries.select_related(
+            'book',
+            *select_related,
+        ).prefetch_related(*prefetch_related)
+
+    def eager_lookups(self):
+        """Prefetch the first page of books of each ReadingList only."""
+        select_related, prefetch_related = super().eager_lookups()
+        return select_related, prefetch_related + (
+            Prefetch(
+                'reading_list_books',
+                queryset=self.books_queryset(
+                    ReadingListBook.objects.first_pages(
+                        settings.READING_LIST_BOOKS_PREVIEW,
+                    ),
+                ),
+                to_attr='books_preview',
+            ),
+        )
+
+    def get_queryset(self):
+        """ReadingLists annotated with the number of their books."""
+        return super().get_queryset().annotate(
+            books_count=ReadingListBook.objects.count_books(),
+        )
+
     def _book_error_handle(self, reading_list, error):
         """Handle error responses from reading list.
 
@@ -207,9 +280,60 @@ class ReadingListViewSet(
             }
         )
 
+    @decorators.detail_route(methods=['get'])
+    def books(self, request, pk, **kwargs):
+        """Books of a ReadingList in the order added, a page at a time.
+
+        `after`: id of the last Book of the previous page.
+        `limit`: books per page, at most
+            `settings.READING_LIST_BOOKS_PAGE_SIZE`.
+        """
+        reading_list = self.get_object()
+        query = ReadingListBooksQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        after = None
+        if query.validated_data.get('after'):
+            try:
+                after = ReadingListBook.objects.filter(
+                    reading_list=reading_list,
+                    book=Book._meta.pk.to_python(
+                        query.validated_data['after'],
+                    ),
+                ).first()
+            except ValidationError:
+                pass
+            if after is None:
+                raise serializers.ValidationError({
+                    'after': 'Book not found in this reading list.',
+                })
+        limit = query.validated_data.get(
+            'limit',
+            settings.READING_LIST_BOOKS_PAGE_SIZE,
+        )
+        entries = list(self.books_queryset(
+            reading_list.books_page(after=after),
+        )[:limit + 1])
+        return Response(
+            {
+                'status': 'ok',
+                'ok': '🖖',
+                'results': SmallBookSerializer(
+                    [entry.book for entry in entries[:limit]],
+                    many=True,
+                    context={'request': self.request},
+                ).data,
+                'next': (
+                    str(entries[limit - 1].book.pk) if len(entries) > limit
+                    else None
+                ),
+            }
+        )
+
 
 class ConfirmReadQuestionViewSet(
         EmotableViewSet,
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
         viewsets.ModelViewSet,
 ):
     queryset = ConfirmReadQuestion.objects.all()
@@ -221,6 +345,7 @@ class ConfirmReadQuestionViewSet(
 
 class ConfirmReadAnswerPermission(permissions.IsAuthenticated):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Users may only update their own answers.
 
@@ -230,7 +355,7 @@ class ConfirmReadAnswerPermission(permissions.IsAuthenticated):
         if authenticated:
             if request.user.profile.type >= Profile.TYPES.admin:
                 return True
-        return authenticated and obj.profile.id == request.user.profile.id
+        return authenticated and obj.profile_id == request.user.profile.id
 
 
 class ConfirmReadAnswerAcceptPermission(permissions.IsAuthenticated):
@@ -245,6 +370,7 @@ class ConfirmReadAnswerAcceptPermission(permissions.IsAuthenticated):
                 request.user.profile.type >= Profile.TYPES.elevated
         )
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Users may not accept their own answer.
 
@@ -254,10 +380,14 @@ class ConfirmReadAnswerAcceptPermission(permissions.IsAuthenticated):
         if authenticated:
             if request.user.profile.type >= Profile.TYPES.admin:
                 return True
-        return authenticated and obj.profile.id != request.user.profile.id
+        return authenticated and obj.profile_id != request.user.profile.id
 
 
-class ConfirmReadAnswerViewSet(viewsets.ModelViewSet):
+class ConfirmReadAnswerViewSet(
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
+        viewsets.ModelViewSet,
+):
     queryset = ConfirmReadAnswer.objects.all()
     serializer_class = ConfirmReadAnswerSerializer
     permission_classes = (ConfirmReadAnswerPermission, )
@@ -291,8 +421,11 @@ class ConfirmReadAnswerViewSet(viewsets.ModelViewSet):
 
 class ReadViewSet(
         EmotableViewSet,
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
         viewsets.ModelViewSet,
 ):
     queryset = Read.objects.all()
     serializer_class = ReadSerializer
     permission_classes = (permissions.IsAuthenticated, ReadOnlyPermission, )
+    eager_select_related = ('answer', )
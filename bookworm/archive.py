@@ -0,0 +1,250 @@
+"""Archival and purging of soft deleted rows of preserved models."""
+
+import gzip
+import json
+import logging
+import os
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.db import connections, models, router, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from bookworm.encoders import HashidJSONEncoder
+
+
+logger = logging.getLogger(__name__)
+
+
+def archive_relations(model):
+    """Relations of other tables holding foreign keys to a model.
+
+    @:param model: Model class.
+
+    @:return tuple of lists of ManyToMany through relations, and relations
+        of other models referencing the model.
+    """
+    through = []
+    referencing = []
+    fields = model._meta.get_fields(include_hidden=True)
+    through_models = {
+        field.remote_field.through if field.concrete else field.through
+        for field in fields if field.many_to_many
+    }
+    for relation in fields:
+        if not relation.auto_created or relation.concrete:
+            continue
+        if not (relation.one_to_many or relation.one_to_one):
+            continue
+        if relation.related_model in through_models:
+            through.append(relation)
+        else:
+            referencing.append(relation)
+    return through, referencing
+
+
+def archive_expired(model, cutoff):
+    """Soft deleted objects past retention.
+
+    @:param model: PreserveModelMixin Model class.
+    @:param cutoff: datetime objects deleted before are expired.
+
+    @:return QuerySet
+    """
+    return model.deleted_objects.filter(deleted_at__lt=cutoff)
+
+
+def archive_purgeable(model, cutoff):
+    """Expired objects no longer referenced by other objects.
+
+    Objects still referenced, deleted or not, are kept to preserve the
+    integrity of foreign keys.
+
+    @:return QuerySet
+    """
+    queryset = archive_expired(model, cutoff)
+    for index, relation in enumerate(archive_relations(model)[1]):
+        alias = f'archive_referenced_{index}'
+        queryset = queryset.annotate(**{
+            alias: Exists(relation.related_model._base_manager.filter(**{
+                relation.field.name: OuterRef('pk'),
+            })),
+        }).filter(**{alias: False})
+    return queryset
+
+
+def archive_write(label, records):
+    """Write records as compressed JSON lines to the archive.
+
+    @:param label: str path of the archive within `settings.ARCHIVE_ROOT`.
+    @:param records: list of dict.
+
+    @:return tuple of str path and int bytes written.
+    """
+    directory = os.path.join(settings.ARCHIVE_ROOT, *label.split('.'))
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(
+        directory,
+        f'{timezone.now():%Y%m%dT%H%M%S%f}.jsonl.gz',
+    )
+    with gzip.open(path, 'wt', encoding='utf-8') as archive_file:
+        for record in records:
+            archive_file.write(json.dumps(record, cls=HashidJSONEncoder))
+            archive_file.write('\n')
+    return path, os.path.getsize(path)
+
+
+def _table_bytes(cursor, table, column, ids):
+    """Storage size of the rows of a table with ids."""
+    cursor.execute(
+        f'SELECT COALESCE(SUM(pg_column_size(t.*)), 0) FROM {table} t '
+        f'WHERE {column} = ANY(%s)',
+        [ids],
+    )
+    return cursor.fetchone()[0]
+
+
+def _table_delete(cursor, table, column, ids):
+    """Delete rows of a table with ids, bypassing soft deletion."""
+    cursor.execute(f'DELETE FROM {table} WHERE {column} = ANY(%s)', [ids])
+    return cursor.rowcount
+
+
+def _archive_batches(queryset, batch_size, archive):
+    """Archive batches of a queryset until exhausted.
+
+    Archived rows are deleted, each batch is queried from the start until
+    a batch deletes no rows.
+
+    @:return dict of totals.
+    """
+    report = {'rows': 0, 'bytes_reclaimed': 0, 'bytes_archived': 0}
+    while True:
+        with transaction.atomic(using=queryset.db):
+            rows, reclaimed, archived = archive(queryset[:batch_size])
+        if not rows:
+            return report
+        report['rows'] += rows
+        report['bytes_reclaimed'] += reclaimed
+        report['bytes_archived'] += archived
+
+
+def archive_release_files(objects, file_fields):
+    """Delete the files of purged objects from their storage.
+
+    Content addressed files remove a reference, the stored file goes with
+    the last reference.
+
+    @:param objects: list of Model objects purged.
+    @:param file_fields: list of FileField of the model.
+    """
+    for instance in objects:
+        for field in file_fields:
+            name = field.value_from_object(instance).name
+            if name:
+                field.storage.delete(name)
+
+
+def archive_through(model, relation, cutoff, batch_size):
+    """Archive and purge ManyToMany rows of expired objects.
+
+    @:param model: PreserveModelMixin Model class.
+    @:param relation: ManyToOneRel of the through model.
+    @:param cutoff: datetime objects deleted before are expired.
+    @:param batch_size: int rows per batch.
+
+    @:return dict of rows and bytes reclaimed and archived.
+    """
+    through = relation.related_model
+    table = connections[router.db_for_write(through)].ops.quote_name(
+        through._meta.db_table,
+    )
+    queryset = through._base_manager.filter(**{
+        f'{relation.field.name}__in': archive_expired(model, cutoff).values(
+            'pk',
+        ),
+    }).order_by('pk').values()
+
+    def archive(batch):
+        rows = list(batch)
+        if not rows:
+            return 0, 0, 0
+        ids = [row['id'] for row in rows]
+        path, archived = archive_write(through._meta.label_lower, rows)
+        with connections[batch.db].cursor() as cursor:
+            reclaimed = _table_bytes(cursor, table, 'id', ids)
+            deleted = _table_delete(cursor, table, 'id', ids)
+        logger.info(f'{through._meta.label}: {deleted} rows to {path}.')
+        return deleted, reclaimed, archived
+
+    return _archive_batches(queryset, batch_size, archive)
+
+
+def archive_model(model, retention_days=None, batch_size=None):
+    """Archive and purge soft deleted objects of a model past retention.
+
+    ManyToMany rows of expired objects are purged first, objects still
+    referenced by other objects are kept. Files of purged objects are
+    deleted from their storage.
+
+    @:param model: PreserveModelMixin Model class.
+    @:param retention_days: int days objects are kept after deletion.
+    @:param batch_size: int rows per batch.
+
+    @:return dict of rows and bytes reclaimed and archived.
+    """
+    if retention_days is None:
+        retention_days = settings.ARCHIVE_RETENTION_DAYS
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    report = {
+        'rows': 0,
+        'through_rows': 0,
+        'bytes_reclaimed': 0,
+        'bytes_archived': 0,
+    }
+    for relation in archive_relations(model)[0]:
+        through_report = archive_through(model, relation, cutoff, batch_size)
+        report['through_rows'] += through_report['rows']
+        report['bytes_reclaimed'] += through_report['bytes_reclaimed']
+        report['bytes_archived'] += through_report['bytes_archived']
+    connection = connections[router.db_for_write(model)]
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(model._meta.pk.column)
+    fields = [field.name for field in model._meta.local_concrete_fields]
+    file_fields = [
+        field for field in model._meta.local_concrete_fields
+        if isinstance(field, models.FileField)
+    ]
+    queryset = archive_purgeable(model, cutoff).order_by('pk')
+
+    def archive(batch):
+        objects = list(batch)
+        if not objects:
+            return 0, 0, 0
+        ids = [int(instance.pk) for instance in objects]
+        records = serializers.serialize('python', objects, fields=fields)
+        path, archived = archive_write(model._meta.label_lower, records)
+        with connections[batch.db].cursor() as cursor:
+            reclaimed = _table_bytes(cursor, table, column, ids)
+            deleted = _table_delete(cursor, table, column, ids)
+        archive_release_files(objects, file_fields)
+        logger.info(f'{model._meta.label}: {deleted} rows to {path}.')
+        return deleted, reclaimed, archived
+
+    model_report = _archive_batches(queryset, batch_size, archive)
+    report['rows'] = model_report['rows']
+    report['bytes_reclaimed'] += model_report['bytes_reclaimed']
+    report['bytes_archived'] += model_report['bytes_archived']
+    return report
+
+
+def archive_models():
+    """Models archived, from `settings.ARCHIVE_MODELS`.
+
+    @:return list of Model classes.
+    """
+    return [apps.get_model(label) for label in settings.ARCHIVE_MODELS]
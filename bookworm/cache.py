@@ -0,0 +1,165 @@
+"""Caching of serialized representations keyed by model versions."""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+from django.db import transaction
+
+
+def response_cache():
+    """Cache of serialized representations, `settings.RESPONSE_CACHE`.
+
+    @:return BaseCache
+    """
+    return caches[settings.RESPONSE_CACHE]
+
+
+@checks.register(checks.Tags.caches)
+def response_cache_check(app_configs, **kwargs):
+    """Response cache is enabled only on a cache shared between processes.
+
+    Versions bumped in a local memory cache are not seen by other processes,
+    which would keep answering stale representations until the timeout.
+
+    @:return list of CheckMessage
+    """
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return []
+    backend = settings.CACHES[settings.RESPONSE_CACHE]['BACKEND']
+    if not backend.endswith('.LocMemCache'):
+        return []
+    return [checks.Error(
+        'RESPONSE_CACHE_ENABLED requires a cache shared between processes.',
+        hint='Set CACHE_URL, ie. rediscache://redis:6379/1, or disable '
+             'RESPONSE_CACHE_ENABLED.',
+        obj=settings.RESPONSE_CACHE,
+        id='bookworm.E001',
+    )]
+
+
+def cache_version_key(model):
+    """Cache key of the version of a model.
+
+    @:return str
+    """
+    return f'bookworm:version:{model._meta.label_lower}'
+
+
+def _cache_versions(keys):
+    """Current versions cached under keys.
+
+    Versions missing from the cache, never bumped or evicted, start from
+    the current time so entries cached under an evicted version are never
+    matched again.
+
+    @:param keys: list of str version keys.
+
+    @:return tuple of int
+    """
+    cache = response_cache()
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            versions[key] = cache.get(key)
+    return tuple(versions[key] for key in keys)
+
+
+def cache_versions(models):
+    """Current versions of models.
+
+    @:param models: iterable of Model classes.
+
+    @:return tuple of int
+    """
+    return _cache_versions([cache_version_key(model) for model in models])
+
+
+def cache_object_version_key(model, pk):
+    """Cache key of the version of an object.
+
+    @:return str
+    """
+    return f'bookworm:version:{model._meta.label_lower}:{int(pk)}'
+
+
+def cache_object_versions(model, pks):
+    """Current versions of objects of a model.
+
+    Object versions are bumped by changes reflected in the representation
+    of a single object, such as its emote aggregate, rather than the model.
+
+    @:param model: Model class.
+    @:param pks: iterable of primary keys.
+
+    @:return tuple of int
+    """
+    return _cache_versions([
+        cache_object_version_key(model, pk) for pk in pks
+    ])
+
+
+def _cache_version_bump(key):
+    cache = response_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def cache_version_bump(model):
+    """Invalidate every representation depending on a model.
+
+    @:param model: Model class changed.
+    """
+    _cache_version_bump(cache_version_key(model))
+
+
+def cache_version_changed(model):
+    """Bump the version of a model changed now and once committed.
+
+    The bump after commit discards representations cached by concurrent
+    requests reading before the change was committed.
+
+    @:param model: Model class changed.
+    """
+    cache_version_bump(model)
+    transaction.on_commit(lambda: cache_version_bump(model))
+
+
+def cache_object_version_changed(model, pk):
+    """Bump the version of an object changed now and once committed.
+
+    @:param model: Model class of the object changed.
+    @:param pk: primary key of the object changed.
+    """
+    key = cache_object_version_key(model, pk)
+    _cache_version_bump(key)
+    transaction.on_commit(lambda: _cache_version_bump(key))
+
+
+def response_cache_key(request, action, versions):
+    """Cache key of a representation requested.
+
+    Representations vary by the host their hyperlinks are built with,
+    the query parameters and the language requested.
+
+    @:param request: Request object.
+    @:param action: str view set action.
+    @:param versions: tuple of int versions of the models represented.
+
+    @:return str
+    """
+    query = sorted(request.query_params.lists())
+    variant = repr((
+        versions,
+        request.get_host(),
+        request.path,
+        query,
+        request.META.get('HTTP_ACCEPT_LANGUAGE', ''),
+    ))
+    digest = hashlib.sha1(variant.encode()).hexdigest()
+    return f'bookworm:response:{action}:{digest}'
@@ -0,0 +1,39 @@
+"""Claiming rows of a queue table among concurrent workers."""
+
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models.sql import UpdateQuery
+
+
+def queryset_claim(queryset, limit, **values):
+    """Claim rows of a queryset by updating them in one statement.
+
+    Up to `limit` rows, in the ordering of the queryset, are updated by one
+    `UPDATE ... WHERE pk IN (SELECT ... LIMIT n) RETURNING pk`. A row being
+    claimed concurrently is waited on until that claim commits, then checked
+    against the filters of the queryset again and left out once it no
+    longer matches. Supported by Postgres before `SKIP LOCKED` (9.5).
+
+    @:param queryset: QuerySet of rows available to claim.
+    @:param limit: int maximum rows claimed.
+    @:param values: field values set on the rows claimed.
+
+    @:return list of int primary keys of the rows claimed.
+    """
+    claimed = queryset.filter(
+        pk__in=queryset.values('pk')[:limit],
+    )
+    query = claimed.query.chain(UpdateQuery)
+    query.add_update_values(values)
+    query._annotations = None
+    try:
+        sql, params = query.get_compiler(claimed.db).as_sql()
+    except EmptyResultSet:
+        return []
+    if not sql:
+        return []
+    connection = connections[claimed.db]
+    pk = connection.ops.quote_name(queryset.model._meta.pk.column)
+    with connection.cursor() as cursor:
+        cursor.execute(f'{sql} RETURNING {pk}', params)
+        return [row[0] for row in cursor.fetchall()]
@@ -121,3 +121,23 @@ class PublishedUnauthorisedValidation(ValidationError):
             'message': f'Object {access_from} not authorised.',
         })
         logger.error(self)
+
+
+class SyncWatermarkValidationError(ValidationError):
+
+    def __init__(self, watermark):
+        super().__init__({
+            'code': 'sync_watermark_invalid',
+            'message': f'Watermark {watermark} is not valid.',
+        })
+        logger.error(self)
+
+
+class SyncModelUnknownValidationError(ValidationError):
+
+    def __init__(self, label):
+        super().__init__({
+            'code': 'sync_model_unknown',
+            'message': f'Model {label} is not synchronised.',
+        })
+        logger.error(self)
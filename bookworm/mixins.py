@@ -64,8 +64,10 @@ class PreserveModelMixin(ModifiedModelMixin):
     def delete(self, *args, **kwargs):
         pre_delete.send(sender=self.__class__, instance=self)
         self.deleted_at = now()
+        self.modified_at = self.deleted_at
         self.__class__.objects.filter(id=self.id).update(
             deleted_at=self.deleted_at,
+            modified_at=self.modified_at,
         )
         post_delete.send(sender=self.__class__, instance=self)
 
@@ -1,12 +1,16 @@
 """General mixins."""
 
-import json
 import logging
 
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import ugettext_lazy as _
 
-from meta_info.models import HashedTag, MetaInfo
+from meta_info.models import HashedTag
+from meta_info.models_publication import (
+    PublicationGrant,
+    PublishedSnapshot,
+    PublishJob,
+)
 from bookworm.exceptions import (
     PublishableObjectNotDefined,
     PublishableValidationError,
@@ -30,11 +34,11 @@ class PublishableModelMixin(models.Model):
     PUBLISHED_GLOBAL_KEY = 'global-keyword'
     PUBLISHED_KEYWORDS = [PUBLISHED_GLOBAL_KEY, 'global', ]
 
-    published_meta = models.ForeignKey(
-        MetaInfo,
-        related_name='published_meta+',
+    published_snapshot = models.ForeignKey(
+        PublishedSnapshot,
+        related_name='+',
         verbose_name=_('Published Content'),
-        on_delete=models.CASCADE,
+        on_delete=models.SET_NULL,
         blank=True,
         null=True,
     )
@@ -44,7 +48,41 @@ class PublishableModelMixin(models.Model):
 
     @property
     def published_at(self):
-        return self.published_meta.created_at if self.published_meta else None
+        if not self.published_snapshot:
+            return None
+        return self.published_snapshot.created_at
+
+    @classmethod
+    def published_subject_key(cls, object_accessing):
+        """Key identifying an object accessing published content.
+
+        @:param object_accessing: object wanting access to the published
+            data, or one of `PUBLISHED_KEYWORDS`.
+
+        @:return str
+        """
+        if object_accessing in cls.PUBLISHED_KEYWORDS:
+            return cls.PUBLISHED_GLOBAL_KEY
+        return f'{object_accessing.id}-{object_accessing.__class__}'
+
+    @classmethod
+    def published_visible(cls, queryset, object_accessing):
+        """Filter objects to those published to `object_accessing`.
+
+        @:param queryset: QuerySet of this model.
+        @:param object_accessing: object wanting access to the published
+            data.
+
+        @:return QuerySet
+        """
+        return queryset.filter(
+            published_snapshot__isnull=False,
+            pk__in=PublicationGrant.objects.visible_ids(
+                cls,
+                cls.published_subject_key(object_accessing),
+                cls.PUBLISHED_GLOBAL_KEY,
+            ),
+        )
 
     def published_content(self, object_accessing):
         """Fetch the published information for this object.
@@ -56,44 +94,29 @@ class PublishableModelMixin(models.Model):
         @:raises PublishedUnauthorisedValidation
         @:raises NoPublishedDataError
         """
-        if object_accessing in PublishableModelMixin.PUBLISHED_KEYWORDS:
-            key = PublishableModelMixin.PUBLISHED_GLOBAL_KEY
-        else:
-            key = f'{object_accessing.id}-{object_accessing.__class__}'
-        access = self.has_published_naive_access(key)
-        if not access:
+        if not self.has_published_access(object_accessing):
             raise PublishedUnauthorisedValidation(object_accessing)
-        try:
-            return self.published_meta.json.output
-        except AttributeError:
+        if not self.published_snapshot:
             raise NoPublishedDataError(self)
+        return self.published_snapshot.output
 
-    def has_published_naive_access(self, object_id):
-        """Identify if the `object_id` can access this object.
+    def has_published_access(self, object_accessing):
+        """Identify if `object_accessing` can access this object.
 
-        Will return `False, None` if self has no published data.
+        Denied access overrides access granted to the object or globally.
 
-        @:param object_id, str of identifier requesting access.
+        @:param object_accessing: object wanting access to the published
+            data, or one of `PUBLISHED_KEYWORDS`.
 
-        @:return bool, int, str
-        Integer is the index within the tuple access is granted.
-        Last str returned is the `object_id` matching access.
+        @:return bool, False if self has no published data.
         """
         if not self.published_at:
-            return False, None, object_id
-        published_access = self.published_meta.json.access
-        try:
-            id_index = published_access.denied_flat.index(object_id)
-            return False, id_index, object_id
-        except ValueError:
-            pass
-        if self.PUBLISHED_GLOBAL_KEY in published_access.granted_flat:
-            object_id = self.PUBLISHED_GLOBAL_KEY
-        try:
-            id_index = published_access.granted_flat.index(object_id)
-            return True, id_index, object_id
-        except ValueError:
-            return False, None, object_id
+            return False
+        return PublicationGrant.objects.has_access(
+            self,
+            self.published_subject_key(object_accessing),
+            self.PUBLISHED_GLOBAL_KEY,
+        )
 
     def validate_publish(self, granted_list, block_list):
         """Validate the publishable state of this object with parameters.
@@ -146,8 +169,8 @@ class PublishableModelMixin(models.Model):
             'denied_flat': denied_flat,
         }
 
-    def publish(self, granted_list, block_list):
-        """Publish this object.
+    def publish(self, granted_list, block_list, profile=None):
+        """Publish this object in the background.
 
         management of what is access and blocked:
         (
@@ -157,47 +180,79 @@ class PublishableModelMixin(models.Model):
 
         @:param granted_list, tuple as described above.
         @:param block_list, tuple as described above.
+        @:param profile: Profile publishing.
+
+        @:return PublishJob run once the current transaction commits.
 
         @:raises PublishableObjectNotDefined
+        @:raises PublishableValidationError
         """
         self.validate_publish(granted_list, block_list)
-        output_source = {
-            'source': {
-                'id': self.id,
-                'class': self.__class__,
-            },
-            'access': self._generate_access_json(granted_list, block_list),
-            'output': getattr(self, 'Publishable').serializer(self).data,
-        }
-        if self.published_meta:
-            self.published_meta.delete()
-        self.published_meta = MetaInfo.objects.create(
-            json=output_source,
-            copy=json.dumps(output_source),
+        return PublishJob.objects.job_create(
+            self,
+            profile,
+            granted_list,
+            block_list,
         )
-        self.save()
+
+    def publish_now(self, granted_list, block_list):
+        """Publish this object.
+
+        No version is stored when neither the output nor the access changed
+        since the latest version.
+
+        @:param granted_list, tuple as described in `publish`.
+        @:param block_list, tuple as described in `publish`.
+
+        @:return tuple of PublishedSnapshot and bool created.
+
+        @:raises PublishableObjectNotDefined
+        @:raises PublishableValidationError
+        """
+        self.validate_publish(granted_list, block_list)
+        access = self._generate_access_json(granted_list, block_list)
+        output = getattr(self, 'Publishable').serializer(self).data
+        with transaction.atomic():
+            self.__class__._default_manager.select_for_update().filter(
+                pk=self.pk,
+            ).first()
+            snapshot, created = PublishedSnapshot.objects.snapshot_create(
+                self,
+                access,
+                output,
+            )
+            if created or self.published_snapshot_id != snapshot.pk:
+                self.published_snapshot = snapshot
+                self.save()
+                PublicationGrant.objects.grants_replace(
+                    self,
+                    access['granted_flat'],
+                    access['denied_flat'],
+                )
+        return snapshot, created
 
     def unpublish(self):
         """Un-publish this object."""
-        if not self.published_meta:
+        if not self.published_snapshot:
             raise PublishableValidationError(
                 self,
                 ('No published data to un-publish', ),
             )
-        self.published_meta.delete()
-        self.published_meta = None
+        self.published_snapshot = None
         self.save()
+        PublicationGrant.objects.for_object(self).delete()
 
     def unpublish_purge(self):
-        """Un-publishes content and removes all output history."""
+        """Un-publishes content and removes all output history.
+
+        Versions published are kept without their output.
+        """
         self.unpublish()
-        published_meta_list = MetaInfo.all_objects.filter(
-            json__source__id=self.id,
-            json__source__class=self.__class__,
-        )
-        for item in list(published_meta_list):
-            if not hasattr(item.json, 'output'):
-                continue
-            item.json.pop('output')
-            item.copy = json.dumps(item.json)
-            item.save()
+        PublishedSnapshot.objects.purge(self)
+
+    def published_history(self):
+        """Versions of this object published, latest first.
+
+        @:return QuerySet of PublishedSnapshot without their output.
+        """
+        return PublishedSnapshot.objects.history(self)
@@ -0,0 +1,246 @@
+"""Full text search mixins."""
+
+import logging
+import re
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
+from django.db import models, transaction
+from django.db.models import (
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    TextField,
+    Value,
+)
+from django.db.models.functions import Cast
+from django.template import loader
+from django.utils.translation import ugettext_lazy as _
+from rest_framework import filters
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchableModelMixin(models.Model):
+    """Maintain a weighted full text search vector for a model.
+
+    Models define `SEARCH_VECTOR_FIELDS` as a tuple of attribute path and
+    weight, paths spanning relations are dotted: `('author.name', 'B')`.
+    Models should define a GinIndex on `search_vector` within their Meta.
+    """
+
+    SEARCH_VECTOR_FIELDS = ()
+
+    search_vector = SearchVectorField(
+        verbose_name=_('Search vector'),
+        editable=False,
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def search_vector_related(cls):
+        """Relations traversed to build the search vector.
+
+        @:return tuple of select_related lookups.
+        """
+        return tuple(
+            '__'.join(path.split('.')[:-1])
+            for path, weight in cls.SEARCH_VECTOR_FIELDS if '.' in path
+        )
+
+    def _search_vector_text(self, path):
+        """Resolve the text of a dotted attribute path.
+
+        @:param path: str attribute path from this object.
+
+        @:return str
+        """
+        value = self
+        for attribute in path.split('.'):
+            value = getattr(value, attribute, None)
+            if value is None:
+                return ''
+        return str(value)
+
+    @classmethod
+    def _search_vector_combine(cls, texts):
+        """Weighted search vector of a text expression per field.
+
+        @:param texts: list of expressions in `SEARCH_VECTOR_FIELDS` order.
+
+        @:return SearchVector
+        """
+        vectors = [
+            SearchVector(
+                text,
+                config=settings.SEARCH_VECTOR_CONFIG,
+                weight=weight,
+            )
+            for text, (path, weight) in zip(texts, cls.SEARCH_VECTOR_FIELDS)
+        ]
+        expression = vectors[0]
+        for vector in vectors[1:]:
+            expression = expression + vector
+        return expression
+
+    def search_vector_expression(self):
+        """Weighted search vector of this objects current values.
+
+        Related values are supplied as parameters so the vector can be
+        stored with a single UPDATE without joins.
+
+        @:return SearchVector
+        """
+        return self._search_vector_combine([
+            Value(self._search_vector_text(path), output_field=TextField())
+            for path, weight in self.SEARCH_VECTOR_FIELDS
+        ])
+
+    def search_vector_update(self):
+        """Store the search vector for this object."""
+        self.__class__.all_objects.filter(pk=self.pk).update(
+            search_vector=self.search_vector_expression(),
+        )
+
+    @classmethod
+    def search_vector_update_related(cls, queryset, **related):
+        """Store search vectors of objects sharing related objects at once.
+
+        Fields of the objects are read from their own columns, values of
+        the related objects supplied are parameters, so the vectors of a
+        whole related set are stored with a single UPDATE without joins.
+
+        @:param queryset: QuerySet of objects to store the vectors of.
+        @:param related: related objects keyed by the first attribute of
+            every dotted path of `SEARCH_VECTOR_FIELDS`.
+
+        @:return int number of objects updated.
+        """
+        texts = []
+        for path, weight in cls.SEARCH_VECTOR_FIELDS:
+            attribute, _, related_path = path.partition('.')
+            if not related_path:
+                texts.append(Cast(F(attribute), TextField()))
+                continue
+            value = related[attribute]
+            for related_attribute in related_path.split('.'):
+                value = getattr(value, related_attribute, None)
+                if value is None:
+                    break
+            texts.append(Value(
+                '' if value is None else str(value),
+                output_field=TextField(),
+            ))
+        return queryset.update(
+            search_vector=cls._search_vector_combine(texts),
+        )
+
+    @classmethod
+    def searchable_models(cls):
+        """All concrete models mixing in SearchableModelMixin.
+
+        @:return list of Model classes.
+        """
+        return [
+            model for model in apps.get_models()
+            if issubclass(model, SearchableModelMixin)
+        ]
+
+    @classmethod
+    def search_vector_backfill(cls, batch_size=500, missing_only=False):
+        """Store search vectors of all objects in batched transactions.
+
+        @:param batch_size: int objects updated per transaction.
+        @:param missing_only: bool only update objects without a vector.
+
+        @:return int number of objects updated.
+        """
+        queryset = cls.all_objects.select_related(
+            *cls.search_vector_related()
+        ).annotate(
+            keyset_pk=ExpressionWrapper(F('pk'), output_field=IntegerField()),
+        ).order_by('pk')
+        if missing_only:
+            queryset = queryset.filter(search_vector__isnull=True)
+        updated = 0
+        last_pk = None
+        while True:
+            batch_queryset = queryset
+            if last_pk is not None:
+                batch_queryset = batch_queryset.filter(keyset_pk__gt=last_pk)
+            batch = list(batch_queryset[:batch_size])
+            if not batch:
+                break
+            with transaction.atomic():
+                for instance in batch:
+                    instance.search_vector_update()
+            updated += len(batch)
+            last_pk = batch[-1].keyset_pk
+            logger.info(f'{cls._meta.label}: {updated} search vectors stored.')
+        return updated
+
+
+class PrefixSearchQuery(SearchQuery):
+    """Search query matching every term supplied as a prefix.
+
+    Terms are reduced to word characters so user input cannot form
+    tsquery operators.
+    """
+
+    def __init__(self, value, **kwargs):
+        self.terms = re.findall(r'\w+', value)
+        super().__init__(
+            ' & '.join(f'{term}:*' for term in self.terms),
+            **kwargs,
+        )
+
+    def as_sql(self, compiler, connection):
+        params = [self.value]
+        template = 'to_tsquery(%s)'
+        if self.config:
+            config_sql, config_params = compiler.compile(self.config)
+            template = f'to_tsquery({config_sql}::regconfig, %s)'
+            params = config_params + params
+        if self.invert:
+            template = f'!!({template})'
+        return template, params
+
+
+class SearchVectorFilter(filters.SearchFilter):
+    """Ranked full text search against a model search vector.
+
+    Replaces `SearchFilter` for views of SearchableModelMixin models using
+    the same `?search=` parameter, results are ordered by rank.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = ' '.join(self.get_search_terms(request))
+        query = PrefixSearchQuery(
+            terms,
+            config=settings.SEARCH_VECTOR_CONFIG,
+        )
+        if not query.terms:
+            return queryset
+        return queryset.filter(
+            search_vector=query,
+        ).annotate(
+            search_rank=SearchRank(F('search_vector'), query),
+        ).order_by('-search_rank', 'pk')
+
+    def to_html(self, request, queryset, view):
+        term = self.get_search_terms(request)
+        return loader.get_template(self.template).render({
+            'param': self.search_param,
+            'term': term[0] if term else '',
+        })
@@ -0,0 +1,124 @@
+"""Migration operations and utilities for preserved models."""
+
+from django.apps import apps
+from django.db import models
+from django.db.backends.utils import truncate_name
+from django.db.migrations.operations.base import Operation
+
+from bookworm.mixins import PreserveModelMixin
+
+
+PRESERVED_CONDITION = 'deleted_at IS NULL'
+
+
+class AddPartialIndex(Operation):
+    """Add an index limited to rows matching a condition.
+
+    The index is not part of the model state, autodetected migrations will
+    not attempt to alter or remove it.
+    """
+
+    reduces_to_sql = True
+    reversible = True
+
+    def __init__(self, model_name, fields, name,
+                 condition=PRESERVED_CONDITION):
+        self.model_name = model_name
+        self.fields = list(fields)
+        self.name = name
+        self.condition = condition
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        columns = ', '.join(
+            schema_editor.quote_name(model._meta.get_field(field).column)
+            for field in self.fields
+        )
+        schema_editor.execute(
+            f'CREATE INDEX {schema_editor.quote_name(self.name)} '
+            f'ON {schema_editor.quote_name(model._meta.db_table)} '
+            f'({columns}) WHERE {self.condition}'
+        )
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        schema_editor.execute(
+            f'DROP INDEX IF EXISTS {schema_editor.quote_name(self.name)}'
+        )
+
+    def describe(self):
+        return (
+            f'Create partial index {self.name} on field(s) '
+            f'{", ".join(self.fields)} of model {self.model_name} '
+            f'where {self.condition}'
+        )
+
+
+def preserved_models(app_label=None):
+    """Concrete models mixing in PreserveModelMixin.
+
+    @:param app_label: str limit to models of an app.
+
+    @:return list of Model classes.
+    """
+    return [
+        model for model in apps.get_models()
+        if issubclass(model, PreserveModelMixin) and
+        (app_label is None or model._meta.app_label == app_label)
+    ]
+
+
+def preserved_index_fields(model):
+    """Foreign key and indexed lookup fields queried on live rows.
+
+    Text fields are excluded, their values may exceed a B-tree entry.
+
+    @:param model: PreserveModelMixin Model class.
+
+    @:return list of field names.
+    """
+    return [
+        field.name for field in model._meta.concrete_fields
+        if not field.primary_key and not field.unique and
+        not isinstance(field, models.TextField) and (
+            isinstance(field, models.ForeignKey) or field.db_index
+        )
+    ]
+
+
+def preserved_index_name(model, field_name):
+    """Name of a partial index on live rows of a field.
+
+    @:return str
+    """
+    column = model._meta.get_field(field_name).column
+    return truncate_name(f'{model._meta.db_table}_{column}_live', 63)
+
+
+def preserved_index_operations(model, existing=()):
+    """Partial index operations for a model not already migrated.
+
+    @:param model: PreserveModelMixin Model class.
+    @:param existing: names of partial indexes in existing migrations.
+
+    @:return list of AddPartialIndex
+    """
+    operations = []
+    for field_name in preserved_index_fields(model):
+        name = preserved_index_name(model, field_name)
+        if name not in existing:
+            operations.append(AddPartialIndex(
+                model_name=model._meta.model_name,
+                fields=[field_name],
+                name=name,
+            ))
+    return operations
@@ -0,0 +1,248 @@
+"""Keyset pagination for list endpoints."""
+
+import json
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from datetime import datetime
+
+from django.conf import settings
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    FieldError,
+    ValidationError,
+)
+from django.db.models import (
+    DateTimeField,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Q,
+)
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import ugettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(CursorPagination):
+    """Paginate by the values of the ordering of the last object seen.
+
+    Pages are fetched with a `WHERE (created_at, id) < (...)` style bound
+    so deep pages cost the same as the first, served by composite indexes.
+    Querysets already ordered, ie. ranked search results, are paginated by
+    their own ordering with the primary key appended as a tie breaker.
+    """
+
+    ordering = ('-created_at', '-pk', )
+    primary_key_fields = ('pk', 'id', )
+    page_size_query_param = 'page_size'
+    invalid_cursor_message = _('Invalid cursor')
+
+    @property
+    def max_page_size(self):
+        return settings.PAGINATION_MAX_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        """Ordering of the queryset with the primary key as a tie breaker.
+
+        @:return tuple of field names prefixed '-' when descending.
+        """
+        ordering = tuple(queryset.query.order_by) or self.ordering
+        if not all(
+                isinstance(field, str) and '__' not in field
+                for field in ordering
+        ):
+            ordering = self.ordering
+        if not any(
+                field.lstrip('-') in self.primary_key_fields
+                for field in ordering
+        ):
+            ordering += ('-pk', )
+        return ordering
+
+    def _position_field(self, field):
+        """Field compared for a position, hashed keys compare as integers.
+
+        @:return str
+        """
+        field = field.lstrip('-')
+        if field in self.primary_key_fields:
+            return 'keyset_pk'
+        return field
+
+    def _ordering_fields(self, queryset):
+        """Fields of the ordering, annotations by their output field.
+
+        @:return dict of field name to Field, unknown names are left out.
+        """
+        fields = {}
+        for field in self.ordering:
+            name = field.lstrip('-')
+            try:
+                if name in queryset.query.annotations:
+                    fields[name] = queryset.query.annotations[
+                        name
+                    ].output_field
+                else:
+                    fields[name] = queryset.model._meta.get_field(name)
+            except (FieldDoesNotExist, FieldError):
+                continue
+        return fields
+
+    def _position_value(self, field, value):
+        """Value of a cursor position compared for a field of the ordering.
+
+        @:param field: str field ordered by.
+        @:param value: value decoded from the cursor.
+
+        @:return value
+
+        @:raises ValueError when the value cannot be compared to the field.
+        """
+        name = field.lstrip('-')
+        if name in self.primary_key_fields:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError(f'Position of {name} is not an integer.')
+            return value
+        model_field = self.ordering_fields.get(name)
+        if isinstance(value, dict) or isinstance(model_field, DateTimeField):
+            position = parse_datetime(value['dt'])
+            if position is None:
+                raise ValueError(f'Position of {name} is not a datetime.')
+            return position
+        if value is None or isinstance(value, list):
+            raise ValueError(f'Position of {name} is not comparable.')
+        if model_field is None:
+            return value
+        try:
+            return model_field.to_python(value)
+        except ValidationError as error:
+            raise ValueError(error)
+
+    def decode_cursor(self, request):
+        """Position and direction of the cursor requested.
+
+        Every value of the position is validated against the field of the
+        ordering it is compared to.
+
+        @:return tuple of list of values and bool reversed, or None.
+
+        @:raises NotFound
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            cursor = json.loads(b64decode(encoded.encode('ascii')).decode())
+            if len(cursor['p']) != len(self.ordering):
+                raise ValueError('Position does not match the ordering.')
+            position = [
+                self._position_value(field, value)
+                for field, value in zip(self.ordering, cursor['p'])
+            ]
+            return position, bool(cursor['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance, reverse):
+        """Link to the page beyond an object in a direction.
+
+        @:param instance: object the page starts after.
+        @:param reverse: bool for the previous page.
+
+        @:return str url
+        """
+        position = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip('-'))
+            if isinstance(value, datetime):
+                value = {'dt': value.isoformat()}
+            elif field.lstrip('-') in self.primary_key_fields:
+                value = int(value)
+            position.append(value)
+        encoded = b64encode(json.dumps({
+            'p': position,
+            'r': int(reverse),
+        }).encode()).decode('ascii')
+        return replace_query_param(
+            self.base_url,
+            self.cursor_query_param,
+            encoded,
+        )
+
+    def _position_filter(self, position, reverse):
+        """Filter for objects ordered beyond a position.
+
+        @:return Q
+        """
+        seek = Q()
+        for index, field in enumerate(self.ordering):
+            descending = field.startswith('-') != reverse
+            lookup = 'lt' if descending else 'gt'
+            bound = Q(**{
+                f'{self._position_field(field)}__{lookup}': position[index],
+            })
+            for previous, value in zip(self.ordering[:index], position):
+                bound &= Q(**{self._position_field(previous): value})
+            seek |= bound
+        first = self.ordering[0]
+        lookup = 'lte' if first.startswith('-') != reverse else 'gte'
+        return Q(**{
+            f'{self._position_field(first)}__{lookup}': position[0],
+        }) & seek
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.ordering_fields = self._ordering_fields(queryset)
+        cursor = self.decode_cursor(request)
+        position, reverse = cursor if cursor else (None, False)
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(
+                field[1:] if field.startswith('-') else f'-{field}'
+                for field in ordering
+            )
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.annotate(
+                keyset_pk=ExpressionWrapper(
+                    F('pk'),
+                    output_field=IntegerField(),
+                ),
+            ).filter(self._position_filter(position, reverse))
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ]))
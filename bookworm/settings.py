@@ -45,6 +45,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_celery_results',
     'rest_framework_swagger',
     'rest_framework.authtoken',
@@ -131,6 +132,11 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Users are loaded with their Profile once per request
+AUTHENTICATION_BACKENDS = [
+    'authentication.authentication.ProfileModelBackend',
+]
+
 # Django rest framework configurations
 # http://www.django-rest-framework.org/
 
@@ -143,12 +149,17 @@ REST_FRAMEWORK = {
 
     # Only allow Token Authentication for API in production
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_jwt.authentication.JSONWebTokenAuthentication',
+        'authentication.authentication.ProfileJSONWebTokenAuthentication',
         'rest_framework.authentication.BasicAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         # 'rest_framework.authentication.TokenAuthentication',
     ),
 
+    # Keyset pagination of list endpoints, clients may request `page_size`
+    # up to `PAGINATION_MAX_PAGE_SIZE`.
+    'DEFAULT_PAGINATION_CLASS': 'bookworm.pagination.KeysetCursorPagination',
+    'PAGE_SIZE': env.int('PAGINATION_PAGE_SIZE', default=50),
+
     # ... other configurations
     'DEFAULT_FILTER_BACKENDS': (
         'rest_framework.filters.SearchFilter',
@@ -156,15 +167,20 @@ REST_FRAMEWORK = {
     )
 }
 
+PAGINATION_MAX_PAGE_SIZE = env.int(
+    'PAGINATION_MAX_PAGE_SIZE',
+    default=200,
+)
+
 JWT_AUTH = {
     'JWT_ENCODE_HANDLER':
         'rest_framework_jwt.utils.jwt_encode_handler',
 
     'JWT_DECODE_HANDLER':
-        'rest_framework_jwt.utils.jwt_decode_handler',
+        'authentication.tasks.jwt_decode_handler',
 
     'JWT_PAYLOAD_HANDLER':
-        'rest_framework_jwt.utils.jwt_payload_handler',
+        'authentication.tasks.jwt_payload_handler',
 
     'JWT_PAYLOAD_GET_USER_ID_HANDLER':
         'rest_framework_jwt.utils.jwt_get_user_id_from_payload_handler',
@@ -191,6 +207,19 @@ JWT_AUTH = {
     'JWT_AUTH_COOKIE': None,
 }
 
+# Per process cache of decrypted JWT secrets of each Profile and Token,
+# dropped by every process on rotation when JWT_SECRET_CACHE is shared, ie.
+# Redis configured by CACHE_URL, else expiring after the timeout.
+JWT_SECRET_CACHE_TIMEOUT = env.int(
+    'JWT_SECRET_CACHE_TIMEOUT',
+    default=300,
+)
+JWT_SECRET_CACHE_SIZE = env.int(
+    'JWT_SECRET_CACHE_SIZE',
+    default=10000,
+)
+JWT_SECRET_CACHE = 'default'
+
 SWAGGER_SETTINGS = {
     'USE_SESSION_AUTH': False,
     'SECURITY_DEFINITIONS': {
@@ -242,9 +271,169 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'alerts.tasks.send_sms_alert',
         'schedule': crontab(minute='15', hour='19'),
     },
+    'emote_aggregate_reconcile': {
+        'task': 'posts.tasks.emote_aggregate_reconcile_task',
+        'schedule': crontab(minute='30', hour='3'),
+    },
+    'archive_preserved': {
+        'task': 'meta_info.tasks.archive_preserved_task',
+        'schedule': crontab(minute='0', hour='4', day_of_week='sunday'),
+    },
+    'notifications_send': {
+        'task': 'authentication.tasks.notifications_send_task',
+        'schedule': crontab(minute='*'),
+    },
 }
 
 
+# Image size variants, bounds of (width, height) images are fit within
+IMAGE_SIZES = (
+    (1200, 1200),
+    (600, 600),
+    (300, 300),
+    (100, 100),
+)
+IMAGE_QUALITY = env.int(
+    'IMAGE_QUALITY',
+    default=85,
+)
+IMAGE_SIZES_PROCESSES = env.int(
+    'IMAGE_SIZES_PROCESSES',
+    default=os.cpu_count() or 1,
+)
+
+# Caches, ie. CACHE_URL=rediscache://redis:6379/1 with django-redis
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+# Serialized representations cached by model versions, off by default on a
+# local memory cache where version bumps would reach only the writing process
+RESPONSE_CACHE = 'default'
+RESPONSE_CACHE_ENABLED = env.bool(
+    'RESPONSE_CACHE_ENABLED',
+    default=not CACHES[RESPONSE_CACHE]['BACKEND'].endswith('.LocMemCache'),
+)
+RESPONSE_CACHE_TIMEOUT = env.int(
+    'RESPONSE_CACHE_TIMEOUT',
+    default=60 * 60,
+)
+
+# Document streaming and resumable uploads
+FILE_UPLOAD_HANDLERS = [
+    'file_store.uploadhandlers.DigestMemoryFileUploadHandler',
+    'file_store.uploadhandlers.DigestTemporaryFileUploadHandler',
+]
+DOCUMENT_UPLOAD_ROOT = env(
+    'DOCUMENT_UPLOAD_ROOT',
+    default=os.path.join(BASE_DIR, 'uploads'),
+)
+DOCUMENT_UPLOAD_MAX_SIZE = env.int(
+    'DOCUMENT_UPLOAD_MAX_SIZE',
+    default=512 * 1024 * 1024,
+)
+DOCUMENT_UPLOAD_CHUNK_MAX_SIZE = env.int(
+    'DOCUMENT_UPLOAD_CHUNK_MAX_SIZE',
+    default=16 * 1024 * 1024,
+)
+DOCUMENT_STREAM_CHUNK_SIZE = env.int(
+    'DOCUMENT_STREAM_CHUNK_SIZE',
+    default=64 * 1024,
+)
+
+# Fetching of files from their source_url
+FETCH_MAX_SIZE = env.int(
+    'FETCH_MAX_SIZE',
+    default=64 * 1024 * 1024,
+)
+FETCH_CONNECT_TIMEOUT = env.int(
+    'FETCH_CONNECT_TIMEOUT',
+    default=5,
+)
+FETCH_TIMEOUT = env.int(
+    'FETCH_TIMEOUT',
+    default=60,
+)
+FETCH_CHUNK_SIZE = 64 * 1024
+FETCH_POOL_HOSTS = env.int(
+    'FETCH_POOL_HOSTS',
+    default=32,
+)
+FETCH_HOST_CONCURRENCY = env.int(
+    'FETCH_HOST_CONCURRENCY',
+    default=4,
+)
+FETCH_MAX_RETRIES = env.int(
+    'FETCH_MAX_RETRIES',
+    default=5,
+)
+FETCH_RETRY_BACKOFF = env.int(
+    'FETCH_RETRY_BACKOFF',
+    default=30,
+)
+FETCH_RETRY_BACKOFF_MAX = env.int(
+    'FETCH_RETRY_BACKOFF_MAX',
+    default=3600,
+)
+FETCH_USER_AGENT = env(
+    'FETCH_USER_AGENT',
+    default='bookworm-fetch/1.0',
+)
+FETCH_MAX_REDIRECTS = env.int(
+    'FETCH_MAX_REDIRECTS',
+    default=5,
+)
+# Networks fetched from though not globally routable, ie. 10.1.0.0/16
+FETCH_ALLOWED_NETWORKS = env.list(
+    'FETCH_ALLOWED_NETWORKS',
+    default=[],
+)
+# Per host fetch slots, shared by workers when the cache is
+FETCH_CACHE = 'default'
+
+# Archival of soft deleted rows past retention
+ARCHIVE_ROOT = env(
+    'ARCHIVE_ROOT',
+    default=os.path.join(BASE_DIR, 'archive'),
+)
+ARCHIVE_RETENTION_DAYS = env.int(
+    'ARCHIVE_RETENTION_DAYS',
+    default=90,
+)
+ARCHIVE_BATCH_SIZE = env.int(
+    'ARCHIVE_BATCH_SIZE',
+    default=1000,
+)
+ARCHIVE_MODELS = env.list(
+    'ARCHIVE_MODELS',
+    default=[
+        'posts.Emote',
+        'authentication.Token',
+        'meta_info.MetaInfo',
+        'meta_info.LocaliseTag',
+    ],
+)
+
+# Delta synchronisation of clients by modified_at watermarks, `/sync/`
+SYNC_VIEW_SETS = {
+    'authentication.Profile': 'authentication.views.ProfileViewSet',
+    'authentication.Author': 'authentication.views.AuthorViewSet',
+    'books.Book': 'books.views.BookViewSet',
+    'books.BookProgress': 'books.views.BookProgressViewSet',
+    'books.BookReview': 'books.views.BookReviewViewSet',
+    'books.ReadingList': 'books.views.ReadingListViewSet',
+    'posts.Post': 'posts.views.PostViewSet',
+}
+SYNC_PAGE_SIZE = env.int(
+    'SYNC_PAGE_SIZE',
+    default=500,
+)
+SYNC_SETTLE_SECONDS = env.int(
+    'SYNC_SETTLE_SECONDS',
+    default=5,
+)
+
+
 # Django celery results configurations
 CELERY_RESULT_BACKEND = 'django-db'
 
@@ -254,6 +443,47 @@ SMS_URL = env('SMS_URL', default="https://textbelt.com/text")
 SMS_TOKEN = env('SMS_TOKEN', default="textbelt")
 
 
+# Email delivery over SMTP
+EMAIL_HOST = env('EMAIL_HOST', default='localhost')
+EMAIL_PORT = env.int('EMAIL_PORT', default=25)
+EMAIL_HOST_USER = env('EMAIL_HOST_USER', default='')
+EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')
+EMAIL_USE_TLS = env.bool('EMAIL_USE_TLS', default=False)
+DEFAULT_FROM_EMAIL = env(
+    'DEFAULT_FROM_EMAIL',
+    default='bookworm@localhost',
+)
+
+
+# Notification outbox, drained in batches by a worker after each action
+# and every minute for Notifications retried.
+NOTIFICATION_BATCH_SIZE = env.int(
+    'NOTIFICATION_BATCH_SIZE',
+    default=200,
+)
+NOTIFICATION_MAX_ATTEMPTS = env.int(
+    'NOTIFICATION_MAX_ATTEMPTS',
+    default=5,
+)
+NOTIFICATION_RETRY_SECONDS = env.int(
+    'NOTIFICATION_RETRY_SECONDS',
+    default=300,
+)
+NOTIFICATION_SMS_TIMEOUT = env.int(
+    'NOTIFICATION_SMS_TIMEOUT',
+    default=10,
+)
+# Seconds before Notifications claimed by a lost worker are claimed again.
+NOTIFICATION_CLAIM_SECONDS = env.int(
+    'NOTIFICATION_CLAIM_SECONDS',
+    default=3600,
+)
+NOTIFICATION_EMAIL_SUBJECT = env(
+    'NOTIFICATION_EMAIL_SUBJECT',
+    default='Bookworm notifications',
+)
+
+
 # Hash field salts and alphabet
 HASHID_FIELD_SALT = env(
     'HASHID_FIELD_SALT',
@@ -351,6 +581,10 @@ SALT_METAINFO_LOCALISETAG = env(
     'SALT_METAINFO_LOCALISETAG',
     default='l!?"pzK*2|`n81EW&-+#mPJeNyu>0o6[',
 )
+SALT_METAINFO_PUBLISHJOB = env(
+    'SALT_METAINFO_PUBLISHJOB',
+    default='q8`Vn]M2"x;Tz!4cHo,R0|w+Gs&Je*7D',
+)
 SALT_POSTS_EMOTE = env(
     'SALT_POSTS_EMOTE',
     default='cioP>D^|E*21?"R5&.)rg[8,W@76+VUu',
@@ -367,6 +601,10 @@ SALT_FILESTORE_DOCUMENT = env(
     'SALT_FILESTORE_DOCUMENT',
     default='kA&F$R`q5`38fc^ZF;Hn3~x-K~-@m:P(',
 )
+SALT_FILESTORE_DOCUMENTUPLOAD = env(
+    'SALT_FILESTORE_DOCUMENTUPLOAD',
+    default='Zr8u!2Wq;Pd^e7Lk`y5@Nc0-Ms3:Hv9F',
+)
 
 
 AES_KEY_AUTHENTICATION = env(
@@ -397,6 +635,43 @@ INVITE_SELF_TIMEOUT = env.int(
     'INVITE_SELF_TIMEOUT',
     default=1,
 )
+INVITE_BULK_MAX_SIZE = env.int(
+    'INVITE_BULK_MAX_SIZE',
+    default=500,
+)
+
+SEARCH_VECTOR_CONFIG = env(
+    'SEARCH_VECTOR_CONFIG',
+    default='english',
+)
+
+AUTHOR_RESOLVE_SIMILARITY = env.float(
+    'AUTHOR_RESOLVE_SIMILARITY',
+    default=0.6,
+)
+AUTHOR_RESOLVE_CACHE_SIZE = env.int(
+    'AUTHOR_RESOLVE_CACHE_SIZE',
+    default=1024,
+)
+
+EMOTE_BULK_LIMIT = env.int(
+    'EMOTE_BULK_LIMIT',
+    default=500,
+)
+POST_THREAD_PAGE_SIZE = env.int(
+    'POST_THREAD_PAGE_SIZE',
+    default=100,
+)
+# Books embedded in ReadingList representations, the rest are paged from
+# the ReadingList `books` route.
+READING_LIST_BOOKS_PREVIEW = env.int(
+    'READING_LIST_BOOKS_PREVIEW',
+    default=10,
+)
+READING_LIST_BOOKS_PAGE_SIZE = env.int(
+    'READING_LIST_BOOKS_PAGE_SIZE',
+    default=50,
+)
 
 
 DEFAULT_LANGUAGE = 'en'
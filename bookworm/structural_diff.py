@@ -0,0 +1,61 @@
+"""Structural differences between JSON documents."""
+
+
+def structure_diff(old, new):
+    """Difference transforming the document `old` into `new`.
+
+    Objects are compared key by key, recursively; lists and other values
+    are replaced whole when they differ.
+
+    @:param old: JSON compatible value.
+    @:param new: JSON compatible value.
+
+    @:return dict of `set`, `unset` and `patch` when both are objects,
+        `replace` otherwise, or None when equal.
+    """
+    if old == new:
+        return None
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return {'replace': new}
+    diff = {}
+    changed = {
+        key: value for key, value in new.items()
+        if key not in old or (
+            old[key] != value and
+            not (isinstance(old[key], dict) and isinstance(value, dict))
+        )
+    }
+    if changed:
+        diff['set'] = changed
+    removed = [key for key in old if key not in new]
+    if removed:
+        diff['unset'] = removed
+    patches = {
+        key: structure_diff(old[key], value) for key, value in new.items()
+        if key in old and key not in changed and old[key] != value
+    }
+    if patches:
+        diff['patch'] = patches
+    return diff
+
+
+def structure_patch(value, diff):
+    """Apply a difference from `structure_diff` to a document.
+
+    @:param value: JSON compatible value the difference was made from.
+    @:param diff: dict difference, or None when unchanged.
+
+    @:return JSON compatible value, `value` itself is left unchanged.
+    """
+    if diff is None:
+        return value
+    if 'replace' in diff:
+        return diff['replace']
+    patched = {
+        key: item for key, item in value.items()
+        if key not in diff.get('unset', [])
+    }
+    patched.update(diff.get('set', {}))
+    for key, patch in diff.get('patch', {}).items():
+        patched[key] = structure_patch(patched[key], patch)
+    return patched
@@ -0,0 +1,99 @@
+"""Delta synchronisation of preserved models by modified_at watermarks."""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import timedelta
+
+from django.db.models import ExpressionWrapper, F, IntegerField, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from bookworm.exceptions import SyncWatermarkValidationError
+
+
+def sync_watermarks_decode(token):
+    """Watermarks of each model encoded in a token.
+
+    @:param token: str encoded by `sync_watermarks_encode`, or None.
+
+    @:return dict of str model label to tuple of datetime and int pk.
+
+    @:raises SyncWatermarkValidationError
+    """
+    if not token:
+        return {}
+    try:
+        encoded = json.loads(urlsafe_b64decode(token.encode('ascii')).decode())
+        watermarks = {}
+        for label, (modified_at, pk) in encoded.items():
+            modified_at = parse_datetime(modified_at)
+            if modified_at is None:
+                raise ValueError(label)
+            watermarks[label] = (modified_at, int(pk))
+        return watermarks
+    except (TypeError, ValueError, AttributeError):
+        raise SyncWatermarkValidationError(token)
+
+
+def sync_watermarks_encode(watermarks):
+    """Token of the watermarks of each model.
+
+    @:param watermarks: dict of str model label to tuple of datetime and int.
+
+    @:return str
+    """
+    return urlsafe_b64encode(json.dumps({
+        label: [modified_at.isoformat(), pk]
+        for label, (modified_at, pk) in watermarks.items()
+    }, sort_keys=True).encode()).decode('ascii')
+
+
+def sync_settled_at(settle_seconds):
+    """Latest modified_at synchronised.
+
+    Objects modified within the last seconds are left for the next sync,
+    transactions committing after their modified_at was set are not passed
+    by a watermark.
+
+    @:return datetime
+    """
+    return timezone.now() - timedelta(seconds=settle_seconds)
+
+
+def sync_changes(queryset, watermark, settled_at, limit):
+    """Objects created, modified or soft deleted beyond a watermark.
+
+    Objects are ordered by `(modified_at, id)`, served by the composite
+    index of each synchronised model, soft deleting an object sets its
+    modified_at.
+
+    @:param queryset: QuerySet of all objects including soft deleted.
+    @:param watermark: tuple of datetime and int pk last synchronised, or
+        None to synchronise from the start.
+    @:param settled_at: datetime latest modified_at synchronised.
+    @:param limit: int maximum objects.
+
+    @:return tuple of list of objects and bool more objects remaining.
+    """
+    queryset = queryset.annotate(
+        keyset_pk=ExpressionWrapper(F('pk'), output_field=IntegerField()),
+    ).filter(
+        modified_at__lte=settled_at,
+    ).order_by('modified_at', 'pk')
+    if watermark is not None:
+        modified_at, pk = watermark
+        queryset = queryset.filter(
+            Q(modified_at__gt=modified_at) |
+            Q(modified_at=modified_at, keyset_pk__gt=pk),
+            modified_at__gte=modified_at,
+        )
+    objects = list(queryset[:limit + 1])
+    return objects[:limit], len(objects) > limit
+
+
+def sync_watermark(instance):
+    """Watermark of the last object synchronised.
+
+    @:return tuple of datetime and int pk.
+    """
+    return instance.modified_at, int(instance.pk)
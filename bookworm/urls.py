@@ -18,6 +18,8 @@ from django.urls import (path, include)
 
 from rest_framework_swagger.views import get_swagger_view
 
+from bookworm.views_sync import SyncView
+
 schema_view = get_swagger_view(title='Bookworm API')
 
 urlpatterns = [
@@ -27,5 +29,6 @@ urlpatterns = [
     path('file_store/', include('file_store.urls')),
     path('meta_info/', include('meta_info.urls')),
     path('authentication/', include('authentication.urls')),
+    path('sync/', SyncView.as_view(), name='sync'),
     path('', schema_view),
 ]
@@ -1,11 +1,35 @@
 """Mixin views."""
 
-from rest_framework import (status, permissions, )
-from rest_framework.decorators import (detail_route, permission_classes)
+import hashlib
+from functools import lru_cache
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Count, Max, Prefetch
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import (status, permissions, serializers, )
+from rest_framework.decorators import (
+    detail_route,
+    list_route,
+    permission_classes,
+)
+from rest_framework.generics import get_object_or_404
 from rest_framework.response import Response
 
-from authentication.permissions import AuthenticatedOrAdminPermission
+from authentication.permissions import (
+    AuthenticatedOrAdminPermission,
+    object_permission_cached,
+)
 from authentication.models import Profile
+from bookworm.cache import (
+    cache_object_versions,
+    cache_versions,
+    response_cache,
+    response_cache_key,
+)
+from meta_info.serializers import PublishJobSerializer
 from bookworm.exceptions import (
     PublishableValidationError,
     PublishableObjectNotDefined,
@@ -16,6 +40,7 @@ from bookworm.exceptions import (
 
 class PublishedContentReadPermission(permissions.BasePermission):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Users may only see and manage their own Profile.
 
@@ -23,13 +48,14 @@ class PublishedContentReadPermission(permissions.BasePermission):
         """
         return (
             request.user.profile.type >= Profile.TYPES.admin or
-            obj.has_published_naive_access(request.user.profile) or
-            obj.profile.id == request.user.profile.id
+            obj.has_published_access(request.user.profile) or
+            obj.profile_id == request.user.profile.id
         )
 
 
 class PublishObjectPermission(permissions.BasePermission):
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Users may only see and manage their own Profile.
 
@@ -37,7 +63,7 @@ class PublishObjectPermission(permissions.BasePermission):
         """
         return (
             request.user.profile.type >= Profile.TYPES.admin or
-            request.user.profile.id == obj.profile.id
+            request.user.profile.id == obj.profile_id
         )
 
 
@@ -77,18 +103,39 @@ class PublishableViewSetMixin:
             return self._publishing_error_handle(error)
         return Response(content)
 
+    @list_route(
+        methods=['get'],
+        permission_classes=(AuthenticatedOrAdminPermission, ),
+    )
+    def published(self, request, **kwargs):
+        """List objects published to the requesting Profile."""
+        model = self.get_queryset().model
+        queryset = model.published_visible(
+            self.filter_queryset(preserved_queryset(model)),
+            request.user.profile,
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        return Response(self.get_serializer(queryset, many=True).data)
+
     @detail_route(methods=['post'])
     @permission_classes((
             AuthenticatedOrAdminPermission,
             PublishObjectPermission,
     ))
     def publish(self, request, pk, **kwargs):
-        """Publish this object."""
+        """Publish this object in the background.
+
+        Responds with the publish job to poll until it has run.
+        """
         publishing = self.get_object()
         try:
-            publishing.publish(
+            job = publishing.publish(
                 request.data.get('granted'),
                 request.data.get('block'),
+                request.user.profile,
             )
         except (
                 PublishableValidationError,
@@ -97,10 +144,14 @@ class PublishableViewSetMixin:
             return self._publishing_error_handle(error)
         return Response(
             {
-                'status': 'published',
+                'status': 'queued',
                 'ok': '🖖',
-                'detail': publishing.published_meta.json.output,
+                'job': PublishJobSerializer(
+                    job,
+                    context=self.get_serializer_context(),
+                ).data,
             },
+            status=status.HTTP_202_ACCEPTED,
         )
 
     @detail_route(methods=['post'])
@@ -124,3 +175,413 @@ class PublishableViewSetMixin:
                 'ok': '🖖',
             },
         )
+
+    @detail_route(methods=['get'])
+    @permission_classes((
+            AuthenticatedOrAdminPermission,
+            PublishObjectPermission,
+    ))
+    def published_history(self, request, pk, **kwargs):
+        """List the versions of this object published, latest first."""
+        published = self.get_object()
+        return Response(
+            {
+                'status': 'ok',
+                'ok': '🖖',
+                'versions': [
+                    {
+                        'version': snapshot.version,
+                        'published_at': snapshot.created_at,
+                        'purged': snapshot.purged_at is not None,
+                    }
+                    for snapshot in published.published_history()
+                ],
+            },
+        )
+
+
+def preserved_queryset(model):
+    """Queryset of a model excluding soft deleted objects.
+
+    @:param model: Model class.
+
+    @:return QuerySet
+    """
+    queryset = model._default_manager.all()
+    field_names = [field.name for field in model._meta.get_fields()]
+    if 'deleted_at' in field_names:
+        queryset = queryset.filter(deleted_at__isnull=True)
+    return queryset
+
+
+def serializer_eager_lookups(serializer, model, prefix=''):
+    """Compute related lookups required to represent a serializer.
+
+    Nested serializers of a forward relation are joined with
+    `select_related`, any relation serializing many objects is prefetched
+    with a `Prefetch` excluding soft deleted objects.
+
+    @:param serializer: Serializer instance to inspect fields of.
+    @:param model: Model class represented by the serializer.
+    @:param prefix: str lookup prefix of the serializer within the parent.
+
+    @:return tuple, tuple
+    First tuple are `select_related` lookups, second `Prefetch` objects.
+    """
+    select_related = ()
+    prefetch_related = ()
+    try:
+        fields = serializer.fields
+    except ImproperlyConfigured:
+        # Misconfigured serializers fail when representing, not when loading.
+        return select_related, prefetch_related
+    for field in fields.values():
+        if field.write_only or field.source == '*':
+            continue
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            continue
+        if not model_field.is_relation:
+            continue
+        lookup = f'{prefix}{field.source_attrs[0]}'
+        related_model = model_field.related_model
+        nested = field
+        if isinstance(field, serializers.ListSerializer):
+            nested = field.child
+        if model_field.many_to_many or model_field.one_to_many:
+            queryset = preserved_queryset(related_model)
+            if isinstance(nested, serializers.BaseSerializer):
+                nested_select, nested_prefetch = serializer_eager_lookups(
+                    nested,
+                    related_model,
+                )
+                queryset = queryset.select_related(
+                    *nested_select,
+                ).prefetch_related(*nested_prefetch)
+            prefetch_related += (Prefetch(lookup, queryset=queryset), )
+        elif (
+                isinstance(nested, serializers.BaseSerializer) or
+                len(field.source_attrs) > 1
+        ):
+            nested_select, nested_prefetch = (), ()
+            if isinstance(nested, serializers.BaseSerializer):
+                nested_select, nested_prefetch = serializer_eager_lookups(
+                    nested,
+                    related_model,
+                    prefix=f'{lookup}__',
+                )
+            select_related += (lookup, ) + nested_select
+            prefetch_related += nested_prefetch
+    return select_related, prefetch_related
+
+
+@lru_cache(maxsize=None)
+def serializer_class_eager_lookups(serializer_class):
+    """Cached lookups for a serializer class, fields are static per class.
+
+    @:param serializer_class: ModelSerializer class.
+
+    @:return tuple, tuple
+    """
+    return serializer_eager_lookups(
+        serializer_class(),
+        serializer_class.Meta.model,
+    )
+
+
+class EagerLoadingViewSetMixin:
+    """Eager load relations represented by the view sets serializer.
+
+    Lookups are computed from the serializer field tree, view sets declare
+    additional lookups for fields the tree cannot infer, such as
+    `SerializerMethodField` or foreign field representations.
+    """
+
+    eager_loading_actions = ('list', 'retrieve', )
+    eager_serializer_class = None
+    eager_select_related = ()
+    eager_prefetch_related = ()
+
+    def eager_lookups(self):
+        """Lookups applied to the queryset of this view set.
+
+        @:return tuple, tuple
+        """
+        select_related, prefetch_related = serializer_class_eager_lookups(
+            self.eager_serializer_class or self.serializer_class,
+        )
+        return (
+            select_related + tuple(self.eager_select_related),
+            prefetch_related + tuple(self.eager_prefetch_related),
+        )
+
+    def get_queryset(self):
+        """Apply eager loading to the queryset for serializing actions."""
+        queryset = super().get_queryset()
+        if self.action not in self.eager_loading_actions:
+            return queryset
+        select_related, prefetch_related = self.eager_lookups()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+
+def conditional_response(request, etag, last_modified=None):
+    """Response to a conditional request when the representation matches.
+
+    @:param request: Request object.
+    @:param etag: str quoted entity tag of the representation.
+    @:param last_modified: int timestamp the representation last changed.
+
+    @:return HttpResponse with 304 or 412 status code, or None.
+    """
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+def conditional_headers(response, etag, last_modified=None):
+    """Set validators of a representation on its response.
+
+    @:return Response
+    """
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+class ConditionalGetViewSetMixin:
+    """Answer conditional list and retrieve requests from `modified_at`.
+
+    Objects are validated by their `modified_at`, lists by the latest
+    `modified_at` and count of the objects filtered, a soft deleted object
+    leaves the count. Requests with `If-None-Match` or `If-Modified-Since`
+    matching are answered with 304 before serializing, retrieving without
+    eager loading.
+
+    Validators do not cover objects nested in representations, view sets
+    representing related objects which change independently should cache
+    with `ResponseCacheViewSetMixin` instead.
+    """
+
+    def _conditional_etag(self, *parts):
+        """Weak entity tag of a representation of this request."""
+        request = self.request
+        variant = repr((
+            request.get_full_path(),
+            request.META.get('HTTP_ACCEPT_LANGUAGE', ''),
+            getattr(request.user, 'pk', None),
+        ) + parts)
+        return f'W/"{hashlib.sha1(variant.encode()).hexdigest()}"'
+
+    def conditional_object_validators(self, instance):
+        """ETag and Last-Modified of an object.
+
+        @:return tuple of str and int timestamp or None.
+        """
+        modified_at = getattr(instance, 'modified_at', None)
+        return (
+            self._conditional_etag(
+                instance._meta.label_lower,
+                str(instance.pk),
+                modified_at.isoformat() if modified_at else None,
+            ),
+            int(modified_at.timestamp()) if modified_at else None,
+        )
+
+    def conditional_list_validators(self, queryset):
+        """ETag and Last-Modified of the objects of a list.
+
+        @:return tuple of str and int timestamp or None.
+        """
+        aggregated = queryset.order_by().aggregate(
+            latest=Max('modified_at'),
+            count=Count('pk'),
+        )
+        latest = aggregated['latest']
+        return (
+            self._conditional_etag(
+                latest.isoformat() if latest else None,
+                aggregated['count'],
+            ),
+            int(latest.timestamp()) if latest else None,
+        )
+
+    def _conditional_requested(self, request):
+        return (
+            'HTTP_IF_NONE_MATCH' in request.META or
+            'HTTP_IF_MODIFIED_SINCE' in request.META
+        )
+
+    def get_conditional_object(self):
+        """Object retrieved without eager loading, permissions checked.
+
+        @:return Model object.
+        """
+        queryset = self.filter_queryset(
+            self.get_queryset(),
+        ).prefetch_related(None)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_object_or_404(queryset, **{
+            self.lookup_field: self.kwargs[lookup_url_kwarg],
+        })
+        self.check_object_permissions(self.request, instance)
+        return instance
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        etag, last_modified = self.conditional_list_validators(queryset)
+        conditional = conditional_response(request, etag, last_modified)
+        if conditional is not None:
+            return conditional
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            response = self.get_paginated_response(
+                self.get_serializer(page, many=True).data,
+            )
+        else:
+            response = Response(
+                self.get_serializer(queryset, many=True).data,
+            )
+        return conditional_headers(response, etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        if self._conditional_requested(request):
+            etag, last_modified = self.conditional_object_validators(
+                self.get_conditional_object(),
+            )
+            conditional = conditional_response(request, etag, last_modified)
+            if conditional is not None:
+                return conditional
+        instance = self.get_object()
+        etag, last_modified = self.conditional_object_validators(instance)
+        response = Response(self.get_serializer(instance).data)
+        return conditional_headers(response, etag, last_modified)
+
+
+class ResponseCacheViewSetMixin(ConditionalGetViewSetMixin):
+    """Cache serialized representations of list and retrieve actions.
+
+    Entries are keyed by the versions of the model of the view set and of
+    `cache_dependencies`, models with objects nested in representations.
+    Signals bump the version of a model whenever its objects change.
+    Entries also keep the versions of the objects they represent, bumped by
+    changes of a single object such as Emotes, and are rebuilt once any
+    differs.
+
+    Cached representations are shared by every Profile, object permissions
+    are checked before answering from the cache. Responses carry a weak
+    ETag and the last `modified_at` of the objects represented, matching
+    conditional requests are answered with 304 without serializing.
+    Disabled, conditional requests are answered from `modified_at`.
+    """
+
+    cache_dependencies = ()
+
+    def cache_models(self):
+        """Models with objects represented by this view set.
+
+        @:return tuple of Model classes.
+        """
+        return (self.queryset.model, ) + tuple(
+            apps.get_model(label) for label in self.cache_dependencies
+        )
+
+    def _cache_entry(self, data, objects):
+        """Entry cached of serialized data and the objects serialized."""
+        modified = [
+            instance.modified_at for instance in objects
+            if getattr(instance, 'modified_at', None)
+        ]
+        pks = [int(instance.pk) for instance in objects]
+        return {
+            'data': data,
+            'modified_at': int(max(modified).timestamp()) if modified
+            else None,
+            'objects': pks,
+            'versions': cache_object_versions(self.queryset.model, pks),
+        }
+
+    def _cache_entry_current(self, entry):
+        """Identify if no object represented by an entry changed since."""
+        return cache_object_versions(
+            self.queryset.model,
+            entry['objects'],
+        ) == entry['versions']
+
+    def _cached_response(self, request, key, build):
+        """Respond with a cached entry, building it when missing or stale.
+
+        @:param key: str cache key of the representation.
+        @:param build: callable returning an entry.
+
+        @:return Response
+        """
+        cache = response_cache()
+        entry = cache.get(key)
+        if entry is None or not self._cache_entry_current(entry):
+            entry = build()
+            cache.set(key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+        digest = hashlib.sha1(
+            f'{key}:{entry["versions"]}'.encode(),
+        ).hexdigest()
+        etag = f'W/"{digest}"'
+        conditional = conditional_response(
+            request,
+            etag,
+            entry['modified_at'],
+        )
+        if conditional is not None:
+            return conditional
+        return conditional_headers(
+            Response(entry['data']),
+            etag,
+            entry['modified_at'],
+        )
+
+    def _cache_key(self, request):
+        return response_cache_key(
+            request,
+            self.action,
+            cache_versions(self.cache_models()),
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return super().list(request, *args, **kwargs)
+
+        def build():
+            queryset = self.filter_queryset(self.get_queryset())
+            page = self.paginate_queryset(queryset)
+            if page is None:
+                objects = list(queryset)
+                data = self.get_serializer(objects, many=True).data
+            else:
+                objects = page
+                data = self.get_paginated_response(
+                    self.get_serializer(page, many=True).data,
+                ).data
+            return self._cache_entry(data, objects)
+
+        return self._cached_response(request, self._cache_key(request), build)
+
+    def retrieve(self, request, *args, **kwargs):
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return super().retrieve(request, *args, **kwargs)
+        # Permissions of the object are checked for cached entries too.
+        self.get_conditional_object()
+
+        def build():
+            instance = self.get_object()
+            return self._cache_entry(
+                self.get_serializer(instance).data,
+                [instance],
+            )
+
+        return self._cached_response(request, self._cache_key(request), build)
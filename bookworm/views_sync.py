@@ -0,0 +1,123 @@
+"""Delta synchronisation view."""
+
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from rest_framework import permissions
+from rest_framework.exceptions import NotAuthenticated, PermissionDenied
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from bookworm.exceptions import SyncModelUnknownValidationError
+from bookworm.sync import (
+    sync_changes,
+    sync_settled_at,
+    sync_watermark,
+    sync_watermarks_decode,
+    sync_watermarks_encode,
+)
+
+
+class SyncView(APIView):
+    """Objects created, modified or soft deleted since a client last synced.
+
+    `watermark`: token returned by the previous sync, omitted to sync from
+    the start.
+    `models`: comma separated labels of the models to sync, all of
+    `settings.SYNC_VIEW_SETS` by default.
+
+    Each response holds at most `settings.SYNC_PAGE_SIZE` objects across
+    models with the watermark to request the next, `complete` is false
+    until every change has been synced.
+    """
+
+    permission_classes = (permissions.IsAuthenticated, )
+
+    def sync_labels(self, request):
+        """Labels of the models requested.
+
+        @:return list of str
+
+        @:raises SyncModelUnknownValidationError
+        """
+        requested = request.query_params.get('models')
+        if not requested:
+            return list(settings.SYNC_VIEW_SETS)
+        labels = [label.strip() for label in requested.split(',')]
+        for label in labels:
+            if label not in settings.SYNC_VIEW_SETS:
+                raise SyncModelUnknownValidationError(label)
+        return labels
+
+    def sync_view_set(self, request, label):
+        """View set listing objects of a model, including soft deleted.
+
+        Objects are visible to a client as listed by the view set of their
+        model, its queryset extended to soft deleted objects.
+
+        @:return ViewSet object, or None when listing is not permitted.
+        """
+        view_set = import_string(settings.SYNC_VIEW_SETS[label])(
+            request=request,
+            args=(),
+            kwargs={},
+            action='list',
+            format_kwarg=None,
+        )
+        try:
+            view_set.check_permissions(request)
+        except (NotAuthenticated, PermissionDenied):
+            return None
+        view_set.queryset = view_set.queryset.model.all_objects.all()
+        return view_set
+
+    def sync_identity(self, view_set, instance):
+        """Identity of a soft deleted object as represented when listed.
+
+        @:return str hyperlink of the object.
+        """
+        return view_set.get_serializer().fields['id'].to_representation(
+            instance,
+        )
+
+    def get(self, request, *args, **kwargs):
+        watermarks = sync_watermarks_decode(
+            request.query_params.get('watermark'),
+        )
+        settled_at = sync_settled_at(settings.SYNC_SETTLE_SECONDS)
+        remaining = settings.SYNC_PAGE_SIZE
+        complete = True
+        changes = OrderedDict()
+        for label in self.sync_labels(request):
+            if not remaining:
+                complete = False
+                break
+            view_set = self.sync_view_set(request, label)
+            if view_set is None:
+                continue
+            objects, more = sync_changes(
+                view_set.get_queryset(),
+                watermarks.get(label),
+                settled_at,
+                remaining,
+            )
+            remaining -= len(objects)
+            complete = complete and not more
+            if objects:
+                watermarks[label] = sync_watermark(objects[-1])
+            live = [
+                instance for instance in objects if not instance.deleted_at
+            ]
+            changes[label] = OrderedDict([
+                ('results', view_set.get_serializer(live, many=True).data),
+                ('deleted', [
+                    self.sync_identity(view_set, instance)
+                    for instance in objects if instance.deleted_at
+                ]),
+            ])
+        return Response(OrderedDict([
+            ('watermark', sync_watermarks_encode(watermarks)),
+            ('complete', complete),
+            ('changes', changes),
+        ]))
@@ -2,6 +2,9 @@
 
 import pytest
 
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import activate
 from rest_framework.test import APIClient
 
@@ -14,6 +17,16 @@ def set_default_language():
     activate('en')
 
 
+@pytest.fixture(autouse=True)
+def disable_response_cache(settings):
+    """Factories mute the signals invalidating cached representations.
+
+    Tests of response caching enable it explicitly.
+    """
+    settings.RESPONSE_CACHE_ENABLED = False
+    cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def enable_db_access_for_all_tests(db):
     """Automatically support database access to any tests requiring."""
@@ -48,3 +61,14 @@ def client_admin(profile_admin):
     client = APIClient()
     client.force_authenticate(profile_admin.user)
     return client
+
+
+@pytest.fixture
+def list_queries(client_profile):
+    """Count database queries of an authenticated GET request."""
+    def count_queries(url):
+        with CaptureQueriesContext(connection) as context:
+            response = client_profile.get(url)
+        assert response.status_code == 200
+        return len(context)
+    return count_queries
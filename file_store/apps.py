@@ -6,4 +6,5 @@ class FileStoreConfig(AppConfig):
     verbose_name = 'Files and Images'
 
     def ready(self):
-        pass
+        from file_store import models_upload  # noqa
+        from file_store import signals  # noqa
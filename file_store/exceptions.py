@@ -0,0 +1,83 @@
+import logging
+
+from rest_framework.serializers import ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+class UploadOffsetValidationError(ValidationError):
+
+    def __init__(self, upload, offset):
+        super().__init__({
+            'code': 'upload_offset_validation_error',
+            'message': f'DocumentUpload:{upload.pk} is at offset '
+                       f'{upload.offset} not {offset}',
+            'offset': upload.offset,
+        })
+        logger.error(self)
+
+
+class UploadSizeValidationError(ValidationError):
+
+    def __init__(self, upload, length):
+        super().__init__({
+            'code': 'upload_size_validation_error',
+            'message': f'DocumentUpload:{upload.pk} of {upload.size} bytes '
+                       f'exceeded by {length} bytes at offset '
+                       f'{upload.offset}',
+        })
+        logger.error(self)
+
+
+class UploadIncompleteValidationError(ValidationError):
+
+    def __init__(self, upload):
+        super().__init__({
+            'code': 'upload_incomplete_validation_error',
+            'message': f'DocumentUpload:{upload.pk} has {upload.offset} of '
+                       f'{upload.size} bytes',
+            'offset': upload.offset,
+        })
+        logger.error(self)
+
+
+class UploadCompletedValidationError(ValidationError):
+
+    def __init__(self, upload):
+        super().__init__({
+            'code': 'upload_completed_validation_error',
+            'message': f'DocumentUpload:{upload.pk} is already complete as '
+                       f'Document:{upload.document_id}',
+        })
+        logger.error(self)
+
+
+class FetchRejectedError(ValidationError):
+
+    def __init__(self, url, reason):
+        super().__init__({
+            'code': 'fetch_rejected_error',
+            'message': f'Fetching {url} rejected: {reason}',
+        })
+        logger.error(self)
+
+
+class FetchUnavailableError(ValidationError):
+
+    def __init__(self, url, reason):
+        super().__init__({
+            'code': 'fetch_unavailable_error',
+            'message': f'Fetching {url} unavailable: {reason}',
+        })
+        logger.error(self)
+
+
+class FetchHostBusyError(ValidationError):
+
+    def __init__(self, host):
+        super().__init__({
+            'code': 'fetch_host_busy_error',
+            'message': f'Fetches from {host} at their concurrency limit',
+        })
+        logger.error(self)
@@ -0,0 +1,339 @@
+"""Fetching of Image and Document files from their source_url."""
+
+import hashlib
+import ipaddress
+import logging
+import os
+import socket
+import tempfile
+import time
+from contextlib import contextmanager
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files import File
+from django.db import transaction
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util import connection
+
+from file_store.exceptions import (
+    FetchHostBusyError,
+    FetchRejectedError,
+    FetchUnavailableError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+_session = None
+
+
+def fetch_addresses(host, port):
+    """Addresses of a host allowed to be fetched from.
+
+    Loopback, private, link local and reserved addresses, ie. the metadata
+    service at 169.254.169.254, are never fetched unless within
+    `settings.FETCH_ALLOWED_NETWORKS`.
+
+    @:param host: str host name or address.
+    @:param port: int
+
+    @:return list of tuples of str address and int port.
+
+    @:raises FetchRejectedError when any address is not allowed.
+    @:raises socket.gaierror when the host does not resolve.
+    """
+    allowed = [
+        ipaddress.ip_network(network)
+        for network in settings.FETCH_ALLOWED_NETWORKS
+    ]
+    addresses = []
+    for address in socket.getaddrinfo(
+            host.strip('[]'),
+            port,
+            type=socket.SOCK_STREAM,
+    ):
+        ip = ipaddress.ip_address(address[4][0].split('%')[0])
+        if not ip.is_global and not any(ip in network for network in allowed):
+            raise FetchRejectedError(host, f'address {ip} not global')
+        addresses.append(address[4][:2])
+    return addresses
+
+
+class FetchConnectionMixin:
+    """Connect only to the addresses checked when resolving the host.
+
+    The host is resolved once per connection, a host answering differently
+    between a check and connecting cannot point the connection elsewhere.
+    The Host header and SNI remain the host of the url.
+    """
+
+    def _new_conn(self):
+        extra_kw = {}
+        if self.source_address:
+            extra_kw['source_address'] = self.source_address
+        if self.socket_options:
+            extra_kw['socket_options'] = self.socket_options
+        try:
+            addresses = fetch_addresses(self.host, self.port)
+        except (socket.gaierror, UnicodeError) as error:
+            raise NewConnectionError(
+                self,
+                f'Failed to resolve {self.host}: {error}',
+            )
+        error = None
+        for address in addresses:
+            try:
+                return connection.create_connection(
+                    address,
+                    self.timeout,
+                    **extra_kw,
+                )
+            except socket.timeout:
+                raise ConnectTimeoutError(
+                    self,
+                    f'Connection to {self.host} timed out.',
+                )
+            except OSError as connect_error:
+                error = connect_error
+        raise NewConnectionError(
+            self,
+            f'Failed to establish a new connection: {error}',
+        )
+
+
+class FetchHTTPConnection(FetchConnectionMixin, HTTPConnection):
+    pass
+
+
+class FetchHTTPSConnection(FetchConnectionMixin, HTTPSConnection):
+    pass
+
+
+class FetchHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = FetchHTTPConnection
+
+
+class FetchHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = FetchHTTPSConnection
+
+
+class FetchAdapter(HTTPAdapter):
+    """Adapter pooling connections to addresses allowed to be fetched."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': FetchHTTPConnectionPool,
+            'https': FetchHTTPSConnectionPool,
+        }
+
+
+def fetch_session():
+    """HTTP session of this process, pooling connections per host.
+
+    Proxies of the environment are not used, a proxy would resolve hosts
+    without their addresses checked.
+
+    @:return requests.Session
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        session.trust_env = False
+        adapter = FetchAdapter(
+            pool_connections=settings.FETCH_POOL_HOSTS,
+            pool_maxsize=settings.FETCH_HOST_CONCURRENCY,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = settings.FETCH_USER_AGENT
+        _session = session
+    return _session
+
+
+@contextmanager
+def fetch_host_slot(host):
+    """Hold one of the concurrent fetch slots of a host.
+
+    Slots are counted in `settings.FETCH_CACHE`, shared by workers only
+    when that cache is, ie. Redis configured by `CACHE_URL`, a local memory
+    cache counts the slots of each process. Slots of a worker lost mid
+    fetch expire after `settings.FETCH_TIMEOUT`.
+
+    @:param host: str network location of the url fetched.
+
+    @:raises FetchHostBusyError when every slot of the host is held.
+    """
+    cache = caches[settings.FETCH_CACHE]
+    key = f'file_store:fetch:{host}'
+    cache.add(key, 0, timeout=settings.FETCH_TIMEOUT * 2)
+    try:
+        held = cache.incr(key)
+    except ValueError:
+        held = 1
+        cache.set(key, held, timeout=settings.FETCH_TIMEOUT * 2)
+    if held > settings.FETCH_HOST_CONCURRENCY:
+        cache.decr(key)
+        raise FetchHostBusyError(host)
+    try:
+        yield
+    finally:
+        try:
+            cache.decr(key)
+        except ValueError:
+            pass
+
+
+def fetch_url_check(url):
+    """Reject urls which are not http(s).
+
+    Addresses of the host are checked as it is connected to, see
+    `fetch_addresses`.
+
+    @:param url: str
+
+    @:return str network location of the url.
+
+    @:raises FetchRejectedError for urls never fetched.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https', ) or not parts.hostname:
+        raise FetchRejectedError(url, 'unsupported url')
+    return parts.netloc
+
+
+def fetch_to_file(url, mime_prefix=''):
+    """Stream a url into a temporary file within size and time limits.
+
+    The content is hashed as it is received, the digest is set as
+    `content_digest` of the file for content addressed storage. Redirects
+    are followed up to `settings.FETCH_MAX_REDIRECTS`, each location is
+    checked as the url fetched. Only addresses allowed by `fetch_addresses`
+    are connected to.
+
+    @:param url: str
+    @:param mime_prefix: str the Content-Type is required to start with.
+
+    @:return tuple of File object and str mime.
+
+    @:raises FetchRejectedError for responses never acceptable.
+    @:raises FetchUnavailableError for failures worth retrying.
+    """
+    for _ in range(settings.FETCH_MAX_REDIRECTS + 1):
+        host = fetch_url_check(url)
+        with fetch_host_slot(host):
+            try:
+                response = fetch_session().get(
+                    url,
+                    stream=True,
+                    allow_redirects=False,
+                    timeout=(
+                        settings.FETCH_CONNECT_TIMEOUT,
+                        settings.FETCH_TIMEOUT,
+                    ),
+                )
+            except requests.RequestException as error:
+                raise FetchUnavailableError(url, error)
+            with response:
+                if response.is_redirect:
+                    url = urljoin(url, response.headers['Location'])
+                    continue
+                if (
+                        response.status_code == 429 or
+                        response.status_code >= 500
+                ):
+                    raise FetchUnavailableError(url, response.status_code)
+                if response.status_code != 200:
+                    raise FetchRejectedError(url, response.status_code)
+                mime = response.headers.get('Content-Type', '')
+                mime = mime.split(';')[0].strip().lower()
+                if not mime.startswith(mime_prefix):
+                    raise FetchRejectedError(url, f'content type {mime}')
+                length = response.headers.get('Content-Length')
+                if length and int(length) > settings.FETCH_MAX_SIZE:
+                    raise FetchRejectedError(url, f'{length} bytes')
+                return _fetch_stream(url, response, mime)
+    raise FetchRejectedError(url, 'too many redirects')
+
+
+def _fetch_stream(url, response, mime):
+    """Write the body of a response to a temporary file."""
+    started = time.monotonic()
+    digest = hashlib.sha256()
+    received = 0
+    content = tempfile.TemporaryFile()
+    try:
+        for chunk in response.iter_content(settings.FETCH_CHUNK_SIZE):
+            received += len(chunk)
+            if received > settings.FETCH_MAX_SIZE:
+                raise FetchRejectedError(url, f'over {received} bytes')
+            if time.monotonic() - started > settings.FETCH_TIMEOUT:
+                raise FetchUnavailableError(url, 'timed out')
+            digest.update(chunk)
+            content.write(chunk)
+    except requests.RequestException as error:
+        content.close()
+        raise FetchUnavailableError(url, error)
+    except (FetchRejectedError, FetchUnavailableError):
+        content.close()
+        raise
+    content.seek(0)
+    name = os.path.basename(urlsplit(url).path) or 'source'
+    fetched = File(content, name=name)
+    fetched.content_digest = digest.hexdigest()
+    return fetched, mime
+
+
+def fetch_status(instance, status, error=None):
+    """Record the status of a fetch in the meta info of an object."""
+    if not instance.meta_info_id:
+        return
+    meta_info = instance.meta_info
+    meta_info.json['fetch'] = {
+        'status': status,
+        'error': str(error) if error else None,
+    }
+    meta_info.save(update_fields=['json', 'modified_at'])
+
+
+def remote_fetch(instance):
+    """Fetch the file of an Image or Document from its source_url.
+
+    Images fetched are resized to their sizes once committed.
+
+    @:param instance: Image or Document object.
+
+    @:return bool fetched.
+    """
+    from file_store.models import Image
+    from file_store.tasks import image_auto_crop_task
+    is_image = isinstance(instance, Image)
+    field = 'image' if is_image else 'file'
+    if getattr(instance, field) or not instance.source_url:
+        return False
+    fetched, mime = fetch_to_file(
+        instance.source_url,
+        mime_prefix='image/' if is_image else '',
+    )
+    with fetched, transaction.atomic():
+        getattr(instance, field).save(fetched.name, fetched, save=False)
+        instance.mime = mime[:50]
+        update_fields = [field, 'mime', 'modified_at']
+        if is_image:
+            update_fields += ['width', 'height']
+        instance.save(update_fields=update_fields)
+        fetch_status(instance, 'fetched')
+        if is_image:
+            image_id = str(instance.pk)
+            transaction.on_commit(
+                lambda: image_auto_crop_task.delay(image_id),
+            )
+    logger.info(f'{instance._meta.label} {instance.pk}: fetched '
+                f'{instance.source_url}')
+    return True
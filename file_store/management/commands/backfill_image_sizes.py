@@ -0,0 +1,68 @@
+"""Command to create missing size variants of original Images."""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import connections
+
+from file_store.models import Image
+from file_store.thumbnails import image_sizes_create
+
+
+logger = logging.getLogger(__name__)
+
+
+def _image_sizes_create(image_id):
+    """Create sizes of an Image within a worker process.
+
+    @:return int Images created.
+    """
+    try:
+        return len(image_sizes_create(image_id))
+    except Exception as error:
+        logger.error(f'Image {image_id}: {error}')
+        return 0
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    """Render size variants of original Images without any sizes.
+
+    Images are decoded and resized across a pool of processes, rendering
+    is CPU bound and not shared by threads.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes',
+            type=int,
+            default=None,
+            help='Worker processes, defaults to IMAGE_SIZES_PROCESSES.',
+        )
+
+    def handle(self, *args, **options):
+        """Create the sizes of each Image across worker processes."""
+        image_ids = [
+            str(image_id) for image_id in Image.objects.filter(
+                original__isnull=True,
+                sizes__isnull=True,
+            ).exclude(image='').values_list('pk', flat=True)
+        ]
+        # Forked workers must not share the connection of this process.
+        connections.close_all()
+        processes = options['processes'] or settings.IMAGE_SIZES_PROCESSES
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            created = sum(executor.map(
+                _image_sizes_create,
+                image_ids,
+                chunksize=8,
+            ))
+        logger.info(f'{created} sizes created for {len(image_ids)} Images.')
+        self.stdout.write(
+            f'{created} sizes created for {len(image_ids)} Images.',
+        )
@@ -0,0 +1,130 @@
+"""Command to move stored files into content addressed blobs."""
+
+import logging
+from collections import Counter
+
+from django.core.files import File
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from file_store.models import Blob, Document, Image
+from file_store.storage import BLOB_PREFIX, content_digest
+
+
+logger = logging.getLogger(__name__)
+
+FILE_FIELDS = (
+    (Image, 'image', ),
+    (Document, 'file', ),
+)
+
+
+class Command(BaseCommand):
+    """Deduplicate files stored before content addressed storage.
+
+    Each file not yet a blob is hashed and moved to the blob of its
+    content, files of identical content then share one stored file. The
+    references of every blob are recounted from the rows referring to it,
+    blobs no longer referred to are removed.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report duplicates without moving or removing files.',
+        )
+
+    def _stored_names(self, model, field):
+        """Names of files not yet stored as blobs."""
+        return model.all_objects.exclude(**{
+            f'{field}__startswith': f'{BLOB_PREFIX}/',
+        }).exclude(**{
+            field: '',
+        }).exclude(**{
+            f'{field}__isnull': True,
+        }).values_list(field, flat=True).distinct()
+
+    def _blob_move(self, model, field, name, seen, dry_run):
+        """Move a stored file to its blob.
+
+        @:param seen: set of digests of files moved so far.
+
+        @:return int bytes reclaimed by the file being a duplicate.
+        """
+        storage = model._meta.get_field(field).storage
+        with storage.backend.open(name, 'rb') as stored:
+            content = File(stored, name)
+            digest, size = content_digest(content)
+            duplicate = (
+                digest in seen or
+                Blob.objects.filter(digest=digest).exists()
+            )
+            seen.add(digest)
+            if dry_run:
+                return size if duplicate else 0
+            with transaction.atomic():
+                blob_name = storage.save(name, content)
+                model.all_objects.filter(**{field: name}).update(**{
+                    field: blob_name,
+                })
+                transaction.on_commit(lambda: storage.backend.delete(name))
+        return size if duplicate else 0
+
+    def _blob_recount(self):
+        """Recount blob references, removing blobs without any.
+
+        @:return int bytes of blobs removed.
+        """
+        references = Counter()
+        for model, field in FILE_FIELDS:
+            for name, count in model.all_objects.values(field).annotate(
+                    count=Count('pk'),
+            ).values_list(field, 'count'):
+                references[name] += count
+        removed = 0
+        storage = Image._meta.get_field('image').storage
+        for blob in Blob.objects.iterator():
+            count = references.get(blob.name, 0)
+            if count:
+                if count != blob.references:
+                    Blob.objects.filter(pk=blob.pk).update(references=count)
+                continue
+            with transaction.atomic():
+                blob.delete()
+                transaction.on_commit(
+                    lambda name=blob.name: storage.backend.delete(name),
+                )
+            removed += blob.size
+        return removed
+
+    def handle(self, *args, **options):
+        """Move files to blobs then recount references."""
+        dry_run = options['dry_run']
+        moved = 0
+        reclaimed = 0
+        seen = set()
+        for model, field in FILE_FIELDS:
+            for name in list(self._stored_names(model, field)):
+                try:
+                    reclaimed += self._blob_move(
+                        model,
+                        field,
+                        name,
+                        seen,
+                        dry_run,
+                    )
+                except (IOError, OSError) as error:
+                    logger.error(f'{model._meta.label} {name}: {error}')
+                    continue
+                moved += 1
+        if not dry_run:
+            reclaimed += self._blob_recount()
+        logger.info(f'{moved} files deduplicated, {reclaimed} bytes '
+                    f'reclaimed.')
+        self.stdout.write(
+            f'{moved} files deduplicated, {reclaimed} bytes reclaimed.',
+        )
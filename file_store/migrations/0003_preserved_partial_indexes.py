@@ -0,0 +1,54 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:25
+
+import bookworm.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('file_store', '0002_created_at_keyset_index'),
+    ]
+
+    operations = [
+        bookworm.operations.AddPartialIndex(
+            model_name='image',
+            fields=['profile'],
+            name='file_store_image_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='image',
+            fields=['title'],
+            name='file_store_image_title_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='image',
+            fields=['original'],
+            name='file_store_image_original_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='image',
+            fields=['meta_info'],
+            name='file_store_image_meta_info_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='document',
+            fields=['profile'],
+            name='file_store_document_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='document',
+            fields=['title'],
+            name='file_store_document_title_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='document',
+            fields=['cover'],
+            name='file_store_document_cover_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='document',
+            fields=['meta_info'],
+            name='file_store_document_meta_info_id_live',
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+import hashid_field.field
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0005_preserved_partial_indexes'),
+        ('file_store', '0004_image_dimensions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentUpload',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(blank=True, default=None, null=True)),
+                ('id', hashid_field.field.HashidAutoField(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890', min_length=7, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=200)),
+                ('title', models.CharField(blank=True, max_length=200)),
+                ('mime', models.CharField(blank=True, max_length=50, null=True)),
+                ('size', models.BigIntegerField()),
+                ('offset', models.BigIntegerField(default=0)),
+                ('document', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='uploads+', to='file_store.Document', verbose_name='Document')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='authentication.Profile')),
+            ],
+            options={
+                'verbose_name': 'Document Upload',
+                'verbose_name_plural': 'Document Uploads',
+            },
+        ),
+    ]
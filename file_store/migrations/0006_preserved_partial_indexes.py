@@ -0,0 +1,24 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:35
+
+import bookworm.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('file_store', '0005_document_upload'),
+    ]
+
+    operations = [
+        bookworm.operations.AddPartialIndex(
+            model_name='documentupload',
+            fields=['profile'],
+            name='file_store_documentupload_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='documentupload',
+            fields=['document'],
+            name='file_store_documentupload_document_id_live',
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:37
+
+from django.db import migrations, models
+import file_store.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('file_store', '0006_preserved_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Blob',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('name', models.CharField(max_length=200, unique=True)),
+                ('size', models.BigIntegerField()),
+                ('references', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Blob',
+                'verbose_name_plural': 'Blobs',
+            },
+        ),
+        migrations.AlterField(
+            model_name='document',
+            name='file',
+            field=models.FileField(null=True, storage=file_store.storage.ContentAddressedStorage(), upload_to=''),
+        ),
+        migrations.AlterField(
+            model_name='image',
+            name='image',
+            field=models.ImageField(height_field='height', storage=file_store.storage.ContentAddressedStorage(), upload_to='', width_field='width'),
+        ),
+    ]
@@ -7,15 +7,19 @@ from django.utils.translation import ugettext_lazy as _
 from hashid_field import HashidAutoField
 
 from bookworm.mixins import (
+    ModifiedModelMixin,
     ProfileReferredMixin,
     PreserveModelMixin,
 )
+from file_store.storage import ContentAddressedStorage
 from file_store.tasks import image_auto_crop_task
 from meta_info.models import MetaInfo
 
 
 TAGS = ()
 
+content_addressed_storage = ContentAddressedStorage()
+
 
 class FileMixin(models.Model):
     """Mixin for a basic file model."""
@@ -43,6 +47,33 @@ class FileMixin(models.Model):
         abstract = True
 
 
+class Blob(ModifiedModelMixin):
+    """Stored file shared by every file field with the same content.
+
+    Managed by `ContentAddressedStorage`, `references` counts the files
+    saved with this content and not deleted since. Soft deleted Images and
+    Documents keep their reference until archived, purging their rows
+    removes it.
+    """
+
+    digest = models.CharField(
+        max_length=64,
+        unique=True,
+    )
+    name = models.CharField(
+        max_length=200,
+        unique=True,
+    )
+    size = models.BigIntegerField()
+    references = models.PositiveIntegerField(
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = 'Blob'
+        verbose_name_plural = 'Blobs'
+
+
 class Image(FileMixin, ProfileReferredMixin, PreserveModelMixin):
     """Image model.
 
@@ -53,7 +84,19 @@ class Image(FileMixin, ProfileReferredMixin, PreserveModelMixin):
         primary_key=True,
         salt=settings.SALT_FILESTORE_IMAGE,
     )
-    image = models.ImageField()
+    image = models.ImageField(
+        storage=content_addressed_storage,
+        width_field='width',
+        height_field='height',
+    )
+    width = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+    )
+    height = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+    )
     original = models.ForeignKey(
         'file_store.Image',
         related_name='sizes',
@@ -74,6 +117,31 @@ class Image(FileMixin, ProfileReferredMixin, PreserveModelMixin):
     class Meta:
         verbose_name = 'Image'
         verbose_name_plural = 'Images'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
+
+    def size_nearest(self, width, height=None):
+        """Smallest size of this Image covering the dimensions requested.
+
+        Sizes fit within their bounds keeping the aspect ratio, a size
+        covers the dimensions when either side reaches its bound. Prefetch
+        `sizes` when choosing for many Images.
+
+        @:param width: int
+        @:param height: int, default = width.
+
+        @:return Image, this Image when no size covers the dimensions.
+        """
+        height = height or width
+        covering = [
+            size for size in self.sizes.all()
+            if size.deleted_at is None and size.width and size.height and
+            (size.width >= width or size.height >= height)
+        ]
+        if not covering:
+            return self
+        return min(covering, key=lambda size: size.width * size.height)
 
 
 class Imagable(models.Model):
@@ -110,7 +178,7 @@ class Imagable(models.Model):
         if as_primary:
             self.cover_image = image
         if not image.original and image.sizes.count() == 0:
-            image_auto_crop_task.delay(image)
+            image_auto_crop_task.delay(str(image.pk))
         self.images.add(image)
 
     def image_pop(self, image):
@@ -142,6 +210,7 @@ class Document(FileMixin, ProfileReferredMixin, PreserveModelMixin):
         salt=settings.SALT_FILESTORE_DOCUMENT,
     )
     file = models.FileField(
+        storage=content_addressed_storage,
         null=True,
     )
     cover = models.ForeignKey(
@@ -164,6 +233,9 @@ class Document(FileMixin, ProfileReferredMixin, PreserveModelMixin):
     class Meta:
         verbose_name = 'Document'
         verbose_name_plural = 'Documents'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
 
 class DocumentRefferedMixin(models.Model):
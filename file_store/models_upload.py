@@ -0,0 +1,143 @@
+"""FileStore resumable upload models."""
+
+import os
+
+from django.conf import settings
+from django.core.files import File
+from django.db import models, transaction
+from django.utils.translation import ugettext_lazy as _
+
+from hashid_field import HashidAutoField
+
+from bookworm.mixins import (
+    ProfileReferredMixin,
+    PreserveModelMixin,
+)
+from file_store.exceptions import (
+    UploadCompletedValidationError,
+    UploadIncompleteValidationError,
+    UploadOffsetValidationError,
+    UploadSizeValidationError,
+)
+from file_store.models import Document
+
+
+class DocumentUpload(ProfileReferredMixin, PreserveModelMixin):
+    """Resumable upload of a Document file sent in chunks.
+
+    Chunks are appended to a partial file under
+    `settings.DOCUMENT_UPLOAD_ROOT`, the Document is created once every
+    byte of the declared size has been received.
+    """
+
+    id = HashidAutoField(
+        primary_key=True,
+        salt=settings.SALT_FILESTORE_DOCUMENTUPLOAD,
+    )
+    filename = models.CharField(
+        max_length=200,
+    )
+    title = models.CharField(
+        max_length=200,
+        blank=True,
+    )
+    mime = models.CharField(
+        max_length=50,
+        blank=True,
+        null=True,
+    )
+    size = models.BigIntegerField()
+    offset = models.BigIntegerField(
+        default=0,
+    )
+    document = models.ForeignKey(
+        Document,
+        related_name='uploads+',
+        verbose_name=_('Document'),
+        on_delete=models.DO_NOTHING,
+        blank=True,
+        null=True,
+    )
+
+    class Meta:
+        verbose_name = 'Document Upload'
+        verbose_name_plural = 'Document Uploads'
+
+    @property
+    def path(self):
+        """Path of the partial file received."""
+        return os.path.join(settings.DOCUMENT_UPLOAD_ROOT, f'{self.pk}.part')
+
+    def _locked(self):
+        """This upload locked for update until the transaction ends."""
+        locked = DocumentUpload.objects.select_for_update().get(pk=self.pk)
+        if locked.document_id:
+            raise UploadCompletedValidationError(locked)
+        return locked
+
+    def append(self, stream, offset, length):
+        """Append a chunk read from a stream at an offset.
+
+        The chunk is copied in blocks, only a block is held in memory.
+        Bytes beyond the offset of a previously interrupted chunk are
+        discarded before appending.
+
+        @:param stream: file like object to read the chunk from.
+        @:param offset: int offset the chunk starts at.
+        @:param length: int bytes of the chunk.
+
+        @:return int offset after the chunk.
+
+        @:raises UploadOffsetValidationError, UploadSizeValidationError
+        """
+        with transaction.atomic():
+            locked = self._locked()
+            if offset != locked.offset:
+                raise UploadOffsetValidationError(locked, offset)
+            if locked.offset + length > locked.size:
+                raise UploadSizeValidationError(locked, length)
+            os.makedirs(settings.DOCUMENT_UPLOAD_ROOT, exist_ok=True)
+            with open(locked.path, 'ab') as partial:
+                partial.truncate(locked.offset)
+                remaining = length
+                while remaining > 0:
+                    block = stream.read(min(
+                        settings.DOCUMENT_STREAM_CHUNK_SIZE,
+                        remaining,
+                    ))
+                    if not block:
+                        break
+                    partial.write(block)
+                    remaining -= len(block)
+            locked.offset += length - remaining
+            locked.save(update_fields=['offset', 'modified_at'])
+        self.offset = locked.offset
+        return self.offset
+
+    def complete(self):
+        """Create the Document of this upload once fully received.
+
+        The Document and the completion of the upload are committed
+        together, the partial file is removed after commit.
+
+        @:return Document object.
+
+        @:raises UploadIncompleteValidationError
+        """
+        with transaction.atomic():
+            locked = self._locked()
+            if locked.offset != locked.size:
+                raise UploadIncompleteValidationError(locked)
+            with open(locked.path, 'rb') as partial:
+                document = Document.objects.create(
+                    title=locked.title,
+                    mime=locked.mime,
+                    profile_id=locked.profile_id,
+                    file=File(partial, name=locked.filename),
+                )
+            locked.document = document
+            locked.save(update_fields=['document', 'modified_at'])
+            path = locked.path
+            transaction.on_commit(lambda: os.remove(path))
+        self.document = document
+        return document
@@ -0,0 +1,127 @@
+"""Streaming responses of stored files."""
+
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class FileRangeIterator:
+    """Iterate chunks of a byte range of a file, closing the file after.
+
+    Only a chunk is held in memory at a time regardless of the range.
+    """
+
+    def __init__(self, file, start, length, chunk_size):
+        self.file = file
+        self.start = start
+        self.length = length
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        self.file.seek(self.start)
+        remaining = self.length
+        while remaining > 0:
+            chunk = self.file.read(min(self.chunk_size, remaining))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+
+    def close(self):
+        self.file.close()
+
+
+def file_range(header, size):
+    """Byte range requested by a Range header.
+
+    Only a single range is served, multiple ranges are answered with the
+    whole file as permitted by RFC 7233.
+
+    @:param header: str value of the Range header.
+    @:param size: int bytes of the file.
+
+    @:return tuple of int start and end inclusive, None for the whole file.
+
+    @:raises ValueError when the range is not satisfiable.
+    """
+    match = RANGE_PATTERN.match(header.replace(' ', ''))
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        start, end = max(0, size - int(last)), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def file_response(request, field_file, etag, modified_at, filename=None,
+                  content_type='application/octet-stream'):
+    """Stream a stored file honouring conditional and Range requests.
+
+    Whole files are served through `FileResponse`, servers supplying a
+    `wsgi.file_wrapper` send the file without passing through Python.
+
+    @:param request: Request object.
+    @:param field_file: FieldFile of the file stored.
+    @:param etag: str entity tag of the file, unquoted.
+    @:param modified_at: datetime the file was last modified.
+    @:param filename: str name for the Content-Disposition of the file.
+    @:param content_type: str mime of the file.
+
+    @:return HttpResponse
+    """
+    etag = quote_etag(etag)
+    last_modified = int(modified_at.timestamp())
+    conditional = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified,
+    )
+    if conditional is not None:
+        return conditional
+    size = field_file.size
+    requested = request.META.get('HTTP_RANGE')
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if requested and if_range and if_range.strip() not in (
+            etag,
+            http_date(last_modified),
+    ):
+        requested = None
+    try:
+        byte_range = file_range(requested, size) if requested else None
+    except ValueError:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+    file = field_file.storage.open(field_file.name, 'rb')
+    chunk_size = settings.DOCUMENT_STREAM_CHUNK_SIZE
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+        response.block_size = chunk_size
+        response['Content-Length'] = size
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            FileRangeIterator(file, start, end - start + 1, chunk_size),
+            status=206,
+            content_type=content_type,
+        )
+        response['Content-Length'] = end - start + 1
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    if filename:
+        filename = filename.replace('"', '')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
@@ -1,5 +1,6 @@
 """FileStore app serializers."""
 
+from django.conf import settings
 from rest_framework import serializers
 
 from bookworm.serializers import (
@@ -12,6 +13,20 @@ from file_store.models import (
     Image,
     Document,
 )
+from file_store.models_upload import DocumentUpload
+
+
+class ImageSizeSerializer(serializers.ModelSerializer):
+    """Size variant of an Image."""
+
+    class Meta:
+        model = Image
+        fields = (
+            'image',
+            'width',
+            'height',
+        )
+        read_only_fields = fields
 
 
 class ImageSerializer(
@@ -34,6 +49,10 @@ class ImageSerializer(
         required=False,
         allow_null=True,
     )
+    sizes = ImageSizeSerializer(
+        many=True,
+        read_only=True,
+    )
 
     class Meta:
         model = Image
@@ -45,15 +64,41 @@ class ImageSerializer(
             'profile',
             'original',
             'meta_info',
+            'width',
+            'height',
+            'sizes',
         )
         fields = read_only_fields + (
             'title',
             'description',
             'mime',
             'source_url',
+            'image',
         )
         exclude = []
 
+    def to_representation(self, instance):
+        """Represent the nearest size to `image_size` as the image.
+
+        The size requested is supplied as `?image_size=300` or
+        `?image_size=300x200` in the request.
+        """
+        representation = super().to_representation(instance)
+        request = self.context.get('request')
+        requested = request and request.query_params.get('image_size')
+        if not requested:
+            return representation
+        try:
+            bounds = [int(bound) for bound in requested.split('x', 1)]
+        except ValueError:
+            return representation
+        nearest = instance.size_nearest(*bounds)
+        if nearest is not instance:
+            representation['image'] = self.fields['image'].to_representation(
+                nearest.image,
+            )
+        return representation
+
 
 class DocumentSerializer(
         PreservedModelSerializeMixin,
@@ -86,10 +131,54 @@ class DocumentSerializer(
         fields = read_only_fields + (
             'title',
             'description',
-            'extension',
             'mime',
             'source_url',
             'file',
             'cover',
         )
         exclude = []
+
+
+class DocumentUploadSerializer(
+        PreservedModelSerializeMixin,
+        serializers.HyperlinkedModelSerializer,
+):
+    """Resumable Document upload serializer."""
+
+    id = serializers.HyperlinkedRelatedField(
+        many=False,
+        read_only=True,
+        view_name='documentupload-detail',
+    )
+    document = serializers.HyperlinkedRelatedField(
+        many=False,
+        read_only=True,
+        view_name='document-detail',
+    )
+
+    class Meta:
+        model = DocumentUpload
+        read_only_fields = (
+            'id',
+            'created_at',
+            'modified_at',
+            'deleted_at',
+            'offset',
+            'document',
+        )
+        fields = read_only_fields + (
+            'filename',
+            'title',
+            'mime',
+            'size',
+        )
+        exclude = []
+
+    def validate_size(self, value):
+        """Uploads are limited to `settings.DOCUMENT_UPLOAD_MAX_SIZE`."""
+        if not 0 < value <= settings.DOCUMENT_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f'Size must be between 1 and '
+                f'{settings.DOCUMENT_UPLOAD_MAX_SIZE} bytes.',
+            )
+        return value
@@ -1,10 +1,14 @@
 """Tag signals."""
 
-from django.db.models.signals import (pre_save, post_save, )
+from django.db import transaction
+from django.db.models.signals import (pre_save, post_save, post_delete, )
 from django.dispatch import receiver
 
+from bookworm.cache import cache_version_changed
+
 from meta_info.models import MetaInfo
 from file_store.models import Image, Document
+from file_store.tasks import remote_fetch_task
 
 
 @receiver(pre_save, sender=Image)
@@ -19,21 +23,46 @@ def pre_save_add_meta_info_image(sender, instance, *args, **kwargs):
         )
 
 
+@receiver(pre_save, sender=Image)
+@receiver(pre_save, sender=Document)
+def pre_save_source_url_fetch(sender, instance, *args, **kwargs):
+    """Flag objects with a new or changed source_url to be fetched."""
+    previous = None
+    if instance.pk:
+        previous = sender.all_objects.filter(pk=instance.pk).values_list(
+            'source_url',
+            flat=True,
+        ).first()
+    instance._source_url_fetch = bool(
+        instance.source_url and instance.source_url != previous
+    )
+
+
 @receiver(post_save, sender=Image)
+@receiver(post_save, sender=Document)
 def post_save_image(sender, instance, *args, **kwargs):
     """Manage the saving of an Image or document with a source_url field.
 
-    Handle the creation of Image and Documents through a secondary model
-    to define the state of the download while allowing a service to manage
-    the actual retrieval of the file.
+    Objects saved with a source_url and without a file are fetched by
+    `remote_fetch_task` once committed, the status of the fetch is kept
+    in the meta info of the object.
 
-    Dedicated service for download is preferred due to external file checks,
-    viruses, encoding, broken or slow transfers, are all completed external
+    Dedicated workers for download are preferred due to external file
+    checks, encoding, broken or slow transfers, are all completed external
     from API interaction.
-
-    Not implemented yet.
     """
-    pass
+    field = 'image' if sender is Image else 'file'
+    if not getattr(instance, '_source_url_fetch', False):
+        return
+    if getattr(instance, field):
+        return
+    if sender is Image and instance.original_id:
+        return
+    label = sender._meta.label
+    object_id = str(instance.pk)
+    transaction.on_commit(
+        lambda: remote_fetch_task.delay(label, object_id),
+    )
 
 
 @receiver(pre_save, sender=Document)
@@ -41,3 +70,12 @@ def pre_save_add_meta_info_document(sender, instance, *args, **kwargs):
     """set meta info for instance."""
     if not instance.pk and not instance.meta_info:
         instance.meta_info = MetaInfo.objects.create()
+
+
+@receiver(post_save, sender=Image)
+@receiver(post_save, sender=Document)
+@receiver(post_delete, sender=Image)
+@receiver(post_delete, sender=Document)
+def post_change_cache_version(sender, instance, *args, **kwargs):
+    """Invalidate cached representations of Images and Documents."""
+    cache_version_changed(sender)
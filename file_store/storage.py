@@ -0,0 +1,129 @@
+"""Content addressed storage of uploaded files."""
+
+import hashlib
+import os
+
+from django.core.files import File
+from django.core.files.storage import Storage, get_storage_class
+from django.db import transaction
+from django.db.models import F
+from django.utils.deconstruct import deconstructible
+from django.utils.functional import cached_property
+
+
+BLOB_PREFIX = 'blobs'
+
+
+def content_digest(content):
+    """SHA-256 digest and size of file content, read in chunks.
+
+    Uploads hashed while received supply their digest without a read.
+
+    @:param content: File object.
+
+    @:return tuple of str hex digest and int bytes.
+    """
+    if getattr(content, 'content_digest', None):
+        return content.content_digest, content.size
+    digest = hashlib.sha256()
+    size = 0
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk)
+        size += len(chunk)
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return digest.hexdigest(), size
+
+
+def blob_name(digest, name=''):
+    """Storage name of a blob, keeping the extension of the file name.
+
+    @:return str
+    """
+    extension = os.path.splitext(name)[1].lower()
+    return f'{BLOB_PREFIX}/{digest[:2]}/{digest[2:4]}/{digest}{extension}'
+
+
+@deconstructible
+class ContentAddressedStorage(Storage):
+    """Store files by the digest of their content, once per content.
+
+    Files are saved in `settings.DEFAULT_FILE_STORAGE` under their SHA-256
+    digest, a `Blob` counts the references saved. Saving content already
+    stored adds a reference without writing, deleting removes a reference
+    and the stored file with the last reference.
+    """
+
+    @cached_property
+    def backend(self):
+        return get_storage_class()()
+
+    def save(self, name, content, max_length=None):
+        """Save content returning the name of its blob."""
+        from file_store.models import Blob
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        digest, size = content_digest(content)
+        stored = blob_name(digest, name)
+        with transaction.atomic():
+            blob, created = Blob.objects.select_for_update().get_or_create(
+                digest=digest,
+                defaults={'name': stored, 'size': size},
+            )
+            if created and not self.backend.exists(blob.name):
+                blob.name = self.backend.save(blob.name, content)
+            Blob.objects.filter(pk=blob.pk).update(
+                name=blob.name,
+                references=F('references') + 1,
+            )
+        return blob.name
+
+    def delete(self, name):
+        """Remove a reference to a blob, the file with the last reference.
+
+        Files not stored as blobs are deleted directly.
+        """
+        from file_store.models import Blob
+        with transaction.atomic():
+            blob = Blob.objects.select_for_update().filter(name=name).first()
+            if blob is None:
+                self.backend.delete(name)
+                return
+            if blob.references > 1:
+                Blob.objects.filter(pk=blob.pk).update(
+                    references=F('references') - 1,
+                )
+                return
+            blob.delete()
+            transaction.on_commit(lambda: self.backend.delete(name))
+
+    def _open(self, name, mode='rb'):
+        return self.backend.open(name, mode)
+
+    def exists(self, name):
+        return self.backend.exists(name)
+
+    def size(self, name):
+        return self.backend.size(name)
+
+    def url(self, name):
+        return self.backend.url(name)
+
+    def path(self, name):
+        return self.backend.path(name)
+
+    def listdir(self, path):
+        return self.backend.listdir(path)
+
+    def get_accessed_time(self, name):
+        return self.backend.get_accessed_time(name)
+
+    def get_created_time(self, name):
+        return self.backend.get_created_time(name)
+
+    def get_modified_time(self, name):
+        return self.backend.get_modified_time(name)
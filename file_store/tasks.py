@@ -1,12 +1,79 @@
 """Tasks for file management."""
 
-def image_auto_crop_task(original_image, sizes=None):
+import random
+
+from celery import shared_task
+from django.apps import apps
+from django.conf import settings
+
+from file_store.exceptions import (
+    FetchHostBusyError,
+    FetchRejectedError,
+    FetchUnavailableError,
+)
+from file_store.fetch import fetch_status, remote_fetch
+from file_store.thumbnails import image_sizes_create
+
+
+@shared_task
+def image_auto_crop_task(original_image_id, sizes=None):
     """Crop and/or resize an Image according to an applications config.
 
-    Images are expected to be cropped async to the Django application,
-    management of the crop is managed through Celery and external apps.
+    Images are resized async to the Django application, each size variant
+    is stored as an Image with the original Image as its `original`.
 
-    @:param original_image: Image model detailing the image to crop.
+    @:param original_image_id: str hashid of the Image to resize.
     @:param sizes: tuple of pair of integers as ((width, height, ), )
+
+    @:return list of str hashids of the Images created.
+    """
+    return [
+        str(image.pk)
+        for image in image_sizes_create(original_image_id, sizes)
+    ]
+
+
+@shared_task(bind=True, max_retries=None)
+def remote_fetch_task(self, model_label, object_id, attempts=0):
+    """Fetch the file of an Image or Document from its source_url.
+
+    Unavailable sources are retried with an exponential back off and
+    jitter, up to `settings.FETCH_MAX_RETRIES` times. Busy hosts are retried
+    after `settings.FETCH_RETRY_BACKOFF` without counting as an attempt.
+
+    @:param model_label: str label of the model, ie. `file_store.Image`.
+    @:param object_id: str hashid of the object.
+    @:param attempts: int fetches of an unavailable source so far.
+
+    @:return bool fetched.
     """
-    pass
+    instance = apps.get_model(model_label).objects.filter(
+        pk=object_id,
+    ).first()
+    if instance is None:
+        return False
+    try:
+        return remote_fetch(instance)
+    except FetchRejectedError as error:
+        fetch_status(instance, 'failed', error)
+        return False
+    except FetchHostBusyError as error:
+        backoff = settings.FETCH_RETRY_BACKOFF
+        raise self.retry(
+            exc=error,
+            countdown=backoff / 2 + random.uniform(0, backoff / 2),
+            kwargs={'attempts': attempts},
+        )
+    except FetchUnavailableError as error:
+        if attempts >= settings.FETCH_MAX_RETRIES:
+            fetch_status(instance, 'failed', error)
+            return False
+        backoff = min(
+            settings.FETCH_RETRY_BACKOFF * 2 ** attempts,
+            settings.FETCH_RETRY_BACKOFF_MAX,
+        )
+        raise self.retry(
+            exc=error,
+            countdown=backoff / 2 + random.uniform(0, backoff / 2),
+            kwargs={'attempts': attempts + 1},
+        )
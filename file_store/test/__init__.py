@@ -1 +1,35 @@
-"""Books test factories."""
+"""FileStore test factories."""
+
+import factory
+from factory.django import DjangoModelFactory
+
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    post_delete,
+)
+
+from authentication.test import UserFactory
+from file_store.models import Image, Document
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class ImageFactory(DjangoModelFactory):
+    """Factory for images."""
+
+    title = factory.Faker('sentence')
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+
+    class Meta:
+        model = Image
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class DocumentFactory(DjangoModelFactory):
+    """Factory for documents."""
+
+    title = factory.Faker('sentence')
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+
+    class Meta:
+        model = Document
@@ -0,0 +1,108 @@
+"""Content addressed storage tests."""
+
+import hashlib
+from datetime import timedelta
+
+import pytest
+
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import RequestFactory
+from django.utils import timezone
+
+from bookworm.archive import archive_model
+from file_store.models import Blob, Document
+from file_store.storage import BLOB_PREFIX
+from file_store.test import DocumentFactory
+
+
+@pytest.fixture
+def media(settings, tmpdir):
+    settings.MEDIA_ROOT = str(tmpdir)
+    return tmpdir
+
+
+def test_identical_uploads_share_blob(media):
+    """Files of the same content are stored once and referenced twice."""
+    first = DocumentFactory(file=ContentFile(b'epub', name='one.epub'))
+    second = DocumentFactory(file=ContentFile(b'epub', name='two.epub'))
+    other = DocumentFactory(file=ContentFile(b'pdf', name='three.pdf'))
+    assert first.file.name == second.file.name
+    assert first.file.name.startswith(f'{BLOB_PREFIX}/')
+    assert other.file.name != first.file.name
+    blob = Blob.objects.get(name=first.file.name)
+    assert blob.references == 2
+    assert blob.size == 4
+
+
+def test_blob_deleted_with_last_reference(media):
+    """Deleting a file removes a reference, the blob with the last."""
+    first = DocumentFactory(file=ContentFile(b'epub', name='one.epub'))
+    second = DocumentFactory(file=ContentFile(b'epub', name='two.epub'))
+    name = first.file.name
+    first.file.delete(save=False)
+    assert Blob.objects.get(name=name).references == 1
+    second.file.delete(save=False)
+    assert not Blob.objects.filter(name=name).exists()
+
+
+def test_dedupe_files(media):
+    """Files stored before blobs are moved to shared blobs."""
+    storage = Document._meta.get_field('file').storage
+    storage.backend.save('legacy/one.epub', ContentFile(b'epub'))
+    storage.backend.save('legacy/two.epub', ContentFile(b'epub'))
+    first = DocumentFactory(file='legacy/one.epub')
+    second = DocumentFactory(file='legacy/two.epub')
+    call_command('dedupe_files')
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.file.name == second.file.name
+    assert first.file.name.startswith(f'{BLOB_PREFIX}/')
+    assert Blob.objects.get(name=first.file.name).references == 2
+    assert first.file.read() == b'epub'
+
+
+def multipart_files(**files):
+    request = RequestFactory().post('/file_store/document/', {
+        field: SimpleUploadedFile(f'{field}.epub', content)
+        for field, content in files.items()
+    })
+    return request.FILES
+
+
+@pytest.mark.parametrize('max_memory_size', [2621440, 8])
+def test_multipart_upload_digest(settings, max_memory_size):
+    """Multipart uploads are hashed by the configured upload handlers.
+
+    Uploads are held in memory, or streamed to a temporary file past
+    `FILE_UPLOAD_MAX_MEMORY_SIZE`.
+    """
+    settings.FILE_UPLOAD_MAX_MEMORY_SIZE = max_memory_size
+    contents = {'first': b'epub', 'second': b'pdf' * 16}
+    files = multipart_files(**contents)
+    for field, content in contents.items():
+        assert files[field].content_digest == (
+            hashlib.sha256(content).hexdigest()
+        )
+
+
+def test_archive_removes_reference(media, settings):
+    """Purging soft deleted Documents removes their blob references."""
+    settings.ARCHIVE_ROOT = str(media.mkdir('archive'))
+    first = DocumentFactory(file=ContentFile(b'epub', name='one.epub'))
+    second = DocumentFactory(file=ContentFile(b'epub', name='two.epub'))
+    name = first.file.name
+    first.delete()
+    assert Blob.objects.get(name=name).references == 2
+    Document.all_objects.filter(pk=first.pk).update(
+        deleted_at=timezone.now() - timedelta(days=100),
+    )
+    archive_model(Document, retention_days=90)
+    assert Blob.objects.get(name=name).references == 1
+    second.delete()
+    Document.all_objects.filter(pk=second.pk).update(
+        deleted_at=timezone.now() - timedelta(days=100),
+    )
+    archive_model(Document, retention_days=90)
+    assert not Blob.objects.filter(name=name).exists()
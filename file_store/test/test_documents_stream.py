@@ -0,0 +1,151 @@
+"""Document streaming download and resumable upload tests."""
+
+import pytest
+
+from django.core.files.base import ContentFile
+
+from file_store.models import Document
+from file_store.models_upload import DocumentUpload
+from file_store.responses import file_range
+from file_store.test import DocumentFactory
+
+
+CONTENT = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def document(settings, tmpdir):
+    """Document with a stored file."""
+    settings.MEDIA_ROOT = str(tmpdir)
+    return DocumentFactory(
+        file=ContentFile(CONTENT, name='novel.epub'),
+        mime='application/epub+zip',
+    )
+
+
+def download_url(document):
+    return f'/file_store/document/{document.pk}/download/'
+
+
+def test_file_range():
+    """Single byte ranges are parsed, inclusive of their end."""
+    assert file_range('bytes=0-99', 1000) == (0, 99)
+    assert file_range('bytes=900-', 1000) == (900, 999)
+    assert file_range('bytes=-100', 1000) == (900, 999)
+    assert file_range('bytes=900-5000', 1000) == (900, 999)
+    assert file_range('bytes=0-1,5-9', 1000) is None
+    with pytest.raises(ValueError):
+        file_range('bytes=1000-', 1000)
+
+
+def test_document_download(client_profile, document):
+    """The whole file is streamed with validators for caching."""
+    response = client_profile.get(download_url(document))
+    assert response.status_code == 200
+    assert response['Accept-Ranges'] == 'bytes'
+    assert int(response['Content-Length']) == len(CONTENT)
+    assert b''.join(response.streaming_content) == CONTENT
+
+
+def test_document_download_range(client_profile, document):
+    """A byte range is streamed as partial content."""
+    response = client_profile.get(
+        download_url(document),
+        HTTP_RANGE='bytes=100-299',
+    )
+    assert response.status_code == 206
+    assert response['Content-Range'] == f'bytes 100-299/{len(CONTENT)}'
+    assert b''.join(response.streaming_content) == CONTENT[100:300]
+
+
+def test_document_download_range_unsatisfiable(client_profile, document):
+    """Ranges beyond the file are not satisfiable."""
+    response = client_profile.get(
+        download_url(document),
+        HTTP_RANGE=f'bytes={len(CONTENT)}-',
+    )
+    assert response.status_code == 416
+
+
+def test_document_download_not_modified(client_profile, document):
+    """Matching If-None-Match is answered without the file."""
+    etag = client_profile.get(download_url(document))['ETag']
+    response = client_profile.get(
+        download_url(document),
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert response.status_code == 304
+
+
+def test_document_download_if_range_stale(client_profile, document):
+    """A stale If-Range responds with the whole file."""
+    response = client_profile.get(
+        download_url(document),
+        HTTP_RANGE='bytes=0-9',
+        HTTP_IF_RANGE='"stale"',
+    )
+    assert response.status_code == 200
+
+
+def test_document_upload_chunks(client_profile, settings, tmpdir):
+    """Chunks appended in order complete into a Document."""
+    settings.MEDIA_ROOT = str(tmpdir.mkdir('media'))
+    settings.DOCUMENT_UPLOAD_ROOT = str(tmpdir.mkdir('uploads'))
+    response = client_profile.post('/file_store/document_upload/', {
+        'filename': 'novel.pdf',
+        'title': 'Novel',
+        'mime': 'application/pdf',
+        'size': len(CONTENT),
+    })
+    assert response.status_code == 201
+    upload = DocumentUpload.objects.get()
+    url = f'/file_store/document_upload/{upload.pk}/'
+    for offset in range(0, len(CONTENT), 4096):
+        response = client_profile.patch(
+            f'{url}chunk/',
+            CONTENT[offset:offset + 4096],
+            content_type='application/octet-stream',
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+        assert response.status_code == 200
+        assert response.data['offset'] == offset + 4096
+    response = client_profile.post(f'{url}complete/')
+    assert response.status_code == 201
+    document = Document.objects.get()
+    assert document.title == 'Novel'
+    assert document.file.read() == CONTENT
+
+
+def test_document_upload_offset_mismatch(client_profile, profile, settings,
+                                         tmpdir):
+    """Chunks not starting at the offset received conflict."""
+    settings.DOCUMENT_UPLOAD_ROOT = str(tmpdir)
+    upload = DocumentUpload.objects.create(
+        profile=profile,
+        filename='novel.pdf',
+        size=len(CONTENT),
+    )
+    response = client_profile.patch(
+        f'/file_store/document_upload/{upload.pk}/chunk/',
+        CONTENT[4096:8192],
+        content_type='application/octet-stream',
+        HTTP_UPLOAD_OFFSET='4096',
+    )
+    assert response.status_code == 409
+    assert response.data['error']['offset'] == '0'
+
+
+def test_document_upload_incomplete(client_profile, profile, settings,
+                                    tmpdir):
+    """Uploads missing bytes are not completed."""
+    settings.DOCUMENT_UPLOAD_ROOT = str(tmpdir)
+    upload = DocumentUpload.objects.create(
+        profile=profile,
+        filename='novel.pdf',
+        size=len(CONTENT),
+    )
+    response = client_profile.post(
+        f'/file_store/document_upload/{upload.pk}/complete/',
+    )
+    assert response.status_code == 400
+    assert not Document.objects.exists()
@@ -0,0 +1,184 @@
+"""Remote fetch tests against a local HTTP server."""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from io import BytesIO
+from socketserver import ThreadingMixIn
+from urllib.parse import urlsplit
+
+import pytest
+from PIL import Image as Picture
+
+from file_store.exceptions import (
+    FetchHostBusyError,
+    FetchRejectedError,
+    FetchUnavailableError,
+)
+from file_store.fetch import fetch_host_slot, fetch_to_file, remote_fetch
+from file_store.test import DocumentFactory, ImageFactory
+
+
+def picture_bytes():
+    content = BytesIO()
+    Picture.new('RGB', (800, 600)).save(content, 'JPEG')
+    return content.getvalue()
+
+
+ROUTES = {
+    '/cover.jpg': (200, 'image/jpeg', picture_bytes()),
+    '/novel.epub': (200, 'application/epub+zip', b'epub' * 1024),
+    '/missing': (404, 'text/plain', b'missing'),
+    '/unavailable': (503, 'text/plain', b'unavailable'),
+}
+REDIRECTS = {
+    '/moved': '/novel.epub',
+    '/metadata': 'http://169.254.169.254/latest/meta-data/',
+    '/loop': '/loop',
+}
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class RouteHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path in REDIRECTS:
+            self.send_response(302)
+            self.send_header('Location', REDIRECTS[self.path])
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        status, mime, content = ROUTES.get(
+            self.path,
+            (404, 'text/plain', b''),
+        )
+        self.send_response(status)
+        self.send_header('Content-Type', mime)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def source(settings, tmpdir):
+    """Base url of a local server of `ROUTES`."""
+    settings.MEDIA_ROOT = str(tmpdir)
+    settings.FETCH_ALLOWED_NETWORKS = ['127.0.0.1/32']
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RouteHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_to_file(source):
+    """Content is streamed to a file with its digest."""
+    fetched, mime = fetch_to_file(f'{source}/novel.epub')
+    assert mime == 'application/epub+zip'
+    assert fetched.name == 'novel.epub'
+    assert fetched.read() == b'epub' * 1024
+    assert fetched.content_digest
+
+
+def test_fetch_to_file_size_limit(source, settings):
+    """Content beyond the size limit is rejected."""
+    settings.FETCH_MAX_SIZE = 1024
+    with pytest.raises(FetchRejectedError):
+        fetch_to_file(f'{source}/novel.epub')
+
+
+def test_fetch_to_file_content_type(source):
+    """Content not of the type required is rejected."""
+    with pytest.raises(FetchRejectedError):
+        fetch_to_file(f'{source}/novel.epub', mime_prefix='image/')
+
+
+def test_fetch_to_file_status(source):
+    """Missing content is rejected, unavailable content is retried."""
+    with pytest.raises(FetchRejectedError):
+        fetch_to_file(f'{source}/missing')
+    with pytest.raises(FetchUnavailableError):
+        fetch_to_file(f'{source}/unavailable')
+
+
+def test_fetch_to_file_private_address(source, settings):
+    """Addresses not globally routable are never fetched."""
+    settings.FETCH_ALLOWED_NETWORKS = []
+    with pytest.raises(FetchRejectedError):
+        fetch_to_file(f'{source}/novel.epub')
+    for url in (
+            'http://169.254.169.254/latest/meta-data/',
+            'http://10.0.0.1/novel.epub',
+            'http://[::1]/novel.epub',
+    ):
+        with pytest.raises(FetchRejectedError):
+            fetch_to_file(url)
+
+
+def test_fetch_to_file_redirects(source, settings):
+    """Every location redirected to is checked as the url fetched."""
+    settings.FETCH_MAX_REDIRECTS = 2
+    fetched, mime = fetch_to_file(f'{source}/moved')
+    assert fetched.read() == b'epub' * 1024
+    with pytest.raises(FetchRejectedError):
+        fetch_to_file(f'{source}/metadata')
+    with pytest.raises(FetchRejectedError):
+        fetch_to_file(f'{source}/loop')
+
+
+def test_fetch_to_file_rebinding(source, monkeypatch):
+    """Hosts are connected to at the address checked, never resolved again."""
+    answers = ['127.0.0.1', '169.254.169.254']
+    resolved = []
+    getaddrinfo = socket.getaddrinfo
+
+    def rebinding(host, port, *args, **kwargs):
+        if host == 'rebind.example':
+            resolved.append(host)
+            host = answers[min(len(resolved), len(answers)) - 1]
+        return getaddrinfo(host, port, *args, **kwargs)
+
+    monkeypatch.setattr(socket, 'getaddrinfo', rebinding)
+    port = urlsplit(source).port
+    fetched, mime = fetch_to_file(f'http://rebind.example:{port}/novel.epub')
+    assert fetched.read() == b'epub' * 1024
+    assert resolved == ['rebind.example']
+    answers.reverse()
+    resolved.clear()
+    with pytest.raises(FetchRejectedError):
+        fetch_to_file(f'http://rebind.example:{port + 1}/novel.epub')
+
+
+def test_fetch_host_slot(settings):
+    """Fetches from a host are bounded by its concurrency."""
+    settings.FETCH_HOST_CONCURRENCY = 1
+    with fetch_host_slot('books.example.com'):
+        with pytest.raises(FetchHostBusyError):
+            with fetch_host_slot('books.example.com'):
+                pass
+    with fetch_host_slot('books.example.com'):
+        pass
+
+
+def test_remote_fetch_image(source):
+    """Images are stored from their source_url with their dimensions."""
+    image = ImageFactory(source_url=f'{source}/cover.jpg')
+    assert remote_fetch(image)
+    image.refresh_from_db()
+    assert image.mime == 'image/jpeg'
+    assert (image.width, image.height) == (800, 600)
+
+
+def test_remote_fetch_document(source):
+    """Documents are stored from their source_url."""
+    document = DocumentFactory(source_url=f'{source}/novel.epub')
+    assert remote_fetch(document)
+    document.refresh_from_db()
+    assert document.file.read() == b'epub' * 1024
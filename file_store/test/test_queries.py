@@ -0,0 +1,19 @@
+"""Query count regression tests for file_store endpoints."""
+
+from file_store.test import ImageFactory, DocumentFactory
+
+
+def test_image_list_queries(list_queries):
+    """Listing Images does not query per Image."""
+    ImageFactory()
+    expected = list_queries('/file_store/image/')
+    ImageFactory.create_batch(4)
+    assert list_queries('/file_store/image/') == expected
+
+
+def test_document_list_queries(list_queries):
+    """Listing Documents does not query per Document."""
+    DocumentFactory()
+    expected = list_queries('/file_store/document/')
+    DocumentFactory.create_batch(4)
+    assert list_queries('/file_store/document/') == expected
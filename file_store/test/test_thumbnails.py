@@ -0,0 +1,77 @@
+"""Image size variant tests."""
+
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image as Picture
+
+from file_store.tasks import image_auto_crop_task
+from file_store.test import ImageFactory
+from file_store.thumbnails import thumbnail_fit, thumbnails_render
+
+
+def picture_content(dimensions=(2400, 1600), mode='RGB', output='JPEG'):
+    """Encoded picture of dimensions."""
+    content = BytesIO()
+    Picture.new(mode, dimensions).save(content, output)
+    content.seek(0)
+    return content
+
+
+def test_thumbnail_fit():
+    """Dimensions fit within bounds keeping the aspect ratio."""
+    assert thumbnail_fit((2400, 1600), (600, 600)) == (600, 400)
+    assert thumbnail_fit((1600, 2400), (600, 600)) == (400, 600)
+    assert thumbnail_fit((400, 300), (600, 600)) is None
+
+
+def test_thumbnails_render_largest_first():
+    """Sizes smaller than the picture are rendered, largest first."""
+    rendered = thumbnails_render(
+        picture_content(),
+        ((300, 300), (1200, 1200), (4000, 4000), ),
+    )
+    assert [dimensions for dimensions, _, _ in rendered] == [
+        (1200, 800),
+        (300, 200),
+    ]
+    for dimensions, content, output_format in rendered:
+        assert output_format == 'JPEG'
+        assert Picture.open(BytesIO(content)).size == dimensions
+
+
+def test_thumbnails_render_transparent():
+    """Transparent pictures keep their transparency."""
+    rendered = thumbnails_render(
+        picture_content(mode='RGBA', output='PNG'),
+        ((300, 300), ),
+    )
+    assert rendered[0][2] == 'PNG'
+
+
+def test_image_auto_crop_task(settings, tmpdir):
+    """Size variants are created as Images of the original."""
+    settings.MEDIA_ROOT = str(tmpdir)
+    settings.IMAGE_SIZES = ((600, 600), (100, 100), )
+    image = ImageFactory(
+        image=ContentFile(picture_content().read(), name='cover.jpg'),
+    )
+    created = image_auto_crop_task(str(image.pk))
+    assert len(created) == 2
+    assert sorted(
+        (size.width, size.height) for size in image.sizes.all()
+    ) == [(100, 67), (600, 400)]
+    assert image_auto_crop_task(str(image.pk)) == []
+
+
+def test_image_size_nearest(settings, tmpdir):
+    """The smallest size covering the dimensions requested is chosen."""
+    settings.MEDIA_ROOT = str(tmpdir)
+    settings.IMAGE_SIZES = ((600, 600), (100, 100), )
+    image = ImageFactory(
+        image=ContentFile(picture_content().read(), name='cover.jpg'),
+    )
+    image_auto_crop_task(str(image.pk))
+    assert image.size_nearest(80).width == 100
+    assert image.size_nearest(300, 200).width == 600
+    assert image.size_nearest(1000) == image
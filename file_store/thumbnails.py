@@ -0,0 +1,145 @@
+"""Size variants of Images rendered with Pillow."""
+
+import logging
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image as Picture
+
+
+logger = logging.getLogger(__name__)
+
+REDUCING_GAP = 2
+
+
+def thumbnail_fit(dimensions, bounds):
+    """Dimensions of an image fit within bounds keeping the aspect ratio.
+
+    @:param dimensions: tuple of int width and height of the image.
+    @:param bounds: tuple of int width and height to fit within.
+
+    @:return tuple of int width and height, or None when not smaller.
+    """
+    scale = min(bounds[0] / dimensions[0], bounds[1] / dimensions[1])
+    if scale >= 1:
+        return None
+    return (
+        max(1, round(dimensions[0] * scale)),
+        max(1, round(dimensions[1] * scale)),
+    )
+
+
+def thumbnail_reduce(picture, dimensions):
+    """Reduce a picture by an integer factor with box sampling.
+
+    The picture is kept at least `REDUCING_GAP` times the dimensions, the
+    final resampling then only filters a few source pixels per pixel.
+
+    @:param picture: PIL.Image.Image
+    @:param dimensions: tuple of int width and height to be resized to.
+
+    @:return PIL.Image.Image
+    """
+    factor = int(min(
+        picture.width / dimensions[0],
+        picture.height / dimensions[1],
+    ) / REDUCING_GAP)
+    if factor < 2:
+        return picture
+    return picture.resize(
+        (-(-picture.width // factor), -(-picture.height // factor)),
+        Picture.BOX,
+    )
+
+
+def thumbnails_render(source, sizes, exclude=()):
+    """Render size variants of an image file, largest first.
+
+    JPEG images are decoded in draft mode at a scale of the largest size,
+    each smaller size is then reduced from the previous working picture.
+
+    @:param source: file object of the original image.
+    @:param sizes: tuple of pair of integers as ((width, height, ), ).
+    @:param exclude: dimensions of variants already rendered.
+
+    @:return list of tuple of dimensions, bytes content and str format.
+    """
+    picture = Picture.open(source)
+    targets = sorted(
+        {
+            dimensions for dimensions in (
+                thumbnail_fit(picture.size, size) for size in sizes
+            )
+            if dimensions and dimensions not in exclude
+        },
+        key=lambda dimensions: dimensions[0] * dimensions[1],
+        reverse=True,
+    )
+    if not targets:
+        return []
+    if picture.format == 'JPEG':
+        picture.draft(picture.mode, targets[0])
+    transparent = picture.mode in ('RGBA', 'LA', ) or (
+        picture.mode == 'P' and 'transparency' in picture.info
+    )
+    output_format = 'PNG' if transparent else 'JPEG'
+    if output_format == 'JPEG' and picture.mode not in ('RGB', 'L', ):
+        picture = picture.convert('RGB')
+    elif output_format == 'PNG' and picture.mode == 'P':
+        picture = picture.convert('RGBA')
+    rendered = []
+    for dimensions in targets:
+        picture = thumbnail_reduce(picture, dimensions)
+        variant = picture.resize(dimensions, Picture.LANCZOS)
+        content = BytesIO()
+        variant.save(
+            content,
+            output_format,
+            quality=settings.IMAGE_QUALITY,
+            optimize=True,
+        )
+        rendered.append((dimensions, content.getvalue(), output_format))
+    return rendered
+
+
+def image_sizes_create(image_id, sizes=None):
+    """Create the size variants of an Image missing from its sizes.
+
+    @:param image_id: str hashid of the original Image.
+    @:param sizes: tuple of pair of integers as ((width, height, ), ),
+        default = `settings.IMAGE_SIZES`.
+
+    @:return list of Image objects created.
+    """
+    from file_store.models import Image
+    image = Image.objects.get(pk=image_id)
+    if image.original_id or not image.image:
+        return []
+    existing = {
+        (size.width, size.height)
+        for size in image.sizes.filter(deleted_at__isnull=True)
+    }
+    with image.image.open('rb') as source:
+        rendered = thumbnails_render(
+            source,
+            sizes or settings.IMAGE_SIZES,
+            exclude=existing,
+        )
+    name = os.path.splitext(os.path.basename(image.image.name))[0]
+    created = []
+    for (width, height), content, output_format in rendered:
+        extension = output_format.lower().replace('jpeg', 'jpg')
+        created.append(Image.objects.create(
+            title=image.title,
+            mime=f'image/{output_format.lower()}',
+            profile_id=image.profile_id,
+            original=image,
+            image=ContentFile(
+                content,
+                name=f'{name}_{width}x{height}.{extension}',
+            ),
+        ))
+    logger.info(f'Image {image.pk}: {len(created)} sizes created.')
+    return created
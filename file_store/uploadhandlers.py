@@ -0,0 +1,45 @@
+"""Upload handlers hashing uploads while received."""
+
+import hashlib
+
+from django.core.files.uploadhandler import (
+    MemoryFileUploadHandler,
+    TemporaryFileUploadHandler,
+)
+
+
+class DigestUploadHandlerMixin:
+    """Hash the chunks of an upload as they are received.
+
+    The SHA-256 digest is set as `content_digest` of the uploaded file,
+    `ContentAddressedStorage` then stores it without reading it again.
+    """
+
+    def new_file(self, *args, **kwargs):
+        # Set before the handler claiming the file stops later handlers.
+        self.digest = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        self.digest.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded = super().file_complete(file_size)
+        if uploaded is not None:
+            uploaded.content_digest = self.digest.hexdigest()
+        return uploaded
+
+
+class DigestMemoryFileUploadHandler(
+        DigestUploadHandlerMixin,
+        MemoryFileUploadHandler,
+):
+    """Hash uploads small enough to be held in memory."""
+
+
+class DigestTemporaryFileUploadHandler(
+        DigestUploadHandlerMixin,
+        TemporaryFileUploadHandler,
+):
+    """Hash uploads streamed to a temporary file."""
@@ -5,11 +5,13 @@ from rest_framework import routers
 from file_store.views import (
     ImageViewSet,
     DocumentViewSet,
+    DocumentUploadViewSet,
 )
 
 
 router = routers.SimpleRouter()
 router.register(r'image', ImageViewSet)
 router.register(r'document', DocumentViewSet)
+router.register(r'document_upload', DocumentUploadViewSet)
 
 urlpatterns = router.urls
@@ -1,18 +1,37 @@
 """FileStore app views."""
 
-from rest_framework import (status, viewsets, filters, )
+import os
+from hashlib import md5
+
+from django.conf import settings
+from django.http import Http404
+from rest_framework import (status, viewsets, filters, mixins, )
 from rest_framework import (decorators, permissions, )
 from rest_framework.response import Response
 
 from authentication.models import Profile
+from authentication.permissions import object_permission_cached
 from books.permissions import OwnerAndAdminPermission
+from bookworm.views import (
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
+)
+from file_store.exceptions import (
+    UploadCompletedValidationError,
+    UploadIncompleteValidationError,
+    UploadOffsetValidationError,
+    UploadSizeValidationError,
+)
 from file_store.models import (
     Image,
     Document,
 )
+from file_store.models_upload import DocumentUpload
+from file_store.responses import file_response
 from file_store.serializers import (
     ImageSerializer,
     DocumentSerializer,
+    DocumentUploadSerializer,
 )
 
 
@@ -28,17 +47,22 @@ class FilePermission(permissions.IsAuthenticated):
             return True
         return authenticated
 
+    @object_permission_cached
     def has_object_permission(self, request, view, obj):
         """Documents may only be changed by an administrator otherwise read."""
         if request.method not in permissions.SAFE_METHODS:
             return (
-                obj.profile.id == request.user.profile.id or
+                obj.profile_id == request.user.profile.id or
                 request.user.profile.type >= Profile.TYPES.admin
             )
         return request.method in permissions.SAFE_METHODS
 
 
-class ImageViewSet(viewsets.ModelViewSet):
+class ImageViewSet(
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
+        viewsets.ModelViewSet,
+):
     queryset = Image.objects.all()
     serializer_class = ImageSerializer
     filter_backends = (filters.SearchFilter,)
@@ -143,9 +167,150 @@ class ImagableViewSet:
         )
 
 
-class DocumentViewSet(viewsets.ModelViewSet):
+class DocumentViewSet(
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
+        viewsets.ModelViewSet,
+):
     queryset = Document.objects.all()
     serializer_class = DocumentSerializer
     filter_backends = (filters.SearchFilter,)
     search_fields = ('title', 'description', )
     permission_classes = (FilePermission, )
+
+    @decorators.detail_route(methods=['get'])
+    def download(self, request, pk, **kwargs):
+        """Stream the file of a Document.
+
+        Supports `Range` requests for a single byte range, `If-Range`, and
+        conditional requests with `If-None-Match` or `If-Modified-Since`.
+        """
+        document = self.get_object()
+        if not document.file:
+            raise Http404()
+        etag = md5(
+            f'{document.pk}:{document.file.name}:'
+            f'{document.modified_at.isoformat()}'.encode(),
+        ).hexdigest()
+        return file_response(
+            request,
+            document.file,
+            etag,
+            document.modified_at,
+            filename=os.path.basename(document.file.name),
+            content_type=document.mime or 'application/octet-stream',
+        )
+
+
+class DocumentUploadViewSet(
+        mixins.CreateModelMixin,
+        mixins.RetrieveModelMixin,
+        viewsets.GenericViewSet,
+):
+    """Resumable chunked uploads of Document files.
+
+    An upload is started declaring the `filename` and `size` of the file,
+    chunks are then sent in order as the raw body of `PATCH` requests to
+    `chunk` with their start in an `Upload-Offset` header. Retrieving the
+    upload supplies the offset to resume from, `complete` creates the
+    Document once every byte is received.
+    """
+
+    queryset = DocumentUpload.objects.all()
+    serializer_class = DocumentUploadSerializer
+    permission_classes = (OwnerAndAdminPermission, )
+
+    def get_queryset(self):
+        return super().get_queryset().filter(
+            profile=self.request.user.profile,
+        )
+
+    def perform_create(self, serializer):
+        serializer.save(profile=self.request.user.profile)
+
+    def _upload_error_handle(self, error, status_response=None):
+        """Handle errors from appending or completing an upload.
+
+        @:param error: Exception object.
+        @:param status_response: int
+
+        @:return Response with 400 status code, unless defined.
+        """
+        return Response(
+            {
+                'status': 'error',
+                'ok': '💩',
+                'error': error.detail,
+            },
+            status=status_response or status.HTTP_400_BAD_REQUEST,
+        )
+
+    @decorators.detail_route(methods=['patch'])
+    def chunk(self, request, pk, **kwargs):
+        """Append the raw body of the request at `Upload-Offset`."""
+        upload = self.get_object()
+        try:
+            offset = int(request.META.get('HTTP_UPLOAD_OFFSET', ''))
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return Response(
+                {
+                    'status': 'error',
+                    'ok': '💩',
+                    'error': 'Upload-Offset and Content-Length are required.',
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if length > settings.DOCUMENT_UPLOAD_CHUNK_MAX_SIZE:
+            return Response(
+                {
+                    'status': 'error',
+                    'ok': '💩',
+                    'error': f'Chunks are limited to '
+                             f'{settings.DOCUMENT_UPLOAD_CHUNK_MAX_SIZE} '
+                             f'bytes.',
+                },
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+        try:
+            upload.append(request.stream, offset, length)
+        except UploadOffsetValidationError as error:
+            return self._upload_error_handle(error, status.HTTP_409_CONFLICT)
+        except (
+                UploadSizeValidationError,
+                UploadCompletedValidationError,
+        ) as error:
+            return self._upload_error_handle(error)
+        response = Response(
+            {
+                'status': 'appended',
+                'ok': '🖖',
+                'offset': upload.offset,
+                'size': upload.size,
+            },
+        )
+        response['Upload-Offset'] = upload.offset
+        return response
+
+    @decorators.detail_route(methods=['post'])
+    def complete(self, request, pk, **kwargs):
+        """Create the Document of a fully received upload."""
+        upload = self.get_object()
+        try:
+            document = upload.complete()
+        except (
+                UploadIncompleteValidationError,
+                UploadCompletedValidationError,
+        ) as error:
+            return self._upload_error_handle(error)
+        return Response(
+            {
+                'status': 'completed',
+                'ok': '🖖',
+                'document': DocumentSerializer(
+                    document,
+                    context=self.get_serializer_context(),
+                ).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
@@ -7,4 +7,5 @@ class MetaInfoConfig(AppConfig):
 
     def ready(self):
         from meta_info import models_localisation  # noqa
+        from meta_info import models_publication  # noqa
         from meta_info import signals  # noqa
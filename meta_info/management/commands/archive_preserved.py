@@ -0,0 +1,44 @@
+"""Command to archive and purge soft deleted rows past retention."""
+
+import logging
+
+from django.core.management import BaseCommand
+
+from meta_info.tasks import archive_preserved_task
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Archive soft deleted rows to compressed JSON lines and purge them."""
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=None,
+            help='Days rows are kept after deletion.',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Rows archived per batch.',
+        )
+
+    def handle(self, *args, **options):
+        """Archive each model and report rows and bytes reclaimed."""
+        reports = archive_preserved_task(
+            retention_days=options['retention_days'],
+            batch_size=options['batch_size'],
+        )
+        for label, report in reports.items():
+            self.stdout.write(
+                f'{label}: {report["rows"]} rows, '
+                f'{report["through_rows"]} relation rows, '
+                f'{report["bytes_reclaimed"]} bytes reclaimed, '
+                f'{report["bytes_archived"]} bytes archived.'
+            )
@@ -0,0 +1,115 @@
+"""Command comparing query plans with and without partial indexes."""
+
+import logging
+from time import perf_counter
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django_common.auth_backends import User
+
+from bookworm.operations import preserved_index_name
+from posts.models import Emote
+
+
+logger = logging.getLogger(__name__)
+
+
+class Rollback(Exception):
+    """Discard the seeded dataset."""
+
+
+class Command(BaseCommand):
+    """Benchmark live Emote lookups of a profile on a seeded dataset.
+
+    Emotes are seeded with a majority soft deleted, the plan and timing of
+    `Emote.objects.filter(profile=...)` are reported without the partial
+    index then with it. Everything is rolled back afterwards.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=50000,
+            help='Emotes seeded.',
+        )
+        parser.add_argument(
+            '--deleted',
+            type=float,
+            default=0.9,
+            help='Ratio of seeded Emotes soft deleted.',
+        )
+        parser.add_argument(
+            '--profiles',
+            type=int,
+            default=20,
+            help='Profiles the seeded Emotes are spread across.',
+        )
+
+    def _seed(self, rows, deleted, profiles):
+        profiles = [
+            User.objects.create_user(
+                f'benchmark-{index}',
+                f'benchmark-{index}@example.com',
+            ).profile
+            for index in range(profiles)
+        ]
+        Emote.objects.bulk_create(
+            [
+                Emote(
+                    type=index % len(Emote.EMOTES),
+                    profile=profiles[index % len(profiles)],
+                )
+                for index in range(rows)
+            ],
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {Emote._meta.db_table} SET deleted_at = now() '
+                f'WHERE random() < %s',
+                [deleted],
+            )
+            cursor.execute(f'ANALYZE {Emote._meta.db_table}')
+        return profiles[0]
+
+    def _explain(self, label, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            started = perf_counter()
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {sql}', params)
+            plan = [row[0] for row in cursor.fetchall()]
+            elapsed = (perf_counter() - started) * 1000
+        self.stdout.write(f'{label} ({elapsed:.2f}ms)')
+        for line in plan:
+            self.stdout.write(f'    {line}')
+
+    def handle(self, *args, **options):
+        """Seed, explain with and without the partial index, roll back."""
+        index_name = connection.ops.quote_name(
+            preserved_index_name(Emote, 'profile'),
+        )
+        try:
+            with transaction.atomic():
+                profile = self._seed(
+                    options['rows'],
+                    options['deleted'],
+                    options['profiles'],
+                )
+                queryset = Emote.objects.filter(profile=profile)
+                with connection.cursor() as cursor:
+                    cursor.execute(f'DROP INDEX {index_name}')
+                self._explain('Before: deleted_at filtered per row', queryset)
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f'CREATE INDEX {index_name} '
+                        f'ON {Emote._meta.db_table} (profile_id) '
+                        f'WHERE deleted_at IS NULL'
+                    )
+                    cursor.execute(f'ANALYZE {Emote._meta.db_table}')
+                self._explain('After: partial index on live rows', queryset)
+                raise Rollback()
+        except Rollback:
+            logger.info('Seeded benchmark data rolled back.')
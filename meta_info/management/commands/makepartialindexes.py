@@ -0,0 +1,85 @@
+"""Command to generate migrations of partial indexes for preserved models."""
+
+import logging
+
+from django.apps import apps
+from django.core.management import BaseCommand
+from django.db import migrations
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.writer import MigrationWriter
+
+from bookworm.operations import (
+    AddPartialIndex,
+    preserved_index_operations,
+    preserved_models,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Index live rows of foreign key and lookup columns of preserved models.
+
+    Migrations are written per app with partial indexes on
+    `deleted_at IS NULL` not already created by an existing migration.
+    """
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'app_label',
+            nargs='*',
+            help='Apps to generate migrations for, defaults to all.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only list the partial indexes missing.',
+        )
+
+    def _existing_indexes(self, loader, app_label):
+        """Names of partial indexes created by an apps migrations."""
+        return {
+            operation.name
+            for (label, name), migration in loader.disk_migrations.items()
+            if label == app_label
+            for operation in migration.operations
+            if isinstance(operation, AddPartialIndex)
+        }
+
+    def handle(self, *args, **options):
+        """Write a migration per app with missing partial indexes."""
+        loader = MigrationLoader(None, ignore_no_migrations=True)
+        app_labels = options['app_label'] or [
+            app_config.label for app_config in apps.get_app_configs()
+        ]
+        for app_label in app_labels:
+            existing = self._existing_indexes(loader, app_label)
+            operations = [
+                operation
+                for model in preserved_models(app_label)
+                for operation in preserved_index_operations(model, existing)
+            ]
+            if not operations:
+                continue
+            for operation in operations:
+                logger.info(f'{app_label}: {operation.describe()}')
+            if options['dry_run']:
+                continue
+            leaf_nodes = loader.graph.leaf_nodes(app_label)
+            number = 1
+            if leaf_nodes:
+                number += MigrationAutodetector.parse_number(leaf_nodes[0][1])
+            migration = migrations.Migration(
+                f'{number:04}_preserved_partial_indexes',
+                app_label,
+            )
+            migration.dependencies = leaf_nodes
+            migration.operations = operations
+            writer = MigrationWriter(migration)
+            with open(writer.path, 'w', encoding='utf-8') as migration_file:
+                migration_file.write(writer.as_string())
+            logger.info(f'{app_label}: {writer.path} written.')
@@ -0,0 +1,17 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meta_info', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['created_at', 'id'], name='meta_info_t_created_2ee259_idx'),
+        ),
+    ]
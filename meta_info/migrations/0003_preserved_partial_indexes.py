@@ -0,0 +1,84 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:25
+
+import bookworm.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meta_info', '0002_created_at_keyset_index'),
+    ]
+
+    operations = [
+        bookworm.operations.AddPartialIndex(
+            model_name='tag',
+            fields=['copy'],
+            name='meta_info_tag_copy_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='hashedtag',
+            fields=['copy'],
+            name='meta_info_hashedtag_copy_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='languagetag',
+            fields=['copy'],
+            name='meta_info_languagetag_copy_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='languagetag',
+            fields=['iso_639_2_t'],
+            name='meta_info_languagetag_iso_639_2_t_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='languagetag',
+            fields=['iso_639_2_b'],
+            name='meta_info_languagetag_iso_639_2_b_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='languagetag',
+            fields=['iso_639_3'],
+            name='meta_info_languagetag_iso_639_3_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='languagetag',
+            fields=['iso_639_3_original'],
+            name='meta_info_languagetag_iso_639_3_original_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='locationtag',
+            fields=['copy'],
+            name='meta_info_locationtag_copy_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='locationtag',
+            fields=['iso_alpha_2'],
+            name='meta_info_locationtag_iso_alpha_2_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='locationtag',
+            fields=['iso_alpha_3'],
+            name='meta_info_locationtag_iso_alpha_3_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='locationtag',
+            fields=['parent_location'],
+            name='meta_info_locationtag_parent_location_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='locationtag',
+            fields=['default_language'],
+            name='meta_info_locationtag_default_language_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='localisetag',
+            fields=['language'],
+            name='meta_info_localisetag_language_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='localisetag',
+            fields=['location'],
+            name='meta_info_localisetag_location_id_live',
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('meta_info', '0003_preserved_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublicationGrant',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('object_id', models.IntegerField()),
+                ('subject_key', models.CharField(max_length=255)),
+                ('granted', models.BooleanField(default=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='publication_grants+', to='contenttypes.ContentType', verbose_name='Published object type')),
+            ],
+            options={
+                'verbose_name': 'Publication Grant',
+                'verbose_name_plural': 'Publication Grants',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='publicationgrant',
+            index=models.Index(fields=['content_type', 'subject_key', 'granted', 'object_id'], name='meta_info_p_content_d9be01_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='publicationgrant',
+            unique_together={('content_type', 'object_id', 'subject_key')},
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 2.0.2 on 2026-10-18 21:00
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('meta_info', '0004_publication_grants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishedSnapshot',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('object_id', models.IntegerField()),
+                ('version', models.IntegerField()),
+                ('access', django.contrib.postgres.fields.jsonb.JSONField(default=dict)),
+                ('output', django.contrib.postgres.fields.jsonb.JSONField(blank=True, null=True)),
+                ('purged_at', models.DateTimeField(blank=True, null=True)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='published_snapshots+', to='contenttypes.ContentType', verbose_name='Published object type')),
+            ],
+            options={
+                'verbose_name': 'Published Snapshot',
+                'verbose_name_plural': 'Published Snapshots',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='publishedsnapshot',
+            unique_together={('content_type', 'object_id', 'version')},
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 2.0.2 on 2026-10-18 21:02
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.db.models.deletion
+import hashid_field.field
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('authentication', '0008_notifications'),
+        ('meta_info', '0005_published_snapshots'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PublishJob',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('modified_at', models.DateTimeField(auto_now=True)),
+                ('id', hashid_field.field.HashidAutoField(alphabet='abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890', min_length=7, primary_key=True, serialize=False)),
+                ('object_id', models.IntegerField()),
+                ('granted', django.contrib.postgres.fields.jsonb.JSONField(default=list)),
+                ('block', django.contrib.postgres.fields.jsonb.JSONField(default=list)),
+                ('status', models.IntegerField(blank=True, choices=[(0, 'Pending'), (1, 'Published'), (2, 'Unchanged'), (3, 'Failed')], default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='publish_jobs+', to='contenttypes.ContentType', verbose_name='Published object type')),
+                ('profile', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='publish_jobs+', to='authentication.Profile', verbose_name='Profile publishing')),
+            ],
+            options={
+                'verbose_name': 'Publish Job',
+                'verbose_name_plural': 'Publish Jobs',
+            },
+        ),
+        migrations.AddField(
+            model_name='publishedsnapshot',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='publishedsnapshot',
+            name='diff',
+            field=django.contrib.postgres.fields.jsonb.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='publishjob',
+            name='snapshot',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='meta_info.PublishedSnapshot', verbose_name='Version published'),
+        ),
+    ]
@@ -82,6 +82,9 @@ class Tag(TagMixin, PreserveModelMixin):
     class Meta:
         verbose_name = 'Tag'
         verbose_name_plural = 'Tags'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     def __str__(self):
         """Display only as URI valid slug."""
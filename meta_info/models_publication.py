@@ -0,0 +1,455 @@
+"""Publication models."""
+
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import JSONField
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from model_utils import Choices
+from hashid_field import HashidAutoField
+
+from bookworm.claim import queryset_claim
+from bookworm.mixins import CreatedModelMixin, ModifiedModelMixin
+from bookworm.structural_diff import structure_diff, structure_patch
+
+
+logger = logging.getLogger(__name__)
+
+
+class PublicationGrantManager(models.Manager):
+    """Manage access granted and denied to published objects."""
+
+    def for_object(self, instance):
+        """Grants of a published object.
+
+        @:param instance: Model object published.
+
+        @:return QuerySet
+        """
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_id=int(instance.pk),
+        )
+
+    def grants_replace(self, instance, granted_keys, denied_keys):
+        """Replace the grants of a published object.
+
+        Denying a subject overrides granting it.
+
+        @:param instance: Model object published.
+        @:param granted_keys: list of str subject keys granted access.
+        @:param denied_keys: list of str subject keys denied access.
+
+        @:return list of PublicationGrant
+        """
+        grants = dict.fromkeys(granted_keys, True)
+        grants.update(dict.fromkeys(denied_keys, False))
+        self.for_object(instance).delete()
+        content_type = ContentType.objects.get_for_model(instance)
+        return self.bulk_create([
+            PublicationGrant(
+                content_type=content_type,
+                object_id=int(instance.pk),
+                subject_key=subject_key,
+                granted=granted,
+            )
+            for subject_key, granted in grants.items()
+        ])
+
+    def has_access(self, instance, subject_key, global_key):
+        """Identify if a subject can access a published object.
+
+        A single lookup of the unique index of the object grants.
+
+        @:param instance: Model object published.
+        @:param subject_key: str key of the subject accessing.
+        @:param global_key: str key granting access to every subject.
+
+        @:return bool
+        """
+        grants = dict(self.for_object(instance).filter(
+            subject_key__in=[subject_key, global_key],
+        ).values_list('subject_key', 'granted'))
+        if grants.get(subject_key) is False:
+            return False
+        return bool(grants.get(subject_key) or grants.get(global_key))
+
+    def visible_ids(self, model, subject_key, global_key):
+        """Ids of the objects of a model a subject can access.
+
+        @:param model: Model class published.
+        @:param subject_key: str key of the subject accessing.
+        @:param global_key: str key granting access to every subject.
+
+        @:return QuerySet of int object ids, usable as a subquery.
+        """
+        grants = self.filter(
+            content_type=ContentType.objects.get_for_model(model),
+        )
+        return grants.filter(
+            subject_key__in=[subject_key, global_key],
+            granted=True,
+        ).exclude(
+            object_id__in=grants.filter(
+                subject_key=subject_key,
+                granted=False,
+            ).values('object_id'),
+        ).values('object_id')
+
+
+class PublicationGrant(CreatedModelMixin):
+    """Access of a subject to a published object, granted or denied.
+
+    Written by `PublishableModelMixin.publish`, so access checks are an
+    indexed lookup rather than a scan of the published access lists.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType,
+        related_name='publication_grants+',
+        verbose_name=_('Published object type'),
+        on_delete=models.CASCADE,
+    )
+    object_id = models.IntegerField()
+    subject_key = models.CharField(
+        max_length=255,
+    )
+    granted = models.BooleanField(
+        default=True,
+    )
+
+    objects = PublicationGrantManager()
+
+    class Meta:
+        verbose_name = 'Publication Grant'
+        verbose_name_plural = 'Publication Grants'
+        unique_together = ('content_type', 'object_id', 'subject_key', )
+        indexes = [
+            models.Index(
+                fields=['content_type', 'subject_key', 'granted', 'object_id'],
+            ),
+        ]
+
+    def __str__(self):
+        """String representation of this model."""
+        return (
+            f'PublicationGrant({self.content_type_id}#{self.object_id}: '
+            f'{self.subject_key}, {self.granted})'
+        )
+
+
+class PublishedSnapshotManager(models.Manager):
+    """Manage the published versions of objects."""
+
+    def for_object(self, instance):
+        """Snapshots of a published object.
+
+        @:param instance: Model object published.
+
+        @:return QuerySet
+        """
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_id=int(instance.pk),
+        )
+
+    def snapshot_create(self, instance, access, output):
+        """Store the next published version of an object.
+
+        Only the latest version holds its whole output, the version it
+        follows keeps the structural difference back to its own output.
+        Nothing is stored when the output and access are unchanged.
+        Versions of an object are numbered from 1, the object is expected to
+        be locked by the transaction publishing it.
+
+        @:param instance: Model object published.
+        @:param access: dict of access granted and denied.
+        @:param output: dict serialized representation published.
+
+        @:return tuple of PublishedSnapshot and bool created.
+        """
+        content = json.loads(json.dumps(
+            {'access': access, 'output': output},
+            cls=DjangoJSONEncoder,
+        ))
+        content_hash = hashlib.sha256(
+            json.dumps(content, sort_keys=True).encode(),
+        ).hexdigest()
+        latest = self.for_object(instance).order_by('-version').first()
+        if (
+                latest and
+                latest.content_hash == content_hash and
+                latest.purged_at is None
+        ):
+            return latest, False
+        snapshot = self.create(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_id=int(instance.pk),
+            version=latest.version + 1 if latest else 1,
+            content_hash=content_hash,
+            access=content['access'],
+            output=content['output'],
+        )
+        if latest and latest.output is not None:
+            latest.diff = structure_diff(content['output'], latest.output)
+            latest.output = None
+            latest.save(update_fields=['diff', 'output'])
+        return snapshot, True
+
+    def version_output(self, instance, version):
+        """Output of an object as published in a version.
+
+        The output of the latest version is patched back by the difference
+        kept by each version down to the one requested.
+
+        @:param instance: Model object published.
+        @:param version: int version published.
+
+        @:return dict, or None when the version is missing or purged.
+        """
+        snapshots = self.for_object(instance).filter(
+            version__gte=version,
+        ).order_by('-version').only('version', 'output', 'diff', 'purged_at')
+        output = None
+        for snapshot in snapshots:
+            if snapshot.purged_at:
+                return None
+            if snapshot.output is not None:
+                output = snapshot.output
+            elif output is not None:
+                output = structure_patch(output, snapshot.diff)
+            if snapshot.version == version:
+                return output
+        return None
+
+    def history(self, instance):
+        """Published versions of an object, latest first, without output.
+
+        @:param instance: Model object published.
+
+        @:return QuerySet
+        """
+        return self.for_object(instance).order_by('-version').only(
+            'version',
+            'created_at',
+            'purged_at',
+        )
+
+    def purge(self, instance):
+        """Remove the output of every published version of an object.
+
+        @:param instance: Model object published.
+
+        @:return int snapshots purged.
+        """
+        return self.for_object(instance).filter(
+            purged_at__isnull=True,
+        ).update(
+            output=None,
+            diff=None,
+            purged_at=timezone.now(),
+        )
+
+
+class PublishedSnapshot(CreatedModelMixin):
+    """Version of an object as published, with the access it was given.
+
+    The latest version holds the output published, previous versions the
+    structural difference from the version following them.
+    """
+
+    content_type = models.ForeignKey(
+        ContentType,
+        related_name='published_snapshots+',
+        verbose_name=_('Published object type'),
+        on_delete=models.CASCADE,
+    )
+    object_id = models.IntegerField()
+    version = models.IntegerField()
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+    )
+    access = JSONField(
+        default=dict,
+    )
+    output = JSONField(
+        blank=True,
+        null=True,
+    )
+    diff = JSONField(
+        blank=True,
+        null=True,
+    )
+    purged_at = models.DateTimeField(
+        blank=True,
+        null=True,
+    )
+
+    objects = PublishedSnapshotManager()
+
+    class Meta:
+        verbose_name = 'Published Snapshot'
+        verbose_name_plural = 'Published Snapshots'
+        unique_together = ('content_type', 'object_id', 'version', )
+
+    def __str__(self):
+        """String representation of this model."""
+        return (
+            f'PublishedSnapshot({self.content_type_id}#{self.object_id}: '
+            f'v{self.version})'
+        )
+
+
+class PublishJobManager(models.Manager):
+    """Manage publishing of objects in the background."""
+
+    def job_create(self, instance, profile, granted_list, block_list):
+        """Record publishing of an object to run once committed.
+
+        @:param instance: Model object to publish.
+        @:param profile: Profile publishing.
+        @:param granted_list: tuple supplied to `publish`.
+        @:param block_list: tuple supplied to `publish`.
+
+        @:return PublishJob
+        """
+        from meta_info.tasks import publish_job_task
+        job = self.create(
+            content_type=ContentType.objects.get_for_model(instance),
+            object_id=int(instance.pk),
+            profile=profile,
+            granted=granted_list,
+            block=block_list,
+        )
+        transaction.on_commit(lambda: publish_job_task.delay(str(job.pk)))
+        return job
+
+    def job_run(self, job_id):
+        """Publish the object of a pending job.
+
+        @:param job_id: str PublishJob id.
+
+        The job is claimed by an UPDATE holding its row until published, a
+        job run again concurrently is left out once claimed. Publishing
+        raising any error is rolled back, the job is then marked failed and
+        the error logged with its traceback.
+
+        @:return PublishJob, or None when not pending.
+        """
+        try:
+            with transaction.atomic():
+                claimed = queryset_claim(
+                    self.filter(
+                        pk=job_id,
+                        status=PublishJob.STATUSES.pending,
+                    ),
+                    1,
+                    modified_at=timezone.now(),
+                )
+                if not claimed:
+                    return None
+                job = self.get(pk=job_id)
+                publishing = job.publishing()
+                snapshot, created = publishing.publish_now(
+                    job.granted,
+                    job.block,
+                )
+                job.snapshot = snapshot
+                job.status = (
+                    PublishJob.STATUSES.published if created
+                    else PublishJob.STATUSES.unchanged
+                )
+                job.save()
+                return job
+        except Exception as error:
+            logger.exception(f'PublishJob({job_id}) failed: {error}')
+            self.filter(pk=job_id).update(
+                status=PublishJob.STATUSES.failed,
+                error=str(error),
+                modified_at=timezone.now(),
+            )
+            return self.filter(pk=job_id).first()
+
+
+class PublishJob(ModifiedModelMixin):
+    """Publishing of an object requested, run in the background."""
+
+    STATUSES = Choices(
+        (0, 'pending', _('Pending')),
+        (1, 'published', _('Published')),
+        (2, 'unchanged', _('Unchanged')),
+        (3, 'failed', _('Failed')),
+    )
+
+    id = HashidAutoField(
+        primary_key=True,
+        salt=settings.SALT_METAINFO_PUBLISHJOB,
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        related_name='publish_jobs+',
+        verbose_name=_('Published object type'),
+        on_delete=models.CASCADE,
+    )
+    object_id = models.IntegerField()
+    profile = models.ForeignKey(
+        'authentication.Profile',
+        related_name='publish_jobs+',
+        verbose_name=_('Profile publishing'),
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+    )
+    granted = JSONField(
+        default=list,
+    )
+    block = JSONField(
+        default=list,
+    )
+    status = models.IntegerField(
+        choices=STATUSES,
+        default=STATUSES.pending,
+        blank=True,
+    )
+    snapshot = models.ForeignKey(
+        PublishedSnapshot,
+        related_name='+',
+        verbose_name=_('Version published'),
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+    error = models.TextField(
+        blank=True,
+        default='',
+    )
+
+    objects = PublishJobManager()
+
+    class Meta:
+        verbose_name = 'Publish Job'
+        verbose_name_plural = 'Publish Jobs'
+
+    def __str__(self):
+        """String representation of this model."""
+        return f'PublishJob({self.id}: {self.status})'
+
+    def publishing(self):
+        """Object this job publishes.
+
+        @:return Model object.
+
+        @:raises ObjectDoesNotExist
+        """
+        model = self.content_type.model_class()
+        return model._default_manager.get(
+            pk=model._meta.pk.to_python(self.object_id),
+        )
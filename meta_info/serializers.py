@@ -6,6 +6,7 @@ from meta_info.models import (
     Tag,
     MetaInfo,
 )
+from meta_info.models_publication import PublishJob
 
 
 class TagSlugSerializer(serializers.ModelSerializer):
@@ -106,3 +107,33 @@ class MetaInfoAvailabledSerializerMixin:
                 'meta_info': meta_info,
             })
         return super().create(validated_data)
+
+
+class PublishJobSerializer(serializers.ModelSerializer):
+    """PublishJob model serializer."""
+    id = serializers.HyperlinkedRelatedField(
+        many=False,
+        read_only=True,
+        view_name='publishjob-detail',
+    )
+    status = serializers.CharField(
+        source='get_status_display',
+        read_only=True,
+    )
+    version = serializers.IntegerField(
+        source='snapshot.version',
+        read_only=True,
+        default=None,
+    )
+
+    class Meta:
+        model = PublishJob
+        read_only_fields = (
+            'id',
+            'status',
+            'version',
+            'error',
+            'created_at',
+            'modified_at',
+        )
+        fields = read_only_fields
@@ -2,11 +2,18 @@
 
 import logging
 
-from django.db.models.signals import pre_save
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
 from django.dispatch import receiver
 from django.utils.text import slugify
 
-from meta_info.models import Tag
+from bookworm.cache import cache_version_changed
+
+from meta_info.models import MetaInfo, Tag
 from meta_info.models_localisation import (LocationTag, LanguageTag)
 
 
@@ -32,3 +39,33 @@ def pre_save_language_tag(sender, instance, *args, **kwargs):
     if len(instance.slug) > 50:
         instance.slug = '{}'.format(instance.slug[:50])
     logger.debug('Tag {}.slug updated'.format(instance.copy))
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def post_change_cache_version(sender, instance, *args, **kwargs):
+    """Invalidate cached representations of Tags."""
+    cache_version_changed(sender)
+
+
+@receiver(m2m_changed, sender=Tag.tags.through)
+def m2m_changed_tag_cache_version(sender, instance, action, *args,
+                                  **kwargs):
+    """Invalidate cached representations of Tags with changed tags."""
+    if action.startswith('post_'):
+        cache_version_changed(Tag)
+
+
+@receiver(post_save, sender=MetaInfo)
+@receiver(post_delete, sender=MetaInfo)
+def post_change_meta_info_cache_version(sender, instance, *args, **kwargs):
+    """Invalidate cached representations of MetaInfo."""
+    cache_version_changed(sender)
+
+
+@receiver(m2m_changed, sender=MetaInfo.tags.through)
+def m2m_changed_meta_info_cache_version(sender, instance, action, *args,
+                                        **kwargs):
+    """Invalidate cached representations of MetaInfo with changed tags."""
+    if action.startswith('post_'):
+        cache_version_changed(MetaInfo)
@@ -0,0 +1,43 @@
+"""Tasks for meta information and preserved model maintenance."""
+
+import logging
+
+from celery import shared_task
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def archive_preserved_task(retention_days=None, batch_size=None):
+    """Archive and purge soft deleted rows past retention.
+
+    @:param retention_days: int days rows are kept after deletion.
+    @:param batch_size: int rows per batch.
+
+    @:returns dict of model label and report of rows and bytes.
+    """
+    from bookworm.archive import archive_model, archive_models
+    reports = {}
+    for model in archive_models():
+        reports[model._meta.label] = archive_model(
+            model,
+            retention_days=retention_days,
+            batch_size=batch_size,
+        )
+        logger.info(f'Archived {model._meta.label}: '
+                    f'{reports[model._meta.label]}')
+    return reports
+
+
+@shared_task
+def publish_job_task(job_id):
+    """Publish the object of a PublishJob.
+
+    @:param job_id: str PublishJob id.
+
+    @:returns int status of the job, or None when it was not pending.
+    """
+    from meta_info.models_publication import PublishJob
+    job = PublishJob.objects.job_run(job_id)
+    return job.status if job else None
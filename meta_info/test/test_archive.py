@@ -0,0 +1,54 @@
+"""Archival and purge tests for soft deleted rows."""
+
+import gzip
+import json
+import os
+from datetime import timedelta
+
+from django.test import override_settings
+from django.utils import timezone
+
+from bookworm.archive import archive_model
+from books.test import BookFactory
+from meta_info.models import MetaInfo
+from posts.models import Emote
+from posts.test import EmoteFactory
+
+
+def test_archive_model_purges_expired(tmpdir, profile):
+    """Soft deleted rows past retention are archived then purged."""
+    book = BookFactory()
+    emote = book.emoted(Emote.EMOTES.heart, profile)
+    Emote.all_objects.filter(pk=emote.pk).update(
+        deleted_at=timezone.now() - timedelta(days=100),
+    )
+    recent = EmoteFactory(deleted_at=timezone.now() - timedelta(days=1))
+    live = EmoteFactory()
+    with override_settings(ARCHIVE_ROOT=str(tmpdir)):
+        report = archive_model(Emote, retention_days=90)
+    assert report['rows'] == 1
+    assert report['through_rows'] == 1
+    assert report['bytes_reclaimed'] > 0
+    assert not Emote.all_objects.filter(pk=emote.pk).exists()
+    assert Emote.all_objects.filter(pk=recent.pk).exists()
+    assert Emote.objects.filter(pk=live.pk).exists()
+    assert not book.emotes.through.objects.filter(emote=emote.pk).exists()
+    directory = os.path.join(str(tmpdir), 'posts', 'emote')
+    archives = os.listdir(directory)
+    assert len(archives) == 1
+    with gzip.open(os.path.join(directory, archives[0]), 'rt') as archive:
+        records = [json.loads(line) for line in archive]
+    assert records[0]['pk'] == str(emote.pk)
+
+
+def test_archive_model_keeps_referenced(tmpdir):
+    """Soft deleted rows still referenced by other rows are kept."""
+    meta_info = MetaInfo.objects.create()
+    BookFactory(meta_info=meta_info)
+    MetaInfo.all_objects.filter(pk=meta_info.pk).update(
+        deleted_at=timezone.now() - timedelta(days=100),
+    )
+    with override_settings(ARCHIVE_ROOT=str(tmpdir)):
+        report = archive_model(MetaInfo, retention_days=90)
+    assert report['rows'] == 0
+    assert MetaInfo.all_objects.filter(pk=meta_info.pk).exists()
@@ -0,0 +1,40 @@
+"""Partial index tests for preserved models."""
+
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+
+from bookworm.operations import (
+    AddPartialIndex,
+    preserved_index_name,
+    preserved_index_operations,
+    preserved_models,
+)
+from posts.models import Emote
+
+
+def test_preserved_partial_indexes_migrated():
+    """Every preserved model has its partial indexes within migrations."""
+    loader = MigrationLoader(None, ignore_no_migrations=True)
+    existing = {
+        operation.name
+        for migration in loader.disk_migrations.values()
+        for operation in migration.operations
+        if isinstance(operation, AddPartialIndex)
+    }
+    missing = [
+        operation.name
+        for model in preserved_models()
+        for operation in preserved_index_operations(model, existing)
+    ]
+    assert not missing
+
+
+def test_preserved_partial_index_condition():
+    """Partial indexes only contain rows not soft deleted."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT indexdef FROM pg_indexes WHERE indexname = %s',
+            [preserved_index_name(Emote, 'profile')],
+        )
+        definition = cursor.fetchone()[0]
+    assert 'WHERE (deleted_at IS NULL)' in definition
@@ -0,0 +1,64 @@
+"""Publication grant access checks."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from books.models import Book
+from books.test import BookFactory
+from bookworm.mixins_publishable import PublishableModelMixin
+from meta_info.models_publication import PublicationGrant
+
+
+GLOBAL = PublishableModelMixin.PUBLISHED_GLOBAL_KEY
+
+
+def test_grants_access():
+    """Subjects granted may access, denied override global grants."""
+    book = BookFactory()
+    PublicationGrant.objects.grants_replace(
+        book,
+        ['reader', 'banned', GLOBAL],
+        ['banned'],
+    )
+    assert PublicationGrant.objects.has_access(book, 'reader', GLOBAL)
+    assert PublicationGrant.objects.has_access(book, 'anyone', GLOBAL)
+    assert not PublicationGrant.objects.has_access(book, 'banned', GLOBAL)
+
+
+def test_grants_replaced():
+    """Publishing again replaces the previous grants."""
+    book = BookFactory()
+    PublicationGrant.objects.grants_replace(book, ['reader', GLOBAL], [])
+    PublicationGrant.objects.grants_replace(book, ['other'], ['reader'])
+    assert PublicationGrant.objects.for_object(book).count() == 2
+    assert not PublicationGrant.objects.has_access(book, 'reader', GLOBAL)
+    assert not PublicationGrant.objects.has_access(book, 'anyone', GLOBAL)
+    assert PublicationGrant.objects.has_access(book, 'other', GLOBAL)
+
+
+def test_grants_single_query():
+    """Access checks are a single query however many subjects granted."""
+    book = BookFactory()
+    PublicationGrant.objects.grants_replace(
+        book,
+        [f'reader-{n}' for n in range(200)],
+        [],
+    )
+    PublicationGrant.objects.has_access(book, 'reader-0', GLOBAL)
+    with CaptureQueriesContext(connection) as context:
+        assert PublicationGrant.objects.has_access(book, 'reader-199', GLOBAL)
+    assert len(context) == 1
+
+
+def test_visible_ids():
+    """Objects visible to a subject are filtered in one query."""
+    granted, denied, global_book, hidden = [BookFactory() for _ in range(4)]
+    PublicationGrant.objects.grants_replace(granted, ['reader'], [])
+    PublicationGrant.objects.grants_replace(denied, [GLOBAL], ['reader'])
+    PublicationGrant.objects.grants_replace(global_book, [GLOBAL], [])
+    visible = Book.objects.filter(
+        pk__in=PublicationGrant.objects.visible_ids(Book, 'reader', GLOBAL),
+    )
+    assert sorted(str(book.pk) for book in visible) == sorted(
+        [str(granted.pk), str(global_book.pk)],
+    )
@@ -0,0 +1,121 @@
+"""Background publishing, structural differences of published versions."""
+
+from django.contrib.contenttypes.models import ContentType
+
+from books.models import Book
+from books.test import BookFactory
+from bookworm.structural_diff import structure_diff, structure_patch
+from meta_info.models_publication import PublishedSnapshot, PublishJob
+
+
+def test_structure_diff():
+    """Differences patch the old document into the new one."""
+    old = {'title': 'Old', 'meta': {'pages': 10, 'isbn': 'x'}, 'tags': [1]}
+    new = {'title': 'New', 'meta': {'pages': 10, 'isbn': None}}
+    diff = structure_diff(old, new)
+    assert diff == {
+        'set': {'title': 'New'},
+        'unset': ['tags'],
+        'patch': {'meta': {'set': {'isbn': None}}},
+    }
+    assert structure_patch(old, diff) == new
+    assert structure_diff(new, new) is None
+    assert structure_patch(old, structure_diff(old, [1])) == [1]
+
+
+def test_snapshot_unchanged():
+    """Publishing the same output and access stores nothing."""
+    book = BookFactory()
+    first, created = PublishedSnapshot.objects.snapshot_create(
+        book,
+        {'granted_flat': ['global-keyword']},
+        {'title': 'Title'},
+    )
+    assert created
+    again, created = PublishedSnapshot.objects.snapshot_create(
+        book,
+        {'granted_flat': ['global-keyword']},
+        {'title': 'Title'},
+    )
+    assert not created
+    assert again.pk == first.pk
+    assert PublishedSnapshot.objects.for_object(book).count() == 1
+
+
+def test_snapshot_differences():
+    """Only the latest version holds its output, others are patched."""
+    book = BookFactory()
+    outputs = [
+        {'title': 'First', 'summary': 'Long summary', 'pages': 100},
+        {'title': 'Second', 'summary': 'Long summary', 'pages': 100},
+        {'title': 'Second', 'summary': 'Long summary', 'pages': 120},
+    ]
+    for output in outputs:
+        PublishedSnapshot.objects.snapshot_create(book, {}, output)
+    snapshots = list(
+        PublishedSnapshot.objects.for_object(book).order_by('version'),
+    )
+    assert [snapshot.output for snapshot in snapshots[:2]] == [None, None]
+    assert snapshots[0].diff == {'set': {'title': 'First'}}
+    assert snapshots[2].output == outputs[2]
+    for version, output in enumerate(outputs, 1):
+        assert PublishedSnapshot.objects.version_output(
+            book,
+            version,
+        ) == output
+    PublishedSnapshot.objects.purge(book)
+    assert PublishedSnapshot.objects.version_output(book, 1) is None
+
+
+def test_job_failed():
+    """Jobs of objects missing fail with their error."""
+    book = BookFactory()
+    job = PublishJob.objects.create(
+        content_type=ContentType.objects.get_for_model(Book),
+        object_id=int(book.pk) + 1000,
+        granted=[['global-keyword']],
+    )
+    job = PublishJob.objects.job_run(str(job.pk))
+    assert job.status == PublishJob.STATUSES.failed
+    assert job.error
+    assert PublishJob.objects.job_run(str(job.pk)) is None
+
+
+def test_job_failed_unexpected(monkeypatch):
+    """Jobs raising unexpected errors are rolled back and fail."""
+    book = BookFactory()
+    job = PublishJob.objects.create(
+        content_type=ContentType.objects.get_for_model(Book),
+        object_id=int(book.pk),
+        granted=[['global-keyword']],
+    )
+
+    def publish_now(self, granted_list, block_list):
+        PublishedSnapshot.objects.snapshot_create(self, {}, {'title': 'X'})
+        raise RuntimeError('Publishing interrupted.')
+
+    monkeypatch.setattr(Book, 'publish_now', publish_now)
+    job = PublishJob.objects.job_run(str(job.pk))
+    assert job.status == PublishJob.STATUSES.failed
+    assert job.error == 'Publishing interrupted.'
+    assert not PublishedSnapshot.objects.for_object(book).exists()
+
+
+def test_job_poll(client_profile, profile):
+    """Profiles poll the jobs they requested."""
+    book = BookFactory()
+    job = PublishJob.objects.create(
+        content_type=ContentType.objects.get_for_model(Book),
+        object_id=int(book.pk),
+        profile=profile,
+    )
+    other = PublishJob.objects.create(
+        content_type=ContentType.objects.get_for_model(Book),
+        object_id=int(book.pk),
+    )
+    response = client_profile.get(f'/meta_info/publish_job/{job.pk}/')
+    assert response.status_code == 200
+    assert response.data['status'] == 'Pending'
+    assert response.data['version'] is None
+    response = client_profile.get(f'/meta_info/publish_job/{other.pk}/')
+    assert response.status_code == 404
@@ -0,0 +1,40 @@
+"""Published snapshot versions and purges."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from books.test import BookFactory
+from meta_info.models_publication import PublishedSnapshot
+
+
+def test_snapshot_versions():
+    """Versions are numbered per object, history is latest first."""
+    book, other = BookFactory(), BookFactory()
+    for title in ('First', 'Second', 'Third'):
+        PublishedSnapshot.objects.snapshot_create(
+            book,
+            {'granted_flat': []},
+            {'title': title},
+        )
+    PublishedSnapshot.objects.snapshot_create(other, {}, {'title': 'Other'})
+    history = list(PublishedSnapshot.objects.history(book))
+    assert [snapshot.version for snapshot in history] == [3, 2, 1]
+    assert 'output' in history[0].get_deferred_fields()
+    assert PublishedSnapshot.objects.history(other).get().version == 1
+
+
+def test_snapshot_purge():
+    """Purging removes the output of every version in one update."""
+    book, other = BookFactory(), BookFactory()
+    for title in ('First', 'Second'):
+        PublishedSnapshot.objects.snapshot_create(book, {}, {'title': title})
+    PublishedSnapshot.objects.snapshot_create(other, {}, {'title': 'Other'})
+    with CaptureQueriesContext(connection) as context:
+        assert PublishedSnapshot.objects.purge(book) == 2
+    assert len(context) == 1
+    assert not PublishedSnapshot.objects.for_object(book).filter(
+        output__isnull=False,
+    ).exists()
+    assert PublishedSnapshot.objects.for_object(other).get().output == {
+        'title': 'Other',
+    }
@@ -3,11 +3,13 @@ from rest_framework import routers
 from meta_info.views import (
     TagViewSet,
     MetaViewSet,
+    PublishJobViewSet,
 )
 
 
 router = routers.SimpleRouter()
 router.register(r'tag', TagViewSet)
 router.register(r'meta', MetaViewSet)
+router.register(r'publish_job', PublishJobViewSet)
 
 urlpatterns = router.urls
@@ -2,17 +2,21 @@
 
 from rest_framework import (status, viewsets, filters, mixins)
 from rest_framework.decorators import (detail_route, permission_classes)
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from authentication.models import Profile
+from bookworm.views import ResponseCacheViewSetMixin
 from meta_info.models import (
     Tag,
     MetaInfo,
 )
+from meta_info.models_publication import PublishJob
 from meta_info.permissions import ElevatedForDeletePermission
 from meta_info.serializers import (
     TagSerializer,
     MetaInfoSerializer,
+    PublishJobSerializer,
 )
 from meta_info.exceptions import (
     LocalisationUnknownLocaleException,
@@ -20,7 +24,7 @@ from meta_info.exceptions import (
 )
 
 
-class TagViewSet(viewsets.ModelViewSet):
+class TagViewSet(ResponseCacheViewSetMixin, viewsets.ModelViewSet):
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     filter_backends = (filters.SearchFilter,)
@@ -34,6 +38,24 @@ class MetaViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet,):
     permission_classes = (ElevatedForDeletePermission, )
 
 
+class PublishJobViewSet(
+        mixins.RetrieveModelMixin,
+        mixins.ListModelMixin,
+        viewsets.GenericViewSet,
+):
+    """Publish jobs requested, polled until they have run."""
+    queryset = PublishJob.objects.select_related('snapshot')
+    serializer_class = PublishJobSerializer
+    permission_classes = (IsAuthenticated, )
+
+    def get_queryset(self):
+        """Profiles see the jobs they requested, admins every job."""
+        queryset = super().get_queryset().order_by('-created_at')
+        if self.request.user.profile.type >= Profile.TYPES.admin:
+            return queryset
+        return queryset.filter(profile=self.request.user.profile)
+
+
 class LocalisableViewSetMixin:
 
     def _localisation_error_handle(self, error):
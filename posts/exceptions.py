@@ -45,3 +45,13 @@ class EmoteFieldMissingValidationError(ValidationError):
             'message': f'Required request paramater `{field}` not supplied.',
         })
         logger.error(self)
+
+
+class PostThreadValidationError(ValidationError):
+
+    def __init__(self, post, reason):
+        super().__init__({
+            'code': 'post_thread_validation_error',
+            'message': f'Post({post.id}) cannot reply there: {reason}',
+        })
+        logger.error(self)
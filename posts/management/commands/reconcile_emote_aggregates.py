@@ -0,0 +1,32 @@
+"""Command to repair emote aggregates drifting from stored Emotes."""
+
+import logging
+
+from django.core.management import BaseCommand
+
+from posts.tasks import emote_aggregate_reconcile_task
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Reconcile emote aggregates of all Emotable models."""
+
+    help = __doc__
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Objects compared and repaired per batch.',
+        )
+
+    def handle(self, *args, **options):
+        """Recount Emotes in bulk and store differing aggregates."""
+        repaired = emote_aggregate_reconcile_task(
+            batch_size=options['batch_size'],
+        )
+        for label, count in repaired.items():
+            logger.info(f'{label}: {count} emote aggregates repaired.')
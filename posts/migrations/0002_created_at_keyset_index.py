@@ -0,0 +1,21 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emote',
+            index=models.Index(fields=['created_at', 'id'], name='posts_emote_created_e8557b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['created_at', 'id'], name='posts_post_created_b28b11_idx'),
+        ),
+    ]
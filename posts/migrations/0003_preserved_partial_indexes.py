@@ -0,0 +1,39 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:25
+
+import bookworm.operations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0002_created_at_keyset_index'),
+    ]
+
+    operations = [
+        bookworm.operations.AddPartialIndex(
+            model_name='emote',
+            fields=['profile'],
+            name='posts_emote_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='post',
+            fields=['profile'],
+            name='posts_post_profile_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='post',
+            fields=['cover_image'],
+            name='posts_post_cover_image_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='post',
+            fields=['parent'],
+            name='posts_post_parent_id_live',
+        ),
+        bookworm.operations.AddPartialIndex(
+            model_name='post',
+            fields=['meta_info'],
+            name='posts_post_meta_info_id_live',
+        ),
+    ]
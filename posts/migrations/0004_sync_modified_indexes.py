@@ -0,0 +1,17 @@
+# Generated by Django 2.0.2 on 2026-10-18 20:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0003_preserved_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['modified_at', 'id'], name='posts_post_modifie_25d6bf_idx'),
+        ),
+    ]
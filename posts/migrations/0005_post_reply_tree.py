@@ -0,0 +1,76 @@
+# Generated by Django 2.0.2 on 2026-10-18 21:04
+
+from django.db import migrations, models
+
+
+POST_PATHS = """
+WITH RECURSIVE tree (id, path) AS (
+    SELECT id, LPAD(TO_HEX(id), 10, '0')::varchar
+    FROM posts_post WHERE parent_id IS NULL
+    UNION ALL
+    SELECT post.id, (tree.path || LPAD(TO_HEX(post.id), 10, '0'))::varchar
+    FROM posts_post post JOIN tree ON post.parent_id = tree.id
+)
+UPDATE posts_post SET path = tree.path, depth = LENGTH(tree.path) / 10 - 1
+FROM tree WHERE posts_post.id = tree.id;
+"""
+
+POST_COUNTS = """
+UPDATE posts_post SET
+    children_count = (
+        SELECT COUNT(*) FROM posts_post reply
+        WHERE reply.parent_id = posts_post.id AND reply.deleted_at IS NULL
+    ),
+    descendants_count = (
+        SELECT COUNT(*) FROM posts_post reply
+        WHERE reply.path LIKE posts_post.path || '_%'
+        AND reply.deleted_at IS NULL
+    );
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0004_sync_modified_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='children_count',
+            field=models.IntegerField(blank=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='depth',
+            field=models.IntegerField(blank=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='descendants_count',
+            field=models.IntegerField(blank=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='path',
+            field=models.CharField(blank=True, default='', max_length=500),
+        ),
+        migrations.RunSQL(
+            sql='ALTER TABLE posts_post '
+                'ALTER COLUMN path TYPE varchar(500) COLLATE "C";',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['path'], name='posts_post_path_19df4b_idx'),
+        ),
+        migrations.RunSQL(
+            sql=POST_PATHS,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.RunSQL(
+            sql=POST_COUNTS,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -1,13 +1,24 @@
 """Books models."""
 
+from django.apps import apps
 from django.conf import settings
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import connection, models, transaction
+from django.db.models import F, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Concat, Substr
+from django.db.models.signals import m2m_changed
 from django.contrib.postgres.fields import ArrayField
+from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
 from model_utils import Choices
 from hashid_field import HashidAutoField
 
+from bookworm.cache import (
+    cache_object_version_changed,
+    cache_version_changed,
+)
 from bookworm.mixins import (
     ProfileReferredMixin,
     PreserveModelMixin,
@@ -18,6 +29,7 @@ from file_store.models import Imagable
 from posts.exceptions import (
     InvalidEmoteModification,
     DuplicateEmoteValidationError,
+    PostThreadValidationError,
     UnemoteValidationError,
 )
 
@@ -46,6 +58,9 @@ class Emote(PreserveModelMixin, ProfileReferredMixin):
     class Meta:
         verbose_name = 'Emote'
         verbose_name_plural = 'Emotes'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+        ]
 
     def __str__(self):
         """Display only as URI valid slug."""
@@ -81,14 +96,170 @@ class Emotable(models.Model):
             [Emote.EMOTES[k], v] for k, v in enumerate(self.emote_aggregate)
         ]
 
-    def _emote_aggregation_update(self):
-        """Aggregate values for an object to keep data synced, without DB."""
-        all_emotes = self.emotes.filter(deleted_at__isnull=True)
-        aggregate = [0] * len(Emote.EMOTES)
-        for item in all_emotes:
-            aggregate[int(item.type)] += 1
+    def _emote_type(self, emote_type):
+        """Validate an Emote type supplied for aggregation.
+
+        @param emote_type: Int or Str type of Emote.
+
+        @return Int
+
+        @raises InvalidEmoteModification
+        """
+        try:
+            emote_type = int(emote_type)
+        except (TypeError, ValueError):
+            raise InvalidEmoteModification(emote_type, self)
+        if emote_type not in Emote.EMOTES:
+            raise InvalidEmoteModification(emote_type, self)
+        return emote_type
+
+    @staticmethod
+    def emote_aggregate_expression(increments):
+        """Expression incrementing elements of the emote_aggregate array.
+
+        Elements are addressed in the database so concurrent emotes are
+        never lost, elements never fall below zero.
+
+        @param increments: dict of Emote type to Int increment.
+
+        @return RawSQL
+        """
+        column = connection.ops.quote_name('emote_aggregate')
+        elements = []
+        params = []
+        for emote_type in range(len(Emote.EMOTES)):
+            elements.append(
+                f'GREATEST(COALESCE({column}[{emote_type + 1}], 0) + %s, 0)'
+            )
+            params.append(increments.get(emote_type, 0))
+        return RawSQL(
+            f'ARRAY[{", ".join(elements)}]::integer[]',
+            params,
+        )
+
+    def _emote_aggregation_update(self, increments):
+        """Increment aggregate values within the database in one UPDATE.
+
+        The in memory aggregate is incremented equally to avoid a reload.
+
+        @param increments: dict of Emote type to Int increment.
+        """
+        modified_at = now()
+        self.__class__.objects.filter(pk=self.pk).update(
+            emote_aggregate=self.emote_aggregate_expression(increments),
+            modified_at=modified_at,
+        )
+        aggregate = list(self.emote_aggregate or [])
+        aggregate += [0] * (len(Emote.EMOTES) - len(aggregate))
+        for emote_type, increment in increments.items():
+            aggregate[emote_type] = max(aggregate[emote_type] + increment, 0)
         self.emote_aggregate = aggregate
-        self.save()
+        self.modified_at = modified_at
+        for model, pk in self.emote_cache_objects():
+            cache_object_version_changed(model, pk)
+
+    def emote_cache_objects(self):
+        """Objects with cached representations of this emote aggregate.
+
+        @return list of tuples of Model class and primary key.
+        """
+        return [(self.__class__, self.pk)]
+
+    @classmethod
+    def emotable_models(cls):
+        """All concrete models mixing in Emotable.
+
+        @return list of Model classes.
+        """
+        return [
+            model for model in apps.get_models()
+            if issubclass(model, Emotable)
+        ]
+
+    @classmethod
+    def emote_aggregate_reconcile(cls, batch_size=1000):
+        """Repair drift of emote_aggregate against stored Emote objects.
+
+        Objects are reconciled in ranges of primary keys, each counted and
+        written by one UPDATE so no Emote changes between counting and
+        writing. Only objects with a differing aggregate are updated.
+
+        @param batch_size: Int range of primary keys reconciled per UPDATE.
+
+        @return Int number of objects repaired.
+        """
+        bounds = cls.all_objects.annotate(
+            keyset_pk=models.ExpressionWrapper(
+                F('pk'),
+                output_field=models.IntegerField(),
+            ),
+        ).aggregate(
+            first=models.Min('keyset_pk'),
+            last=models.Max('keyset_pk'),
+        )
+        if bounds['first'] is None:
+            return 0
+        repaired = 0
+        for start in range(bounds['first'], bounds['last'] + 1, batch_size):
+            repaired += cls._emote_aggregate_reconcile_batch(
+                start,
+                start + batch_size,
+            )
+        return repaired
+
+    @classmethod
+    def _emote_aggregate_reconcile_batch(cls, start, stop):
+        """Reconcile aggregates of a range of primary keys in one UPDATE.
+
+        @param start: Int first primary key of the range.
+        @param stop: Int primary key after the range.
+
+        @return Int number of objects updated.
+        """
+        quote = connection.ops.quote_name
+        table = quote(cls._meta.db_table)
+        pk = quote(cls._meta.pk.column)
+        column = quote('emote_aggregate')
+        through = cls.emotes.through
+        source = quote(
+            through._meta.get_field(cls.emotes.field.m2m_field_name()).column,
+        )
+        target = quote(
+            through._meta.get_field(
+                cls.emotes.field.m2m_reverse_field_name(),
+            ).column,
+        )
+        emote_table = quote(Emote._meta.db_table)
+        emote_pk = quote(Emote._meta.pk.column)
+        counts = ', '.join(
+            f'(COUNT(emote.{emote_pk}) FILTER '
+            f'(WHERE emote.{quote("type")} = {emote_type}))::integer'
+            for emote_type in range(len(Emote.EMOTES))
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} SET {column} = counted.aggregate, '
+                f'{quote("modified_at")} = %s '
+                f'FROM ('
+                f'SELECT emotable.{pk} AS id, '
+                f'ARRAY[{counts}]::integer[] AS aggregate '
+                f'FROM {table} emotable '
+                f'LEFT JOIN {quote(through._meta.db_table)} relation '
+                f'ON relation.{source} = emotable.{pk} '
+                f'LEFT JOIN {emote_table} emote '
+                f'ON emote.{emote_pk} = relation.{target} '
+                f'AND emote.{quote("deleted_at")} IS NULL '
+                f'WHERE emotable.{pk} >= %s AND emotable.{pk} < %s '
+                f'GROUP BY emotable.{pk}'
+                f') counted '
+                f'WHERE {table}.{pk} = counted.id '
+                f'AND {table}.{column} IS DISTINCT FROM counted.aggregate',
+                [now(), start, stop],
+            )
+            updated = cursor.rowcount
+        if updated:
+            cache_version_changed(cls)
+        return updated
 
     def has_emoted(self, profile):
         """Check if the profile has emoted with this model.
@@ -111,20 +282,132 @@ class Emotable(models.Model):
         @return Emote
 
         @raises DuplicateEmoteValidationError
+        @raises InvalidEmoteModification
         """
-        emote = self.has_emoted(profile)
-        if emote:
-            if emote.type == emote_type:
-                raise DuplicateEmoteValidationError(profile, self)
-            emote.delete()
-        emote = Emote.objects.create(
-            type=emote_type,
-            profile=profile,
-        )
-        self.emotes.add(emote)
-        self._emote_aggregation_update()
+        emote_type = self._emote_type(emote_type)
+        increments = {emote_type: 1}
+        with transaction.atomic():
+            emote = self.has_emoted(profile)
+            if emote:
+                if emote.type == emote_type:
+                    raise DuplicateEmoteValidationError(profile, self)
+                emote.delete()
+                increments[emote.type] = -1
+            emote = Emote.objects.create(
+                type=emote_type,
+                profile=profile,
+            )
+            self.emotes.add(emote)
+            self._emote_aggregation_update(increments)
         return emote
 
+    @classmethod
+    def emoted_bulk(cls, profile, emote_types, queryset=None, permission=None):
+        """Apply many Emotes by a profile across objects of this model.
+
+        Emotes matching the profile's current Emote are left unchanged,
+        changed Emotes are soft deleted and replaced. New Emotes and their
+        relations are inserted in bulk, aggregates updated once per object.
+        Relations inserted in bulk send `m2m_changed` as `emotes.add` would,
+        Emote has no receivers of the save and delete signals skipped by
+        bulk_create and update.
+
+        @param profile: Profile of user emoting.
+        @param emote_types: dict of object id to type of Emote, ids of one
+            object supplied once.
+        @param queryset: QuerySet of objects the profile may emote on, every
+            object not deleted by default.
+        @param permission: callable raising when an object found may not be
+            emoted on by the profile.
+
+        @return dict of object id supplied to Emote created, None if the
+            Emote was unchanged. Objects not found are excluded.
+
+        @raises InvalidEmoteModification
+        """
+        object_ids = {}
+        for object_id in emote_types.keys():
+            try:
+                object_ids[object_id] = cls._meta.pk.to_python(object_id)
+            except ValidationError:
+                continue
+        through = cls.emotes.through
+        source_column = cls.emotes.field.m2m_field_name()
+        target_column = cls.emotes.field.m2m_reverse_field_name()
+        if queryset is None:
+            queryset = cls.objects.all()
+        with transaction.atomic():
+            emotables = {
+                int(emotable.pk): emotable
+                for emotable in queryset.filter(
+                    pk__in=list(object_ids.values()),
+                )
+            }
+            if permission is not None:
+                for emotable in emotables.values():
+                    permission(emotable)
+            current = {
+                int(emotable_id): (emote_id, emote_type)
+                for emotable_id, emote_id, emote_type
+                in through.objects.filter(**{
+                    f'{source_column}__in': list(emotables),
+                    f'{target_column}__profile': profile,
+                    f'{target_column}__deleted_at__isnull': True,
+                }).values_list(
+                    source_column,
+                    target_column,
+                    f'{target_column}__type',
+                )
+            }
+            emoted = {}
+            increments = {}
+            replaced = []
+            for object_id, hashid in object_ids.items():
+                pk = int(hashid)
+                emotable = emotables.get(pk)
+                if emotable is None:
+                    continue
+                emote_type = emotable._emote_type(emote_types[object_id])
+                emote_id, current_type = current.get(pk, (None, None))
+                if current_type == emote_type:
+                    emoted[object_id] = None
+                    continue
+                increments[pk] = {emote_type: 1}
+                if emote_id is not None:
+                    replaced.append(Emote._meta.pk.to_python(emote_id))
+                    increments[pk][current_type] = -1
+                emoted[object_id] = Emote(type=emote_type, profile=profile)
+            deleted_at = now()
+            Emote.objects.filter(id__in=replaced).update(
+                deleted_at=deleted_at,
+                modified_at=deleted_at,
+            )
+            Emote.objects.bulk_create(
+                [emote for emote in emoted.values() if emote]
+            )
+            through.objects.bulk_create([
+                through(**{
+                    f'{source_column}_id': int(object_ids[object_id]),
+                    f'{target_column}_id': emote.pk,
+                })
+                for object_id, emote in emoted.items() if emote
+            ])
+            for object_id, emote in emoted.items():
+                if not emote:
+                    continue
+                m2m_changed.send(
+                    sender=through,
+                    instance=emotables[int(object_ids[object_id])],
+                    action='post_add',
+                    reverse=False,
+                    model=Emote,
+                    pk_set={emote.pk},
+                    using=through.objects.db,
+                )
+            for pk, emote_increments in increments.items():
+                emotables[pk]._emote_aggregation_update(emote_increments)
+        return emoted
+
     def un_emote(self, profile):
         """Remove an Emote from this model.
 
@@ -134,11 +417,12 @@ class Emotable(models.Model):
 
         @raises UnemoteValidationError
         """
-        emote = self.has_emoted(profile)
-        if not emote:
-            raise UnemoteValidationError(profile, self)
-        emote.delete()
-        self._emote_aggregation_update()
+        with transaction.atomic():
+            emote = self.has_emoted(profile)
+            if not emote:
+                raise UnemoteValidationError(profile, self)
+            emote.delete()
+            self._emote_aggregation_update({emote.type: -1})
         return emote
 
 
@@ -149,7 +433,17 @@ class Post(
         ProfileReferredMixin,
         PreserveModelMixin,
 ):
-    """Post model."""
+    """Post model.
+
+    Replies are indexed by a materialized `path`, the ids of every ancestor
+    and the Post itself as fixed width hexadecimal steps, so a thread or any
+    subtree is a single prefix range of the `path` index in thread order.
+    Reply counts are kept on each Post as replies are made, moved and
+    deleted.
+    """
+
+    PATH_STEP = 10
+    TREE_FIELDS = ('path', 'depth', 'children_count', 'descendants_count', )
 
     id = HashidAutoField(
         primary_key=True,
@@ -174,11 +468,184 @@ class Post(
         blank=True,
         null=True,
     )
+    path = models.CharField(
+        max_length=500,
+        blank=True,
+        default='',
+    )
+    depth = models.IntegerField(
+        default=0,
+        blank=True,
+    )
+    children_count = models.IntegerField(
+        default=0,
+        blank=True,
+    )
+    descendants_count = models.IntegerField(
+        default=0,
+        blank=True,
+    )
 
     class Meta:
         verbose_name = 'Post'
         verbose_name_plural = 'Posts'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['modified_at', 'id']),
+            models.Index(fields=['path']),
+        ]
 
     def __str__(self):
         """Title and author of book."""
         return f'{self.profile.display_name} posted {self.id}:{self.copy[:30]}'
+
+    @classmethod
+    def path_step(cls, pk):
+        """Step of a Post within the path of its replies.
+
+        @param pk: Hashid or Int id of the Post.
+
+        @return Str
+        """
+        return f'{int(pk):0{cls.PATH_STEP}x}'
+
+    @classmethod
+    def path_ancestor_ids(cls, path):
+        """Ids of the ancestors of the Post at a path, root first.
+
+        @param path: Str path of the Post.
+
+        @return list of Hashid
+        """
+        return [
+            cls._meta.pk.to_python(int(path[index:index + cls.PATH_STEP], 16))
+            for index in range(0, len(path) - cls.PATH_STEP, cls.PATH_STEP)
+        ]
+
+    @classmethod
+    def tree_count(cls, path, descendants, children):
+        """Adjust the reply counts of the ancestors of the Post at a path.
+
+        @param path: Str path of the Post replying.
+        @param descendants: Int replies added to every ancestor.
+        @param children: Int replies added to the parent.
+        """
+        ancestor_ids = cls.path_ancestor_ids(path)
+        if not ancestor_ids:
+            return
+        if descendants:
+            cls.all_objects.filter(pk__in=ancestor_ids).update(
+                descendants_count=F('descendants_count') + descendants,
+            )
+        if children:
+            cls.all_objects.filter(pk=ancestor_ids[-1]).update(
+                children_count=F('children_count') + children,
+                modified_at=now(),
+            )
+
+    def _tree_parent_path(self):
+        """Path of the parent of this Post.
+
+        @return Str, empty for a Post without parent.
+
+        @raises PostThreadValidationError
+        """
+        if not self.parent_id:
+            return ''
+        parent_path = Post.all_objects.filter(
+            pk=self.parent_id,
+        ).values_list('path', flat=True).first() or ''
+        max_length = self._meta.get_field('path').max_length
+        if len(parent_path) + self.PATH_STEP > max_length:
+            raise PostThreadValidationError(self, 'Replies nested too deep.')
+        return parent_path
+
+    def _tree_insert(self):
+        """Index a new Post beneath its parent and count the reply."""
+        self.path = self._tree_parent_path() + self.path_step(self.pk)
+        self.depth = len(self.path) // self.PATH_STEP - 1
+        Post.all_objects.filter(pk=self.pk).update(
+            path=self.path,
+            depth=self.depth,
+        )
+        if not self.deleted_at:
+            self.tree_count(self.path, 1, 1)
+
+    def _tree_move(self, path, deleted_at, descendants_count):
+        """Move this Post and its replies beneath another parent.
+
+        @param path: Str path this Post is stored at.
+        @param deleted_at: datetime this Post is stored deleted at.
+        @param descendants_count: Int replies of this Post stored.
+
+        @raises PostThreadValidationError
+        """
+        parent_path = self._tree_parent_path()
+        if parent_path.startswith(path):
+            raise PostThreadValidationError(
+                self,
+                'A Post cannot reply to its own replies.',
+            )
+        live = 0 if deleted_at else 1
+        moved = descendants_count + live
+        self.tree_count(path, -moved, -live)
+        self.path = parent_path + self.path_step(self.pk)
+        self.depth = len(self.path) // self.PATH_STEP - 1
+        Post.all_objects.filter(path__startswith=path).update(
+            path=Concat(Value(self.path), Substr('path', len(path) + 1)),
+            depth=F('depth') + (len(self.path) - len(path)) // self.PATH_STEP,
+        )
+        self.tree_count(self.path, moved, live)
+
+    def save(self, *args, **kwargs):
+        """Save this Post maintaining the index and counts of replies.
+
+        Tree fields are only written by the queries maintaining them.
+        """
+        with transaction.atomic():
+            if self._state.adding:
+                super().save(*args, **kwargs)
+                self._tree_insert()
+                return
+            if kwargs.get('update_fields') is None:
+                kwargs['update_fields'] = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key and
+                    field.name not in self.TREE_FIELDS
+                ]
+            stored = Post.all_objects.filter(pk=self.pk).values_list(
+                'parent_id',
+                'path',
+                'deleted_at',
+                'descendants_count',
+            ).first()
+            if stored and stored[0] != self.parent_id:
+                self._tree_move(*stored[1:])
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        """Soft delete this Post, no longer counted as a reply."""
+        with transaction.atomic():
+            deleting = not self.deleted_at
+            super().delete(*args, **kwargs)
+            if deleting:
+                self.tree_count(self.path, -1, -1)
+
+    def thread(self, max_depth=None, after=None):
+        """Replies of this Post in thread order, depth first.
+
+        @param max_depth: Int levels of replies beneath this Post, all
+            levels when None.
+        @param after: Str path of the last reply of the previous page.
+
+        @return QuerySet
+        """
+        replies = Post.objects.filter(
+            path__startswith=self.path,
+            depth__gt=self.depth,
+        ).order_by('path')
+        if max_depth is not None:
+            replies = replies.filter(depth__lte=self.depth + max_depth)
+        if after:
+            replies = replies.filter(path__gt=after)
+        return replies
@@ -1,5 +1,6 @@
 """Books app serializers."""
 
+from django.conf import settings
 from rest_framework import serializers
 
 from bookworm.serializers import PreservedModelSerializeMixin, \
@@ -61,6 +62,36 @@ class SmallEmoteSerializer(serializers.HyperlinkedModelSerializer):
         fields = read_only_fields
 
 
+class BulkEmoteItemSerializer(serializers.Serializer):
+    """Single Emote of a bulk request, target is an Emotable model name."""
+
+    TARGETS = {
+        'book': 'books.Book',
+        'bookreview': 'books.BookReview',
+        'readinglist': 'books.ReadingList',
+        'post': 'posts.Post',
+    }
+
+    target = serializers.ChoiceField(choices=sorted(TARGETS.keys()))
+    id = serializers.CharField()
+    emote_type = serializers.ChoiceField(choices=Emote.EMOTES)
+
+
+class BulkEmoteSerializer(serializers.Serializer):
+    """Bulk Emote request serializer, in the order Emotes were made."""
+
+    emotes = BulkEmoteItemSerializer(many=True)
+
+    def validate_emotes(self, emotes):
+        if not emotes:
+            raise serializers.ValidationError('No Emotes supplied.')
+        if len(emotes) > settings.EMOTE_BULK_LIMIT:
+            raise serializers.ValidationError(
+                f'No more than {settings.EMOTE_BULK_LIMIT} Emotes allowed.'
+            )
+        return emotes
+
+
 class EmotableSerializerMixin:
     """Generic Emotable serializer."""
 
@@ -100,7 +131,6 @@ class ThinPostSerializer(serializers.HyperlinkedModelSerializer):
         read_only=True,
         view_name='post-detail',
     )
-    children_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
@@ -112,9 +142,6 @@ class ThinPostSerializer(serializers.HyperlinkedModelSerializer):
         fields = read_only_fields
         exclude = ()
 
-    def get_children_count(self, obj):
-        return obj.children.all().count()
-
 
 class PostSerializer(
     EmotableAggregateSerializerMixin,
@@ -156,7 +183,6 @@ class PostSerializer(
         read_only=True,
         view_name='post-detail',
     )
-    children_count = serializers.SerializerMethodField()
     children_preview = serializers.SerializerMethodField()
 
     class Meta:
@@ -181,12 +207,82 @@ class PostSerializer(
         )
         exclude = ()
 
-    def get_children_count(self, obj):
-        return obj.children.all().count()
-
     def get_children_preview(self, obj):
+        prefetched = getattr(obj, '_prefetched_objects_cache', {})
+        if 'children' in prefetched:
+            # Sorting the replies prefetched avoids a query per Post.
+            children = sorted(
+                prefetched['children'],
+                key=lambda child: child.created_at,
+                reverse=True,
+            )
+        else:
+            children = obj.children.order_by('-created_at')
         data = []
-        for child in obj.children.all().order_by('-created_at')[:3]:
+        for child in children[:3]:
             serializer = ThinPostSerializer(child, context=self.context)
             data.append(serializer.data)
         return data
+
+
+class ThreadPostSerializer(
+    EmotableAggregateSerializerMixin,
+    serializers.HyperlinkedModelSerializer,
+):
+    """Post within a thread, its depth relative to the Post threaded."""
+
+    id = serializers.HyperlinkedRelatedField(
+        many=False,
+        read_only=True,
+        view_name='post-detail',
+    )
+    parent = serializers.HyperlinkedRelatedField(
+        many=False,
+        read_only=True,
+        view_name='post-detail',
+    )
+    profile = serializers.HyperlinkedRelatedField(
+        many=False,
+        read_only=True,
+        view_name='profile-detail',
+    )
+    depth = serializers.SerializerMethodField()
+    created_at = serializers.ReadOnlyField()
+    modified_at = serializers.ReadOnlyField()
+
+    class Meta:
+        model = Post
+        read_only_fields = (
+            'id',
+            'parent',
+            'profile',
+            'depth',
+            'copy',
+            'created_at',
+            'modified_at',
+            'emote_aggregate',
+            'children_count',
+            'descendants_count',
+        )
+        fields = read_only_fields
+        exclude = ()
+
+    def get_depth(self, obj):
+        return obj.depth - self.context.get('thread_depth', 0)
+
+
+class ThreadQuerySerializer(serializers.Serializer):
+    """Parameters of a page of a thread."""
+
+    depth = serializers.IntegerField(
+        min_value=1,
+        required=False,
+    )
+    after = serializers.CharField(
+        required=False,
+    )
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.POST_THREAD_PAGE_SIZE,
+        required=False,
+    )
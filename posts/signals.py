@@ -2,9 +2,15 @@
 
 import logging
 
-from django.db.models.signals import pre_save
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+    pre_save,
+)
 from django.dispatch import receiver
 
+from bookworm.cache import cache_version_changed
+
 from posts.models import (Emote, Post)
 from meta_info.models import MetaInfo
 
@@ -21,3 +27,10 @@ def pre_save_create_meta_info(sender, instance, *args, **kwargs):
         return
     if not instance.meta_info:
         instance.meta_info = MetaInfo.objects.create()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def post_change_cache_version(sender, instance, *args, **kwargs):
+    """Invalidate cached representations nesting Posts."""
+    cache_version_changed(sender)
@@ -1 +1,29 @@
 """Tasks for post specific operations."""
+
+import logging
+
+from celery import shared_task
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def emote_aggregate_reconcile_task(batch_size=1000):
+    """Periodically repair drift of emote aggregates for Emotable models.
+
+    @:param batch_size: int objects compared per batch.
+
+    @:returns dict of model label and number of objects repaired.
+    """
+    from posts.models import Emotable
+    repaired = {}
+    for model in Emotable.emotable_models():
+        repaired[model._meta.label] = model.emote_aggregate_reconcile(
+            batch_size=batch_size,
+        )
+        logger.info(
+            f'Reconciled {repaired[model._meta.label]} emote aggregates '
+            f'for {model._meta.label}.'
+        )
+    return repaired
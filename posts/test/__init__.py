@@ -1 +1,45 @@
-"""Books test factories."""
+"""Posts test factories."""
+
+import factory
+from factory.django import DjangoModelFactory
+
+from django.db.models.signals import (
+    pre_save,
+    post_save,
+    post_delete,
+)
+
+from authentication.test import UserFactory
+from posts.models import Emote, Post
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class EmoteFactory(DjangoModelFactory):
+    """Factory for emotes."""
+
+    type = Emote.EMOTES.heart
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+
+    class Meta:
+        model = Emote
+
+
+@factory.django.mute_signals(pre_save, post_save, post_delete)
+class PostFactory(DjangoModelFactory):
+    """Factory for posts."""
+
+    copy = factory.Faker('paragraph')
+    profile = factory.LazyFunction(lambda: UserFactory().profile)
+    emote_aggregate = [0, 0, 0, 0, 0, 0, 0]
+
+    @factory.post_generation
+    def images(self, create, extracted, **kwargs):
+        """By default there are no Images supplied."""
+        if not create:
+            return
+        if extracted:
+            for image in extracted:
+                self.images.add(image)
+
+    class Meta:
+        model = Post
@@ -0,0 +1,144 @@
+"""Bulk Emote End to End tests."""
+
+from authentication.models import Profile
+from bookworm.cache import cache_versions
+from books.models import Book
+from books.test import BookFactory, ReadingListFactory
+from posts.models import Emote, Post
+from posts.test import PostFactory
+
+
+def test_emote_bulk(client_profile, profile):
+    """Emotes across Emotable models are applied in one request."""
+    profile.type = Profile.TYPES.elevated
+    profile.save()
+    book = BookFactory()
+    post = PostFactory(profile=profile)
+    reading_list = ReadingListFactory(profile=profile)
+    data = {
+        'emotes': [
+            {'target': 'book', 'id': str(book.id), 'emote_type': 1},
+            {'target': 'post', 'id': str(post.id), 'emote_type': 2},
+            {'target': 'post', 'id': str(post.id), 'emote_type': 3},
+            {'target': 'readinglist', 'id': str(reading_list.id),
+             'emote_type': 0},
+        ],
+    }
+    response = client_profile.post('/posts/emote/bulk/', data, format='json')
+    assert response.status_code == 200
+    assert len(response.data['emoted']) == 3
+    assert not response.data['missing']
+    post.refresh_from_db()
+    assert post.has_emoted(profile).type == Emote.EMOTES.annoy
+    assert post.emote_aggregate[Emote.EMOTES.annoy] == 1
+    assert post.emote_aggregate[Emote.EMOTES.joy] == 0
+    reading_list.refresh_from_db()
+    assert reading_list.emote_aggregate[Emote.EMOTES.thrill] == 1
+
+
+def test_emote_bulk_ids_normalised(client_profile, profile):
+    """Integer and hashid ids of one object are de-duplicated."""
+    post = PostFactory(profile=profile)
+    data = {
+        'emotes': [
+            {'target': 'post', 'id': str(int(post.id)), 'emote_type': 1},
+            {'target': 'post', 'id': str(post.id), 'emote_type': 2},
+        ],
+    }
+    response = client_profile.post('/posts/emote/bulk/', data, format='json')
+    assert response.status_code == 200
+    assert len(response.data['emoted']) == 1
+    assert response.data['emoted'][0]['id'] == str(post.id)
+    post.refresh_from_db()
+    assert post.emotes.filter(deleted_at__isnull=True).count() == 1
+    assert post.emote_aggregate[Emote.EMOTES.annoy] == 1
+    assert sum(post.emote_aggregate) == 1
+
+
+def test_emote_bulk_permission(client_profile, profile):
+    """Objects the emoted route denies are not emoted in bulk either."""
+    own, other = PostFactory(profile=profile), PostFactory()
+    data = {
+        'emotes': [
+            {'target': 'post', 'id': str(own.id), 'emote_type': 1},
+            {'target': 'post', 'id': str(other.id), 'emote_type': 1},
+        ],
+    }
+    response = client_profile.post('/posts/emote/bulk/', data, format='json')
+    assert response.status_code == 403
+    assert not own.has_emoted(profile)
+    assert not other.has_emoted(profile)
+
+
+def test_emote_bulk_queryset(client_profile, profile):
+    """Objects outside the queryset of their view set are missing."""
+    post = PostFactory(profile=profile)
+    post.delete()
+    data = {
+        'emotes': [
+            {'target': 'post', 'id': str(post.id), 'emote_type': 1},
+        ],
+    }
+    response = client_profile.post('/posts/emote/bulk/', data, format='json')
+    assert response.status_code == 200
+    assert response.data['missing'] == [{'target': 'post', 'id': str(post.id)}]
+
+
+def test_emote_bulk_replay(profile):
+    """Replayed Emotes are unchanged and changed Emotes are replaced."""
+    posts = PostFactory.create_batch(3)
+    Post.emoted_bulk(profile, {post.id: Emote.EMOTES.heart for post in posts})
+    replaced = posts[1].has_emoted(profile)
+    emoted = Post.emoted_bulk(profile, {
+        posts[0].id: Emote.EMOTES.heart,
+        posts[1].id: Emote.EMOTES.rubbish,
+    })
+    assert emoted[posts[0].id] is None
+    assert emoted[posts[1].id].type == Emote.EMOTES.rubbish
+    posts[1].refresh_from_db()
+    assert posts[1].emotes.filter(deleted_at__isnull=True).count() == 1
+    replaced = Emote.all_objects.get(pk=replaced.pk)
+    assert replaced.modified_at == replaced.deleted_at
+    assert posts[1].emote_aggregate[Emote.EMOTES.heart] == 0
+    assert posts[1].emote_aggregate[Emote.EMOTES.rubbish] == 1
+    posts[2].refresh_from_db()
+    assert posts[2].emote_aggregate[Emote.EMOTES.heart] == 1
+
+
+def test_emote_bulk_cache_version(profile):
+    """Relations inserted in bulk invalidate cached representations."""
+    books = BookFactory.create_batch(2)
+    versions = cache_versions([Book])
+    Book.emoted_bulk(profile, {book.id: Emote.EMOTES.heart for book in books})
+    assert cache_versions([Book]) != versions
+
+
+def test_emote_bulk_missing(client_profile):
+    """Unknown objects are reported and not emoted."""
+    data = {
+        'emotes': [
+            {'target': 'bookreview', 'id': 'notanid', 'emote_type': 1},
+        ],
+    }
+    response = client_profile.post('/posts/emote/bulk/', data, format='json')
+    assert response.status_code == 200
+    assert response.data['missing'] == [
+        {'target': 'bookreview', 'id': 'notanid'},
+    ]
+
+
+def test_emote_bulk_invalid(client_profile):
+    """Invalid targets and empty requests fail validation."""
+    data = {
+        'emotes': [
+            {'target': 'author', 'id': 'notanid', 'emote_type': 1},
+        ],
+    }
+    response = client_profile.post('/posts/emote/bulk/', data, format='json')
+    assert response.status_code == 400
+    response = client_profile.post(
+        '/posts/emote/bulk/',
+        {'emotes': []},
+        format='json',
+    )
+    assert response.status_code == 400
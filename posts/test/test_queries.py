@@ -0,0 +1,38 @@
+"""Query count regression tests for posts endpoints."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from file_store.test import ImageFactory
+from posts.serializers import PostSerializer
+from posts.test import EmoteFactory, PostFactory
+
+
+def test_post_list_queries(list_queries):
+    """Listing Posts does not query per Post for images and children."""
+    PostFactory(images=[ImageFactory()])
+    expected = list_queries('/posts/post/')
+    PostFactory.create_batch(4, images=[ImageFactory()])
+    assert list_queries('/posts/post/') == expected
+
+
+def test_emote_list_queries(list_queries):
+    """Listing Emotes does not query per Emote."""
+    EmoteFactory()
+    expected = list_queries('/posts/emote/')
+    EmoteFactory.create_batch(4)
+    assert list_queries('/posts/emote/') == expected
+
+
+def test_children_preview_not_prefetched():
+    """Previews of Posts without prefetched replies load three replies."""
+    post = PostFactory()
+    children = PostFactory.create_batch(5, parent=post)
+    request = APIRequestFactory().get('/posts/post/')
+    serializer = PostSerializer(post, context={'request': request})
+    with CaptureQueriesContext(connection) as context:
+        preview = serializer.get_children_preview(post)
+    assert len(preview) == 3
+    assert len(context) == 1
+    assert preview[0]['id'].endswith(f'/{children[-1].pk}/')
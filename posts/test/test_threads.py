@@ -0,0 +1,116 @@
+"""Post reply threads indexed by materialized path."""
+
+import pytest
+
+from posts.exceptions import PostThreadValidationError
+from posts.models import Post
+from posts.test import PostFactory
+
+
+def thread_url(post, **params):
+    query = '&'.join(f'{key}={value}' for key, value in params.items())
+    return f'/posts/post/{post.pk}/thread/?{query}'
+
+
+def reload(*posts):
+    return [Post.all_objects.get(pk=post.pk) for post in posts]
+
+
+@pytest.fixture
+def thread():
+    """Root Post with two replies, the first replied to twice."""
+    root = PostFactory()
+    first = PostFactory(parent=root)
+    first_reply = PostFactory(parent=first)
+    first_reply_reply = PostFactory(parent=first_reply)
+    second = PostFactory(parent=root)
+    return root, first, first_reply, first_reply_reply, second
+
+
+def test_reply_counts(thread):
+    """Replies are counted on their parent and every ancestor."""
+    root, first, first_reply, first_reply_reply, second = reload(*thread)
+    assert (root.children_count, root.descendants_count) == (2, 4)
+    assert (first.children_count, first.descendants_count) == (1, 2)
+    assert (second.children_count, second.descendants_count) == (0, 0)
+    assert first_reply_reply.depth == 3
+    assert first_reply_reply.path.startswith(first_reply.path)
+
+
+def test_thread_order(thread):
+    """Threads are depth first, limited in depth."""
+    root, first, first_reply, first_reply_reply, second = thread
+    assert list(root.thread()) == [
+        first,
+        first_reply,
+        first_reply_reply,
+        second,
+    ]
+    assert list(root.thread(max_depth=1)) == [first, second]
+    assert list(first.thread()) == [first_reply, first_reply_reply]
+
+
+def test_reply_deleted(thread):
+    """Soft deleted replies are no longer counted."""
+    root, first, first_reply, first_reply_reply, second = thread
+    first_reply_reply.delete()
+    root, first = reload(root, first)
+    assert root.descendants_count == 3
+    assert (first.children_count, first.descendants_count) == (1, 1)
+
+
+def test_reply_moved(thread):
+    """Moving a reply moves and recounts its own replies."""
+    root, first, first_reply, first_reply_reply, second = thread
+    first_reply.parent = second
+    first_reply.save()
+    root, first, second, first_reply_reply = reload(
+        root,
+        first,
+        second,
+        first_reply_reply,
+    )
+    assert root.descendants_count == 4
+    assert (first.children_count, first.descendants_count) == (0, 0)
+    assert (second.children_count, second.descendants_count) == (1, 2)
+    assert first_reply_reply.path.startswith(second.path)
+    assert first_reply_reply.depth == 3
+
+
+def test_reply_cycle(thread):
+    """Posts cannot reply to their own replies."""
+    root, first, first_reply, first_reply_reply, second = thread
+    first.parent = first_reply_reply
+    with pytest.raises(PostThreadValidationError):
+        first.save()
+
+
+def test_thread_pages(client_profile, thread):
+    """Threads are paginated after the last reply of a page."""
+    root, first, first_reply, first_reply_reply, second = thread
+    response = client_profile.get(thread_url(root, limit=3))
+    assert response.status_code == 200
+    assert [reply['depth'] for reply in response.data['results']] == [
+        1,
+        2,
+        3,
+    ]
+    assert response.data['next'] == str(first_reply_reply.pk)
+    response = client_profile.get(
+        thread_url(root, limit=3, after=response.data['next']),
+    )
+    assert len(response.data['results']) == 1
+    assert response.data['results'][0]['descendants_count'] == 0
+    assert response.data['next'] is None
+    response = client_profile.get(thread_url(first, after=second.pk))
+    assert response.status_code == 400
+
+
+def test_thread_queries(list_queries):
+    """Threads are fetched in the same queries however long."""
+    root = PostFactory()
+    reply = PostFactory(parent=root)
+    expected = list_queries(thread_url(root))
+    for _ in range(5):
+        reply = PostFactory(parent=reply)
+    assert list_queries(thread_url(root)) == expected
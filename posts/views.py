@@ -1,11 +1,26 @@
 """Posts app views."""
 
-from rest_framework import (status, viewsets, filters)
-from rest_framework.decorators import (detail_route, permission_classes, )
+from functools import partial
+
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework import (status, viewsets, filters, serializers)
+from rest_framework.decorators import (
+    detail_route,
+    list_route,
+    permission_classes,
+)
 from rest_framework import permissions
 from rest_framework.response import Response
 
 from books.permissions import AnyReadOwnerCreateEditPermission
+from bookworm.views import (
+    ConditionalGetViewSetMixin,
+    EagerLoadingViewSetMixin,
+)
 from posts.models import (
     Emote,
     Post,
@@ -14,6 +29,10 @@ from posts.serializers import (
     PostSerializer,
     EmoteSerializer,
     SmallEmoteSerializer,
+    BulkEmoteItemSerializer,
+    BulkEmoteSerializer,
+    ThreadPostSerializer,
+    ThreadQuerySerializer,
 )
 from posts.exceptions import (
     InvalidEmoteModification,
@@ -23,10 +42,100 @@ from posts.exceptions import (
 from file_store.views import ImagableViewSet
 
 
-class EmoteViewSet(viewsets.ModelViewSet):
+class EmoteViewSet(
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
+        viewsets.ModelViewSet,
+):
     queryset = Emote.objects.all()
     serializer_class = EmoteSerializer
     permission_classes = (AnyReadOwnerCreateEditPermission, )
+    bulk_viewsets = {
+        'book': 'books.views.BookViewSet',
+        'bookreview': 'books.views.BookReviewViewSet',
+        'readinglist': 'books.views.ReadingListViewSet',
+        'post': 'posts.views.PostViewSet',
+    }
+
+    def bulk_viewset(self, target):
+        """View set of a bulk target, as routing its `emoted` action.
+
+        @param target: str target of BulkEmoteItemSerializer.
+
+        @return ViewSet
+
+        @raises PermissionDenied
+        """
+        viewset = import_string(self.bulk_viewsets[target])(
+            request=self.request,
+            args=(),
+            kwargs={},
+            format_kwarg=None,
+            action='emoted',
+        )
+        viewset.check_permissions(self.request)
+        return viewset
+
+    @list_route(methods=['post'])
+    def bulk(self, request, **kwargs):
+        """Apply many Emotes across Emotable objects in one request.
+
+        Objects are loaded and permitted as by their `emoted` route. Emotes
+        are de-duplicated per object, however its id is supplied, the last
+        Emote supplied wins.
+        """
+        serializer = BulkEmoteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        targets = {}
+        supplied = {}
+        for item in serializer.validated_data['emotes']:
+            model = apps.get_model(
+                BulkEmoteItemSerializer.TARGETS[item['target']],
+            )
+            try:
+                object_id = str(model._meta.pk.to_python(item['id']))
+            except ValidationError:
+                object_id = item['id']
+            targets.setdefault(item['target'], {})[object_id] = (
+                item['emote_type']
+            )
+            supplied.setdefault(item['target'], {})[object_id] = item['id']
+        emoted = []
+        missing = []
+        with transaction.atomic():
+            for target, emote_types in targets.items():
+                viewset = self.bulk_viewset(target)
+                results = viewset.get_queryset().model.emoted_bulk(
+                    request.user.profile,
+                    emote_types,
+                    queryset=viewset.filter_queryset(viewset.get_queryset()),
+                    permission=partial(
+                        viewset.check_object_permissions,
+                        request,
+                    ),
+                )
+                for object_id in emote_types.keys():
+                    supplied_id = supplied[target][object_id]
+                    if object_id not in results:
+                        missing.append({'target': target, 'id': supplied_id})
+                        continue
+                    emote = results[object_id]
+                    emoted.append({
+                        'target': target,
+                        'id': supplied_id,
+                        'emote': emote and SmallEmoteSerializer(
+                            emote,
+                            context={'request': request},
+                        ).data,
+                    })
+        return Response(
+            {
+                'status': 'emoted',
+                'ok': '🖖',
+                'emoted': emoted,
+                'missing': missing,
+            }
+        )
 
 
 class EmotableViewSet:
@@ -105,6 +214,8 @@ class EmotableViewSet:
 class PostViewSet(
         EmotableViewSet,
         ImagableViewSet,
+        ConditionalGetViewSetMixin,
+        EagerLoadingViewSetMixin,
         viewsets.ModelViewSet,
 ):
     queryset = Post.objects.all()
@@ -112,3 +223,53 @@ class PostViewSet(
     filter_backends = (filters.SearchFilter,)
     search_fields = ('copy', 'parent__id', )
     permission_classes = (AnyReadOwnerCreateEditPermission, )
+
+    @detail_route(methods=['get'])
+    def thread(self, request, pk, **kwargs):
+        """Replies of this Post in thread order, a page at a time.
+
+        `depth`: levels of replies beneath this Post, all by default.
+        `after`: id of the last reply of the previous page.
+        `limit`: replies per page, at most `settings.POST_THREAD_PAGE_SIZE`.
+        """
+        threaded = self.get_object()
+        query = ThreadQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        after = None
+        if query.validated_data.get('after'):
+            try:
+                after = Post.all_objects.filter(
+                    pk=Post._meta.pk.to_python(query.validated_data['after']),
+                    path__startswith=threaded.path,
+                ).values_list('path', flat=True).first()
+            except ValidationError:
+                pass
+            if not after:
+                raise serializers.ValidationError({
+                    'after': 'Reply not found in this thread.',
+                })
+        limit = query.validated_data.get(
+            'limit',
+            settings.POST_THREAD_PAGE_SIZE,
+        )
+        replies = list(threaded.thread(
+            max_depth=query.validated_data.get('depth'),
+            after=after,
+        )[:limit + 1])
+        context = self.get_serializer_context()
+        context['thread_depth'] = threaded.depth
+        return Response(
+            {
+                'status': 'ok',
+                'ok': '🖖',
+                'results': ThreadPostSerializer(
+                    replies[:limit],
+                    many=True,
+                    context=context,
+                ).data,
+                'next': (
+                    str(replies[limit - 1].pk) if len(replies) > limit
+                    else None
+                ),
+            }
+        )